@@ -60,10 +60,12 @@ class ArxivAPI:
                     logger.error("Failed to fetch papers after multiple attempts")
                     return None
 
-        return response.text if response.status_code == 200 else None
+        # Raw bytes: ElementTree decodes per the XML declaration, so going
+        # through response.text would only add a decode (and charset sniffing).
+        return response.content if response.status_code == 200 else None
 
     def parse_response(self, response_text):
-        """Parse XML response from ArXiv API"""
+        """Parse XML response (bytes or str) from ArXiv API"""
         if not response_text:
             logger.warning("Received empty response text from API.")
             return 0, 0, []
@@ -116,6 +118,30 @@ class ArxivAPI:
             path = parsed.path
             return path.split("/")[-1]
 
+    def entry_to_title_authors(self, entry):
+        """Extract only arxiv_id, title and authors from an ArXiv API entry.
+
+        Lightweight variant of `entry_to_paper` for ranking search results;
+        entries that `entry_to_paper` would skip yield None here too.
+        """
+        id_elem = entry.find("atom:id", self.ns)
+        title_elem = entry.find("atom:title", self.ns)
+        if (
+            id_elem is None
+            or title_elem is None
+            or entry.find("atom:summary", self.ns) is None
+        ):
+            return None
+
+        return {
+            "arxiv_id": self.extract_arxiv_id(id_elem.text),
+            "title": (title_elem.text or "").replace("\n", " ").strip(),
+            "authors": [
+                name.text.strip()
+                for name in entry.findall("atom:author/atom:name", self.ns)
+            ],
+        }
+
     def entry_to_paper(self, entry):
         """Convert an ArXiv API entry to a paper dictionary"""
         id_elem = entry.find("atom:id", self.ns)
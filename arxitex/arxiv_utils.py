@@ -33,6 +33,12 @@ def try_parse_arxiv_id(value: str) -> Optional[str]:
         return None
 
 
+def is_arxiv_id(value: str) -> bool:
+    """True if `value` is a bare arXiv id (optionally versioned), not a URL."""
+
+    return ARXIV_ID_RE.fullmatch((value or "").strip()) is not None
+
+
 def is_arxiv_url(url: str) -> bool:
     u = (url or "").lower()
     return (
@@ -30,3 +30,20 @@ def connect(db_path: str | Path, *, timeout_s: float = 30) -> sqlite3.Connection
     conn.execute("PRAGMA synchronous = NORMAL;")
 
     return conn
+
+
+def tune_for_bulk(
+    conn: sqlite3.Connection, *, cache_size_kib: int = 65536, mmap_size_mib: int = 0
+) -> None:
+    """Apply PRAGMAs suited to long-lived connections doing many small queries.
+
+    - temp_store=MEMORY keeps sort/temp b-trees off disk.
+    - A negative cache_size is in KiB (default 64 MiB page cache).
+    - mmap_size_mib > 0 memory-maps up to that much of the DB file, so large
+      scans read pages without a read() copy each.
+    """
+
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute(f"PRAGMA cache_size = {-abs(int(cache_size_kib))};")
+    if mmap_size_mib > 0:
+        conn.execute(f"PRAGMA mmap_size = {int(mmap_size_mib) * 1024 * 1024};")
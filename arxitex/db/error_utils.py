@@ -1,35 +1,46 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
-
-from arxitex.downloaders.async_downloader import (
-    ArxivExtractorError as DownloaderArxivExtractorError,
-)
 from arxitex.extractor.models import ArxivExtractorError as ModelArxivExtractorError
 
-# Best-effort import of OpenAI SDK exceptions (available in openai >=1.x).
-# If the SDK is not installed or changes, we simply won't classify those
-# errors specially and will fall back to a generic bucket.
-try:  # pragma: no cover - defensive import
-    from openai import (  # type: ignore
-        APIConnectionError,
-        APIError,
-        APITimeoutError,
-        RateLimitError,
-    )
 
-    OPENAI_EXC: tuple[type[BaseException], ...] = (
-        APIConnectionError,
-        APIError,
-        RateLimitError,
-        APITimeoutError,
-    )
-except Exception:  # pragma: no cover
-    OPENAI_EXC = tuple()
+def _openai_exceptions() -> tuple[type[BaseException], ...]:
+    """Return the OpenAI SDK exception types worth classifying, if available.
+
+    An OpenAI exception can only exist once the SDK has been imported, so we
+    only look it up from ``sys.modules`` instead of importing it here; the SDK
+    is by far the heaviest import on the CLI's startup path. If the SDK is not
+    loaded or its exceptions move, we fall back to the generic bucket.
+    """
+    if "openai" not in sys.modules:
+        return ()
+    try:  # pragma: no cover - defensive import
+        from openai import (  # type: ignore
+            APIConnectionError,
+            APIError,
+            APITimeoutError,
+            RateLimitError,
+        )
+    except Exception:  # pragma: no cover
+        return ()
+    return (APIConnectionError, APIError, RateLimitError, APITimeoutError)
+
+
+def _extractor_exceptions() -> tuple[type[BaseException], ...]:
+    """Return the extractor/downloader error types.
+
+    The downloader's error class (like httpx below) is only looked up if its
+    module is already loaded, for the same reason as ``_openai_exceptions``:
+    importing it here would pull httpx and aiofiles into every CLI command.
+    """
+    downloader = sys.modules.get("arxitex.downloaders.async_downloader")
+    if downloader is None:
+        return (ModelArxivExtractorError,)
+    return (ModelArxivExtractorError, downloader.ArxivExtractorError)
 
 
 @dataclass
@@ -69,7 +80,7 @@ def classify_processing_error(exc: Exception) -> ErrorInfo:
     lower_msg = msg.lower()
 
     # --- Extractor / downloader errors ---
-    if isinstance(exc, (ModelArxivExtractorError, DownloaderArxivExtractorError)):
+    if isinstance(exc, _extractor_exceptions()):
         # PDF-only: no LaTeX source available.
         if "pdf-only" in lower_msg or "pdf only" in lower_msg:
             return ErrorInfo(
@@ -171,7 +182,8 @@ def classify_processing_error(exc: Exception) -> ErrorInfo:
         )
 
     # --- LLM / API related errors ---
-    if OPENAI_EXC and isinstance(exc, OPENAI_EXC):
+    openai_exc = _openai_exceptions()
+    if openai_exc and isinstance(exc, openai_exc):
         if "rate limit" in lower_msg:
             return ErrorInfo(
                 code="llm_rate_limited",
@@ -194,7 +206,11 @@ def classify_processing_error(exc: Exception) -> ErrorInfo:
         )
 
     # httpx / timeout-based errors (Together or generic HTTP failures).
-    if isinstance(exc, (httpx.TimeoutException, asyncio.TimeoutError, TimeoutError)):
+    httpx = sys.modules.get("httpx")
+    timeout_exc = (asyncio.TimeoutError, TimeoutError)
+    if httpx is not None:
+        timeout_exc += (httpx.TimeoutException,)
+    if isinstance(exc, timeout_exc):
         return ErrorInfo(
             code="llm_timeout",
             message="LLM or HTTP call timed out while waiting for a response.",
@@ -202,7 +218,7 @@ def classify_processing_error(exc: Exception) -> ErrorInfo:
             exception_type=etype,
         )
 
-    if isinstance(exc, httpx.HTTPError):
+    if httpx is not None and isinstance(exc, httpx.HTTPError):
         return ErrorInfo(
             code="llm_connection_error",
             message="HTTP error while calling LLM or external service: " + msg,
@@ -1,6 +1,7 @@
 import asyncio
 import os
 import re
+import weakref
 from pathlib import Path
 from typing import Optional
 
@@ -22,8 +23,25 @@ DEFAULT_CONFIG = {
     "max_retries": 3,
     "base_wait_time": 2,
     "chunk_size": 8192,
+    # Cap on concurrent source downloads per event loop, independent of how many
+    # papers a workflow processes at once; arXiv throttles bursts of requests.
+    "max_concurrent_downloads": 4,
 }
 
+# Download semaphores per event loop (asyncio primitives are loop-bound), one
+# per configured limit: downloaders with the same limit share one cap.
+_download_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _download_slot(limit: int) -> asyncio.Semaphore:
+    """Return the running loop's shared download semaphore for `limit`."""
+    limit = max(1, limit)
+    slots = _download_slots.setdefault(asyncio.get_running_loop(), {})
+    slot = slots.get(limit)
+    if slot is None:
+        slot = slots[limit] = asyncio.Semaphore(limit)
+    return slot
+
 
 class ArxivExtractorError(Exception):
     pass
@@ -125,13 +143,14 @@ class AsyncSourceDownloader:
                 logger.info(
                     f"Downloading source for {arxiv_id} (Attempt {attempt + 1}/{self.config['max_retries']})..."
                 )
-                async with self.http_client.stream("GET", url) as response:
-                    response.raise_for_status()
-                    async with aiofiles.open(download_path, "wb") as f:
-                        async for chunk in response.aiter_bytes(
-                            chunk_size=self.config["chunk_size"]
-                        ):
-                            await f.write(chunk)
+                async with _download_slot(self.config["max_concurrent_downloads"]):
+                    async with self.http_client.stream("GET", url) as response:
+                        response.raise_for_status()
+                        async with aiofiles.open(download_path, "wb") as f:
+                            async for chunk in response.aiter_bytes(
+                                chunk_size=self.config["chunk_size"]
+                            ):
+                                await f.write(chunk)
 
                 # After download, detect HTML reCAPTCHA responses that arXiv
                 # sometimes serves instead of the real source archive.
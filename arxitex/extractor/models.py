@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class ArxivExtractorError(Exception):
@@ -316,13 +316,20 @@ class DocumentGraph:
         Serializes the entire graph, including nodes and edges, into a
         JSON-serializable dictionary for output.
         """
-        serialized_nodes = [node.to_dict() for node in self.nodes]
-        serialized_edges = [edge.to_dict() for edge in self.edges]
-
         return {
-            "arxiv_id": arxiv_id,
-            "extractor_mode": extractor_mode or "unspecified",
-            "stats": {"node_count": len(self.nodes), "edge_count": len(self.edges)},
-            "nodes": serialized_nodes,
-            "edges": serialized_edges,
+            key: list(value) if key in ("nodes", "edges") else value
+            for key, value in self.iter_dict_parts(arxiv_id, extractor_mode)
         }
+
+    def iter_dict_parts(
+        self, arxiv_id: str, extractor_mode: str | None = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the `to_dict` items in order, with "nodes" and "edges" as lazy
+        iterators of serialized nodes/edges so large graphs can be streamed.
+        """
+        yield "arxiv_id", arxiv_id
+        yield "extractor_mode", extractor_mode or "unspecified"
+        yield "stats", {"node_count": len(self.nodes), "edge_count": len(self.edges)}
+        yield "nodes", (node.to_dict() for node in self.nodes)
+        yield "edges", (edge.to_dict() for edge in self.edges)
@@ -1,6 +1,7 @@
 import abc
 import json
 import sqlite3
+import threading
 from typing import Dict
 
 
@@ -14,6 +15,7 @@ class BaseSQLiteIndex(abc.ABC):
         Initializes the index, pointing to a shared SQLite database file.
         """
         self.db_path = db_path
+        self._local = threading.local()
 
         self._create_table()
 
@@ -25,6 +27,22 @@ class BaseSQLiteIndex(abc.ABC):
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """Returns this thread's cached connection for point lookups.
+
+        Hot membership checks reuse it instead of opening the db on every call,
+        which also lets sqlite3's per-connection statement cache keep their
+        prepared statements. It is per thread because workflows call the
+        indices from asyncio.to_thread workers.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._get_connection()
+            # Autocommit: a lookup must not leave a read transaction open.
+            conn.isolation_level = None
+            self._local.conn = conn
+        return conn
+
     @abc.abstractmethod
     def _create_table(self):
         """
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+import sqlite3
+from typing import Any, Dict, List, Optional
 
 from arxitex.indices.base_sqlite import BaseSQLiteIndex
 
@@ -18,8 +19,19 @@ class DiscoveryIndex(BaseSQLiteIndex):
             )
             conn.commit()
 
-    def add_papers(self, new_papers: List[Dict[str, Any]]) -> int:
-        """Adds new, unique papers to the index. Returns the count of newly added papers."""
+    def add_papers(
+        self,
+        new_papers: List[Dict[str, Any]],
+        conn: Optional[sqlite3.Connection] = None,
+        replace: bool = False,
+    ) -> int:
+        """Adds new, unique papers to the index. Returns the count of newly added papers.
+
+        If ``conn`` is given, the insert runs on it and is left uncommitted so it
+        can join a caller-managed transaction. With ``replace``, metadata of
+        papers already in the index is overwritten instead of kept (they still
+        do not count as newly added).
+        """
         if not new_papers:
             return 0
 
@@ -27,18 +39,51 @@ class DiscoveryIndex(BaseSQLiteIndex):
             (p["arxiv_id"], self._serialize(p)) for p in new_papers if p.get("arxiv_id")
         ]
 
+        if conn is not None:
+            return self._insert_papers(conn, papers_to_insert, replace)
+
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            # INSERT OR IGNORE will silently skip any papers whose arxiv_id already exists.
-            cursor.executemany(
-                "INSERT OR IGNORE INTO discovered_papers (arxiv_id, metadata) VALUES (?, ?)",
-                papers_to_insert,
-            )
-            newly_added_count = cursor.rowcount
+            newly_added_count = self._insert_papers(conn, papers_to_insert, replace)
             conn.commit()
 
         return newly_added_count
 
+    def add_new_papers(self, new_papers: List[Dict[str, Any]]) -> List[str]:
+        """Adds papers in one transaction and returns the arxiv_ids that were new."""
+        added = []
+        with self._get_connection() as conn:
+            for p in new_papers:
+                if not p.get("arxiv_id"):
+                    continue
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO discovered_papers (arxiv_id, metadata) VALUES (?, ?)",
+                    (p["arxiv_id"], self._serialize(p)),
+                )
+                if cursor.rowcount:
+                    added.append(p["arxiv_id"])
+            conn.commit()
+        return added
+
+    @staticmethod
+    def _insert_papers(
+        conn: sqlite3.Connection, papers_to_insert: list, replace: bool = False
+    ) -> int:
+        cursor = conn.cursor()
+        # INSERT OR IGNORE will silently skip any papers whose arxiv_id already exists.
+        cursor.executemany(
+            "INSERT OR IGNORE INTO discovered_papers (arxiv_id, metadata) VALUES (?, ?)",
+            papers_to_insert,
+        )
+        newly_added_count = cursor.rowcount
+        if replace:
+            # Refresh metadata of papers that were already queued; they are not
+            # counted as newly added.
+            cursor.executemany(
+                "UPDATE discovered_papers SET metadata = ? WHERE arxiv_id = ?",
+                [(metadata, arxiv_id) for arxiv_id, metadata in papers_to_insert],
+            )
+        return newly_added_count
+
     def get_pending_papers(self) -> List[Dict[str, Any]]:
         """Returns a list of all paper metadata dicts that are pending processing."""
         with self._get_connection() as conn:
@@ -54,3 +99,10 @@ class DiscoveryIndex(BaseSQLiteIndex):
                 "DELETE FROM discovered_papers WHERE arxiv_id = ?", (arxiv_id,)
             )
             conn.commit()
+
+    def __contains__(self, arxiv_id: str) -> bool:
+        """Checks if a paper is pending in the discovery index."""
+        cursor = self._get_read_connection().execute(
+            "SELECT 1 FROM discovered_papers WHERE arxiv_id = ?", (arxiv_id,)
+        )
+        return cursor.fetchone() is not None
@@ -22,6 +22,11 @@ class ProcessedIndex(BaseSQLiteIndex):
         """
         with self._get_connection() as conn:
             conn.execute(create_table_sql)
+            # Range scans by processing time (e.g. rollback_processed_after).
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_processed_papers_timestamp "
+                "ON processed_papers(processed_timestamp_utc)"
+            )
             conn.commit()
 
     def update_processed_papers_status(self, arxiv_id: str, **kwargs):
@@ -44,12 +49,11 @@ class ProcessedIndex(BaseSQLiteIndex):
 
     def is_successfully_processed(self, arxiv_id: str) -> bool:
         """Checks the status of a paper with a fast, indexed lookup."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT status FROM processed_papers WHERE arxiv_id = ?", (arxiv_id,)
-            )
-            result = cursor.fetchone()
-            return result["status"].startswith("success") if result else False
+        cursor = self._get_read_connection().execute(
+            "SELECT status FROM processed_papers WHERE arxiv_id = ?", (arxiv_id,)
+        )
+        result = cursor.fetchone()
+        return result["status"].startswith("success") if result else False
 
     def get_paper_status(self, arxiv_id: str) -> Optional[Dict]:
         """Retrieves all data for a processed paper."""
@@ -32,8 +32,7 @@ class SkippedIndex(BaseSQLiteIndex):
 
     def __contains__(self, arxiv_id: str) -> bool:
         """Checks if a paper is in the skipped index."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM skipped_papers WHERE arxiv_id = ?", (arxiv_id,)
-            )
-            return cursor.fetchone() is not None
+        cursor = self._get_read_connection().execute(
+            "SELECT 1 FROM skipped_papers WHERE arxiv_id = ?", (arxiv_id,)
+        )
+        return cursor.fetchone() is not None
@@ -25,6 +25,7 @@ from arxitex.tools.matching.arxiv_matcher import (
     extract_title_and_authors,
     generate_title_candidates,
     match_external_reference_to_arxiv,
+    try_extract_arxiv_ids,
 )
 
 
@@ -180,7 +181,10 @@ async def backfill_external_reference_arxiv_matches(
     # Global throttling to avoid hammering the arXiv API.
     throttle = make_throttle(qps)
 
-    for r in refs:
+    # Explicit arXiv ids resolve without an API call; find them in one pass.
+    direct_ids = try_extract_arxiv_ids([str(r.get("content_tex") or "") for r in refs])
+
+    for r, direct_id in zip(refs, direct_ids):
         paper_id = str(r["paper_id"])
         external_artifact_id = str(r["artifact_id"])
         full_reference = str(r.get("content_tex") or "")
@@ -227,7 +231,8 @@ async def backfill_external_reference_arxiv_matches(
         try:
             # Throttle only around actual API calls. The matcher has a direct
             # regex fast-path and a DB cache fast-path.
-            await throttle()
+            if not direct_id:
+                await throttle()
             res = match_external_reference_to_arxiv(
                 api=api,
                 full_reference=full_reference,
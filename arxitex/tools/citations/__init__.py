@@ -4,12 +4,16 @@ from arxitex.tools.backfill.arxiv_backfill import (
     backfill_external_reference_arxiv_matches,
 )
 from arxitex.tools.backfill.backfill import run_backfill as run_citations_backfill
-from arxitex.tools.matching.arxiv_matcher import match_external_reference_to_arxiv
+from arxitex.tools.matching.arxiv_matcher import (
+    match_external_reference_to_arxiv,
+    match_external_references_bulk,
+)
 from arxitex.tools.openalex import backfill_citations_openalex
 
 __all__ = [
     "backfill_citations_openalex",
     "backfill_external_reference_arxiv_matches",
     "match_external_reference_to_arxiv",
+    "match_external_references_bulk",
     "run_citations_backfill",
 ]
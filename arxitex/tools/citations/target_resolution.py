@@ -53,7 +53,7 @@ class OpenAlexTargetResolver:
         params = {"id_list": parse_arxiv_id(arxiv_id)}
         resp = api.session.get(api.base_url, params=params, timeout=30)
         resp.raise_for_status()
-        count, _total, entries = api.parse_response(resp.text)
+        count, _total, entries = api.parse_response(resp.content)
         if count <= 0 or not entries:
             raise RuntimeError(f"No arXiv entry found for {arxiv_id}")
         paper = api.entry_to_paper(entries[0])
@@ -15,22 +15,45 @@ Stdout contains a single JSON object with the following shape:
 
 All logging and progress messages are emitted on stderr so they can be
 forwarded to the client as status updates without corrupting the JSON
-payload.
+payload. While extraction runs, a ``{"status": "working", "elapsed_s": ...}``
+line is also written to stderr every couple of seconds as a liveness signal.
+
+With ``--ndjson`` stdout is JSON Lines instead: one ``{"type": ...,
+"data": ...}`` record per line for the graph header, each node and edge, the
+definition bank, each artifact's terms and the LaTeX macros, followed by
+``{"type": "done"}``, so the client can parse incrementally.
+
+With ``--server`` the process stays alive and answers requests on stdin,
+so the caller pays interpreter start-up and imports once. Each request and
+reply is a 4-byte big-endian length followed by that many bytes of UTF-8
+JSON. A request is ``{"argv": ["2211.11689", "--infer-deps", ...]}`` (the
+same arguments as a one-shot run); the reply is ``{"ok": true, "result":
+<payload>}`` or ``{"ok": false, "error": "..."}``. ``-h``, ``-v`` and
+``--ndjson`` are rejected in requests (``-v`` applies to the whole server and
+replies are always one JSON object). Closing stdin stops the server.
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import io
 import json
 import os
+import struct
 import sys
-from typing import Any, Dict
+import time
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Tuple
 
 from loguru import logger
 
-from arxitex.extractor.models import ArxivExtractorError
-from arxitex.extractor.pipeline import agenerate_artifact_graph
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+from arxitex.extractor.models import ArxivExtractorError, DocumentGraph
+from arxitex.workflows.utils import run_async
 
 
 def _configure_logging(verbose: bool = False) -> None:
@@ -42,11 +65,162 @@ def _configure_logging(verbose: bool = False) -> None:
 
     logger.remove()
     level = "DEBUG" if verbose else "INFO"
-    logger.add(sys.stderr, level=level)
+    # enqueue=True hands writes to a background thread, so a slow stderr
+    # consumer cannot stall the pipeline's event loop. Drained by `main`.
+    logger.add(sys.stderr, level=level, enqueue=True, backtrace=False, diagnose=False)
+
+
+# Seconds between stderr liveness lines while the pipeline runs.
+_HEARTBEAT_INTERVAL_S = 2.0
+
+# Flush stdout after this many streamed array/object elements.
+_FLUSH_EVERY = 256
+
+
+def _dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON; orjson when installed, else the stdlib encoder."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles these.
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Encoded `"key":` prefixes for the fixed payload/graph keys, built once.
+_KEY_PREFIXES = {
+    key: json.dumps(key).encode("utf-8") + b":"
+    for key in (
+        "graph",
+        "definition_bank",
+        "artifact_to_terms_map",
+        "latex_macros",
+        "arxiv_id",
+        "extractor_mode",
+        "stats",
+        "nodes",
+        "edges",
+    )
+}
+
+
+def _key_prefix(key: str) -> bytes:
+    prefix = _KEY_PREFIXES.get(key)
+    return prefix if prefix is not None else _dumps(key) + b":"
+
+
+def _write_array(out: BinaryIO, values: Iterable[Any]) -> None:
+    out.write(b"[")
+    for i, value in enumerate(values):
+        if i:
+            out.write(b",")
+            if i % _FLUSH_EVERY == 0:
+                out.flush()
+        out.write(_dumps(value))
+    out.write(b"]")
+
+
+def _write_object(out: BinaryIO, items: Iterable[Tuple[str, Any]]) -> None:
+    out.write(b"{")
+    for i, (key, value) in enumerate(items):
+        if i:
+            out.write(b",")
+            if i % _FLUSH_EVERY == 0:
+                out.flush()
+        out.write(_key_prefix(key))
+        if key in ("nodes", "edges") and not isinstance(value, list):
+            _write_array(out, value)
+        else:
+            out.write(_dumps(value))
+    out.write(b"}")
+
+
+def _write_payload(out: BinaryIO, payload: Dict[str, Any]) -> None:
+    """Write `payload` as JSON, streaming the graph element by element.
+
+    `payload["graph"]` holds `DocumentGraph.iter_dict_parts(...)` items, so
+    nodes and edges are serialized one at a time instead of materializing the
+    whole graph dict and its JSON string. Output is compact JSON.
+    """
+
+    out.write(b"{")
+    for i, (key, value) in enumerate(payload.items()):
+        if i:
+            out.write(b",")
+        out.write(_key_prefix(key))
+        if key == "graph":
+            _write_object(out, value)
+        elif key == "artifact_to_terms_map" and value:
+            _write_object(out, value.items())
+        else:
+            out.write(_dumps(value))
+    out.write(b"}")
+
+
+def _iter_ndjson_records(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Flatten `payload` into `{"type": ..., "data": ...}` records.
+
+    Order: one "graph" header (arxiv_id, extractor_mode, stats), then one
+    record per "node" and "edge", "definition_bank", one "artifact_terms"
+    record per artifact, "latex_macros", and a final "done".
+    """
+
+    header = dict(payload["graph"])  # nodes/edges stay lazy iterators
+    nodes, edges = header.pop("nodes"), header.pop("edges")
+    yield {"type": "graph", "data": header}
+    for node in nodes:
+        yield {"type": "node", "data": node}
+    for edge in edges:
+        yield {"type": "edge", "data": edge}
+    yield {"type": "definition_bank", "data": payload.get("definition_bank")}
+    for artifact_id, terms in (payload.get("artifact_to_terms_map") or {}).items():
+        yield {
+            "type": "artifact_terms",
+            "data": {"artifact_id": artifact_id, "terms": terms},
+        }
+    yield {"type": "latex_macros", "data": payload.get("latex_macros") or {}}
+    yield {"type": "done"}
+
+
+def _write_ndjson(out: BinaryIO, payload: Dict[str, Any]) -> None:
+    """Write `payload` as JSON Lines, one record per line (see above)."""
+
+    for i, record in enumerate(_iter_ndjson_records(payload), start=1):
+        out.write(_dumps(record) + b"\n")
+        if i % _FLUSH_EVERY == 0:
+            out.flush()
+
+
+async def _heartbeat() -> None:
+    """Write a one-line JSON liveness status to stderr every few seconds.
+
+    Uses a single os.write per line (well under PIPE_BUF, so atomic on pipes)
+    so it never interleaves with loguru's enqueued stderr writes.
+    """
+
+    start = time.monotonic()
+    while True:
+        await asyncio.sleep(_HEARTBEAT_INTERVAL_S)
+        elapsed = round(time.monotonic() - start, 1)
+        line = json.dumps({"status": "working", "elapsed_s": elapsed}) + "\n"
+        try:
+            os.write(2, line.encode("utf-8"))
+        except OSError:  # pragma: no cover - stderr closed
+            return
 
 
 async def _run_pipeline(args: argparse.Namespace) -> Dict[str, Any]:
-    """Run the async graph extraction pipeline and shape the JSON payload."""
+    """Run the async graph extraction pipeline and shape the JSON payload.
+
+    The "graph" entry is left as lazy `DocumentGraph.iter_dict_parts` items;
+    see `_write_payload`.
+    """
+
+    # Imported here: the pipeline pulls in the LLM client stack, which --help
+    # and argument/API-key errors should not have to pay for.
+    from arxitex.extractor.pipeline import agenerate_artifact_graph
 
     # Derive final flags (support --all-enhancements like pipeline.py)
     infer_deps = bool(args.infer_deps)
@@ -69,14 +243,18 @@ async def _run_pipeline(args: argparse.Namespace) -> Dict[str, Any]:
         "global_proof_char_budget": args.dependency_global_proof_char_budget,
     }
 
-    results = await agenerate_artifact_graph(
-        arxiv_id=args.arxiv_id,
-        infer_dependencies=infer_deps,
-        enrich_content=enrich_content,
-        dependency_mode=args.dependency_mode,
-        dependency_config=dependency_config,
-        source_dir=None,
-    )
+    heartbeat = asyncio.create_task(_heartbeat())
+    try:
+        results = await agenerate_artifact_graph(
+            arxiv_id=args.arxiv_id,
+            infer_dependencies=infer_deps,
+            enrich_content=enrich_content,
+            dependency_mode=args.dependency_mode,
+            dependency_config=dependency_config,
+            source_dir=None,
+        )
+    finally:
+        heartbeat.cancel()
 
     graph = results.get("graph")
     bank = results.get("bank")
@@ -85,6 +263,8 @@ async def _run_pipeline(args: argparse.Namespace) -> Dict[str, Any]:
 
     if not graph or not graph.nodes:
         logger.warning("No artifacts were extracted; returning empty graph.")
+        if graph is None:
+            graph = DocumentGraph()
 
     # Mirror the extractor_mode computation from extractor/pipeline.py
     if infer_deps and enrich_content:
@@ -96,7 +276,9 @@ async def _run_pipeline(args: argparse.Namespace) -> Dict[str, Any]:
     else:
         extractor_mode = "regex-only"
 
-    graph_dict = graph.to_dict(arxiv_id=args.arxiv_id, extractor_mode=extractor_mode)
+    graph_parts = graph.iter_dict_parts(
+        arxiv_id=args.arxiv_id, extractor_mode=extractor_mode
+    )
 
     bank_dict = None
     if bank is not None:
@@ -106,7 +288,7 @@ async def _run_pipeline(args: argparse.Namespace) -> Dict[str, Any]:
             logger.error(f"Failed to serialize definition bank: {e}", exc_info=True)
 
     payload: Dict[str, Any] = {
-        "graph": graph_dict,
+        "graph": graph_parts,
         "definition_bank": bank_dict,
         "artifact_to_terms_map": artifact_to_terms_map,
         "latex_macros": latex_macros,
@@ -115,8 +297,135 @@ async def _run_pipeline(args: argparse.Namespace) -> Dict[str, Any]:
     return payload
 
 
-def main(argv: list[str] | None = None) -> None:
-    parser = argparse.ArgumentParser(
+_MISSING_KEY_MESSAGE = (
+    "Enhancements requested but no LLM API key detected in the environment. "
+    "Set OPENAI_API_KEY or ANTHROPIC_API_KEY."
+)
+
+
+def _missing_llm_key(args: argparse.Namespace) -> bool:
+    # If enhancements are requested, ensure an LLM key is configured, similar
+    # to extractor/pipeline.py. We don't enforce which backend; that logic
+    # lives in arxitex.llms.
+    return bool(
+        args.infer_deps or args.enrich_content or args.all_enhancements
+    ) and not (os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY"))
+
+
+def _read_frame(stream: BinaryIO) -> bytes | None:
+    """Read one length-prefixed frame; None on a clean EOF."""
+
+    header = stream.read(4)
+    if not header:
+        return None
+    if len(header) < 4:
+        raise EOFError("truncated frame header")
+    (size,) = struct.unpack(">I", header)
+    body = stream.read(size)
+    if len(body) < size:
+        raise EOFError("truncated frame body")
+    return body
+
+
+def _write_frame(stream: BinaryIO, body: bytes) -> None:
+    stream.write(struct.pack(">I", len(body)))
+    stream.write(body)
+    stream.flush()
+
+
+class _RequestError(Exception):
+    """Invalid arguments in a server request."""
+
+
+class _RequestArgumentParser(argparse.ArgumentParser):
+    """Argument parser for server requests.
+
+    Never writes usage or help to stdout (which carries the framed replies) and
+    never exits the process; problems are raised as ``_RequestError`` so they
+    can be returned in the ``{"ok": false}`` reply.
+    """
+
+    def print_help(self, file=None):
+        raise _RequestError("--help is not supported in server requests")
+
+    def print_usage(self, file=None):
+        pass
+
+    def error(self, message):
+        raise _RequestError(message)
+
+    def exit(self, status=0, message=None):
+        raise _RequestError(message or f"argument parsing exited with {status}")
+
+
+async def _handle_request(parser: argparse.ArgumentParser, body: bytes) -> bytes:
+    """Run one server request and return the encoded reply."""
+
+    try:
+        request = json.loads(body)
+        argv = [str(a) for a in request.get("argv", [])]
+    except (ValueError, AttributeError) as e:
+        return _dumps({"ok": False, "error": f"Malformed request: {e}"})
+
+    try:
+        args = parser.parse_args(argv)
+    except _RequestError as e:
+        return _dumps({"ok": False, "error": f"Invalid arguments {argv}: {e}"})
+    if not args.arxiv_id or args.server:
+        return _dumps({"ok": False, "error": "Request must name exactly one arxiv_id."})
+    if args.verbose:
+        return _dumps(
+            {
+                "ok": False,
+                "error": "--verbose applies to the whole server; pass it with --server.",
+            }
+        )
+    if args.ndjson:
+        return _dumps(
+            {
+                "ok": False,
+                "error": "--ndjson is not supported in server requests; "
+                "replies are always one JSON object.",
+            }
+        )
+    if _missing_llm_key(args):
+        return _dumps({"ok": False, "error": _MISSING_KEY_MESSAGE})
+
+    try:
+        payload = await _run_pipeline(args)
+    except (ArxivExtractorError, FileNotFoundError, ValueError) as e:
+        logger.error(f"A processing error occurred: {e}")
+        return _dumps({"ok": False, "error": str(e)})
+    except Exception as e:  # pragma: no cover - defensive
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return _dumps({"ok": False, "error": str(e)})
+
+    out = io.BytesIO()
+    out.write(b'{"ok":true,"result":')
+    _write_payload(out, payload)
+    out.write(b"}")
+    return out.getvalue()
+
+
+async def _serve(stdin: BinaryIO, stdout: BinaryIO) -> None:
+    """Answer length-prefixed JSON requests until stdin is closed.
+
+    Keeps the interpreter, imports and event loop warm across papers.
+    """
+
+    parser = _build_parser(_RequestArgumentParser)
+    logger.info("graph_json_cli server ready")
+    while True:
+        body = await asyncio.to_thread(_read_frame, stdin)
+        if body is None:
+            return
+        _write_frame(stdout, await _handle_request(parser, body))
+
+
+def _build_parser(
+    parser_class: type[argparse.ArgumentParser] = argparse.ArgumentParser,
+) -> argparse.ArgumentParser:
+    parser = parser_class(
         description=(
             "Run the arxitex extraction pipeline for a single arXiv ID and "
             "emit a JSON graph on stdout."
@@ -124,6 +433,7 @@ def main(argv: list[str] | None = None) -> None:
     )
     parser.add_argument(
         "arxiv_id",
+        nargs="?",
         help="arXiv identifier (e.g. '2103.14030', 'math.AG/0601001')",
     )
     parser.add_argument(
@@ -179,6 +489,22 @@ def main(argv: list[str] | None = None) -> None:
         action="store_true",
         help="Convenience flag to enable both --infer-deps and --enrich-content.",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help=(
+            "Emit JSON Lines records (graph header, nodes, edges, bank, terms, "
+            "macros, done) instead of a single JSON object."
+        ),
+    )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help=(
+            "Serve length-prefixed JSON requests on stdin instead of running once "
+            "(see module docstring)."
+        ),
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -186,33 +512,46 @@ def main(argv: list[str] | None = None) -> None:
         help="Enable verbose logging (DEBUG level).",
     )
 
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     _configure_logging(verbose=args.verbose)
 
-    # If enhancements are requested, ensure an LLM key is configured, similar
-    # to extractor/pipeline.py. We don't enforce which backend; that logic
-    # lives in arxitex.llms.
-    if (args.infer_deps or args.enrich_content or args.all_enhancements) and not (
-        os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
-    ):
-        logger.error(
-            "Enhancements requested but no LLM API key detected in the environment. "
-            "Set OPENAI_API_KEY or ANTHROPIC_API_KEY."
-        )
+    if args.server:
+        try:
+            run_async(_serve(sys.stdin.buffer, sys.stdout.buffer))
+        finally:
+            logger.complete()
+        return
+    if not args.arxiv_id:
+        parser.error("arxiv_id is required unless --server is given")
+
+    if _missing_llm_key(args):
+        logger.error(_MISSING_KEY_MESSAGE)
         sys.exit(2)
 
     try:
-        payload = asyncio.run(_run_pipeline(args))
-        json.dump(payload, sys.stdout, ensure_ascii=False)
-        sys.stdout.write("\n")
+        payload = run_async(_run_pipeline(args))
         sys.stdout.flush()
+        if args.ndjson:
+            _write_ndjson(sys.stdout.buffer, payload)
+        else:
+            _write_payload(sys.stdout.buffer, payload)
+            sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
     except (ArxivExtractorError, FileNotFoundError, ValueError) as e:
         logger.error(f"A processing error occurred: {e}")
         sys.exit(1)
     except Exception as e:  # pragma: no cover - defensive
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Flush queued log messages before the process exits.
+        logger.complete()
 
 
 if __name__ == "__main__":  # pragma: no cover
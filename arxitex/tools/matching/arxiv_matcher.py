@@ -5,7 +5,8 @@ from __future__ import annotations
 import hashlib
 import json
 import re
-import unicodedata
+import sqlite3
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -14,15 +15,28 @@ from loguru import logger
 
 from arxitex.arxiv_api import ArxivAPI
 from arxitex.arxiv_utils import normalize_arxiv_id
-from arxitex.db.connection import connect
+from arxitex.db.connection import connect, tune_for_bulk
 from arxitex.db.schema import ensure_schema
 from arxitex.tools.matching.scoring import (
-    author_overlap,
+    author_last_name,
+    author_last_names,
+    last_name_overlap,
     normalize_author,
     normalize_title,
-    title_similarity,
+    normalized_title_similarity,
+    strip_accents,
+    token_jaccard,
 )
 
+# Entries whose title shares fewer tokens than this with the candidate cannot
+# plausibly clear the title thresholds; skip the character-level ratio for them.
+# Kept loose so tokenization differences ("self-similar" vs "selfsimilar") pass.
+MIN_TITLE_TOKEN_JACCARD = 0.2
+
+# A match this strong ends the candidate loop early (saves arXiv API calls).
+CONFIDENT_TITLE_SCORE = 0.98
+CONFIDENT_AUTHOR_OVERLAP = 0.5
+
 
 @dataclass
 class TitleCandidate:
@@ -36,7 +50,8 @@ def _utc_now_iso() -> str:
 
 
 def _norm_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # str.split() with no separator strips and splits on any whitespace run.
+    return " ".join((s or "").split())
 
 
 ARXIV_ID_IN_TEXT_RE = re.compile(
@@ -48,24 +63,62 @@ ARXIV_ID_IN_TEXT_RE = re.compile(
 def try_extract_arxiv_id_from_text(text: str) -> Optional[str]:
     if not text:
         return None
+    # Every match contains "arxiv" or "abs/"; skip the regex when neither occurs.
+    low = text.lower()
+    if "arxiv" not in low and "abs/" not in low:
+        return None
     m = ARXIV_ID_IN_TEXT_RE.search(text)
     if not m:
         return None
     return m.group(1).strip()
 
 
+# No ARXIV_ID_IN_TEXT_RE match can contain NUL, so it safely separates texts.
+_BULK_SEP = "\x00"
+
+
+def try_extract_arxiv_ids(texts: list[str]) -> list[Optional[str]]:
+    """Bulk variant of `try_extract_arxiv_id_from_text`.
+
+    Applies the same "arxiv"/"abs/" literal prefilter per text, then scans
+    the remaining texts with a single regex pass over their NUL-joined
+    concatenation instead of one search call per text.
+    """
+
+    out: list[Optional[str]] = [None] * len(texts)
+    candidates: list[int] = []
+    for i, t in enumerate(texts):
+        low = (t or "").lower()
+        if "arxiv" in low or "abs/" in low:
+            candidates.append(i)
+    if not candidates:
+        return out
+    starts: list[int] = []
+    pos = 0
+    for i in candidates:
+        starts.append(pos)
+        pos += len(texts[i]) + len(_BULK_SEP)
+    joined = _BULK_SEP.join(texts[i] for i in candidates)
+    for m in ARXIV_ID_IN_TEXT_RE.finditer(joined):
+        i = candidates[bisect_right(starts, m.start()) - 1]
+        if out[i] is None:
+            out[i] = m.group(1).strip()
+    return out
+
+
 _URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+_DOI_URL_RE = re.compile(r"https?://(?:dx\.)?doi\.org/", re.IGNORECASE)
 
 
 def _is_doi_url(text: str) -> bool:
-    return bool(re.search(r"https?://(?:dx\.)?doi\.org/", text, flags=re.IGNORECASE))
+    return bool(_DOI_URL_RE.search(text))
 
 
 def is_url_like_reference(text: str) -> bool:
     """True for dataset/software/webpage references (not papers)."""
 
     t = (text or "").strip()
-    if not t:
+    if "://" not in t:
         return False
     if _is_doi_url(t):
         return False
@@ -118,56 +171,59 @@ def _extract_href_title(ref: str) -> Optional[str]:
     return title
 
 
+# TeX accent macros (\" \' \` \^ \~ \H \c \k) -> base letter, as one alternation.
+_TEX_ACCENT_RE = re.compile(r"\\(?:[\"'`^~]|H|c|k)\s*\{?([A-Za-z])\}?")
+_NEWBLOCK_RE = re.compile(r"\\newblock\b")
+_TEX_MACRO_RE = re.compile(r"\\[a-zA-Z@]+\*?(?:\[[^\]]*\])?")
+
+
 def _strip_tex_commands(s: str) -> str:
     """Best-effort TeX cleanup for candidate extraction."""
 
     t = s or ""
 
     # TeX accents -> base letters (allow whitespace).
-    accent_patterns = [
-        r"\\\"\s*\{?([A-Za-z])\}?",
-        r"\\'\s*\{?([A-Za-z])\}?",
-        r"\\`\s*\{?([A-Za-z])\}?",
-        r"\\\^\s*\{?([A-Za-z])\}?",
-        r"\\~\s*\{?([A-Za-z])\}?",
-        r"\\H\s*\{?([A-Za-z])\}?",
-        r"\\c\s*\{?([A-Za-z])\}?",
-        r"\\k\s*\{?([A-Za-z])\}?",
-    ]
-    for pat in accent_patterns:
-        t = re.sub(pat, r"\1", t)
+    # Repeat until stable so stacked accents (e.g. \~\'e) are fully stripped.
+    n = 1
+    while n and "\\" in t:
+        t, n = _TEX_ACCENT_RE.subn(r"\1", t)
 
     # Replace common structural macros.
-    t = re.sub(r"\\newblock\b", " ", t)
+    t = _NEWBLOCK_RE.sub(" ", t)
     # Drop other macros but keep their brace content when possible (rough).
-    t = re.sub(r"\\[a-zA-Z@]+\*?(?:\[[^\]]*\])?", " ", t)
+    t = _TEX_MACRO_RE.sub(" ", t)
     t = t.replace("{", " ").replace("}", " ")
 
     # Strip accents introduced by unicode.
-    t = unicodedata.normalize("NFKD", t)
-    t = "".join(ch for ch in t if not unicodedata.combining(ch))
-    return _norm_ws(t)
+    return _norm_ws(strip_accents(t))
+
+
+_ET_AL_RE = re.compile(r"\bet\s+al\b\.?", re.IGNORECASE)
+_AND_RE = re.compile(r"\band\b", re.IGNORECASE)
+# Words marking a bibliographic field rather than an author name.
+_AUTHOR_EXCLUDE_WORDS = frozenset(
+    {"arxiv", "doi", "http", "vol", "no", "pp", "page", "pages"}
+)
+_WORD_RE = re.compile(r"\w+")
 
 
 def _extract_authors_prefix(prefix: str) -> list[str]:
     p = _strip_tex_commands(prefix)
-    p = re.sub(r"\bet\s+al\b\.?", " ", p, flags=re.IGNORECASE)
+    p = _ET_AL_RE.sub(" ", p)
     p = _norm_ws(p)
     if not p:
         return []
     if " and " in p.lower():
-        raw = [
-            a.strip() for a in re.split(r"\band\b", p, flags=re.IGNORECASE) if a.strip()
-        ]
+        raw = [a.strip() for a in _AND_RE.split(p) if a.strip()]
     else:
         raw = [a.strip() for a in p.split(",") if a.strip()]
     out: list[str] = []
     for a in raw:
         if len(a) < 3:
             continue
-        if re.search(r"\b(arxiv|doi|http|vol|no|pp|pages?)\b", a, flags=re.IGNORECASE):
+        if not _AUTHOR_EXCLUDE_WORDS.isdisjoint(_WORD_RE.findall(a.lower())):
             continue
-        if not re.search(r"[A-Za-z]", a):
+        if not any(c.isascii() and c.isalpha() for c in a):
             continue
         out.append(_norm_ws(a))
         if len(out) >= 6:
@@ -182,29 +238,43 @@ def _strip_outer_quotes(s: str) -> str:
     return t
 
 
-def _strip_trailing_metadata(s: str) -> str:
-    """Remove obvious trailing metadata from a candidate title span."""
-
-    t = _norm_ws(s)
-    # Cut at common journal/publisher boundaries.
-    for pat in (
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_YEAR_DOT_RE = re.compile(r"\b(19|20)\d{2}\s*\.\s*")
+_LEADING_YEAR_DOT_RE = re.compile(r"\s*(19|20)\d{2}\s*\.\s*")
+# Journal/publisher markers that end a title span.
+_TITLE_STOP_RES = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
         r"\\textit\b",
         r"\\emph\b",
         r"\bInternational\b",
         r"\bJournal\b",
         r"\bJ\.\b",
         r"\bProc\b",
-    ):
-        m = re.search(pat, t, flags=re.IGNORECASE)
+    )
+)
+
+
+def _strip_trailing_metadata(s: str) -> str:
+    """Remove obvious trailing metadata from a candidate title span."""
+
+    t = _norm_ws(s)
+    # Cut at common journal/publisher boundaries.
+    for stop_re in _TITLE_STOP_RES:
+        m = stop_re.search(t)
         if m and m.start() > 0:
             t = t[: m.start()].strip(" ,;:")
     # Cut at year
-    m = re.search(r"\b(19|20)\d{2}\b", t)
+    m = _YEAR_RE.search(t)
     if m and m.start() > 0:
         t = t[: m.start()].strip(" ,;:")
     return t
 
 
+_INITIAL_RE = re.compile(r"\b[A-Z]\.?\b")
+_LAST_NAME_ONLY_RE = re.compile(r"[A-Za-z\-]{3,}")
+
+
 def _looks_like_author_segment(seg: str) -> bool:
     """Heuristic: decide if `seg` is another author token (e.g. 'S.~Norine')."""
 
@@ -215,12 +285,12 @@ def _looks_like_author_segment(seg: str) -> bool:
     # short-ish, contains a name-like token
     if len(s) > 40:
         return False
-    if re.search(r"\b[A-Z]\.?\b", seg):
+    if _INITIAL_RE.search(seg):
         return True
     if "~" in seg:
         return True
     # "Lastname" only
-    if re.fullmatch(r"[A-Za-z\-]{3,}", s):
+    if _LAST_NAME_ONLY_RE.fullmatch(s):
         return True
     # Avoid mistaking a title fragment for an author.
     if any(w in low.split() for w in {"of", "and", "in", "on", "for", "with"}):
@@ -267,6 +337,12 @@ JOURNAL_WORDS = {
 }
 
 
+_YEAR_ONLY_RE = re.compile(r"(19|20)\d{2}\.?")
+_MONTH_YEAR_RE = re.compile(
+    r"(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\.?\s+(19|20)\d{2}\.?"
+)
+
+
 def _candidate_quality_score(title: str) -> float:
     t = _strip_tex_commands(title)
     t = _norm_ws(t)
@@ -277,15 +353,12 @@ def _candidate_quality_score(title: str) -> float:
     # reject date/year-only
     if low in PUBLISHER_WORDS:
         return -1e9
-    if re.fullmatch(r"(19|20)\d{2}\.?", low):
+    if _YEAR_ONLY_RE.fullmatch(low):
         return -1e9
-    if re.fullmatch(
-        r"(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\.?\s+(19|20)\d{2}\.?",
-        low,
-    ):
+    if _MONTH_YEAR_RE.fullmatch(low):
         return -1e9
 
-    words = [w for w in re.split(r"\s+", low) if w]
+    words = low.split()
     n = len(words)
     if n < 3:
         return -1e9
@@ -295,13 +368,23 @@ def _candidate_quality_score(title: str) -> float:
         score -= 8.0
     if any(w in PUBLISHER_WORDS for w in words):
         score -= 10.0
-    if re.search(r"\b(19|20)\d{2}\b", low):
+    if _YEAR_RE.search(low):
         score -= 3.0
     if any(w in {"of", "and", "in", "on", "for", "with", "via"} for w in words):
         score += 2.0
     return score
 
 
+# Quoted-title patterns in priority order, keyed by their opening quote so
+# references without that character skip the scan.
+_QUOTED_TITLE_RES = (
+    ("“", re.compile(r"“([^”]{6,})”")),
+    ('"', re.compile(r'"([^"]{6,})"')),
+    ("'", re.compile(r"'([^']{6,})'")),
+)
+_EMPH_TITLE_RE = re.compile(r"\\emph\{([^}]{6,})\}")
+
+
 def generate_title_candidates(
     full_reference: str,
     *,
@@ -341,7 +424,7 @@ def generate_title_candidates(
                 raw.append((head[first_comma2 + 1 : last_dot], "textit_dot"))
 
     # 0b) Year-dot pattern: "..., 2005. Title. Journal ..." -> take after year-dot
-    m_year_dot = re.search(r"\b(19|20)\d{2}\s*\.\s*", ref)
+    m_year_dot = _YEAR_DOT_RE.search(ref)
     if m_year_dot:
         after_year = ref[m_year_dot.end() :]
         dot = after_year.find(".")
@@ -354,18 +437,16 @@ def generate_title_candidates(
         raw.append((href_t, "href"))
 
     # 2) quoted (common bib style)
-    for qre in (
-        re.compile(r"“([^”]{6,})”"),
-        re.compile(r'"([^"]{6,})"'),
-        re.compile(r"'([^']{6,})'"),
-    ):
+    for quote, qre in _QUOTED_TITLE_RES:
+        if quote not in ref:
+            continue
         m = qre.search(ref)
         if m:
             raw.append((_strip_outer_quotes(m.group(1)), "quoted"))
             break
 
     # 3) emph
-    m = re.search(r"\\emph\{([^}]{6,})\}", ref)
+    m = _EMPH_TITLE_RE.search(ref)
     if m:
         raw.append((m.group(1), "emph"))
 
@@ -381,7 +462,7 @@ def generate_title_candidates(
         after = ref[start:]
 
         # If we have a year-dot inside this span, cut to after it.
-        m_year_prefix = re.match(r"\s*(19|20)\d{2}\s*\.\s*", after)
+        m_year_prefix = _LEADING_YEAR_DOT_RE.match(after)
         if m_year_prefix:
             after = after[m_year_prefix.end() :]
 
@@ -389,7 +470,7 @@ def generate_title_candidates(
         if dot != -1:
             raw.append((_strip_trailing_metadata(after[:dot]), "after_authors_dot"))
 
-        m_year = re.search(r"\b(19|20)\d{2}\b", after)
+        m_year = _YEAR_RE.search(after)
         if m_year:
             raw.append(
                 (
@@ -422,9 +503,7 @@ def generate_title_candidates(
 def _author_last_name(authors: list[str]) -> Optional[str]:
     if not authors:
         return None
-    n = normalize_author(authors[0]).split(" ")
-    n = [t for t in n if t]
-    return n[-1] if n else None
+    return author_last_name(authors[0]) or None
 
 
 @dataclass
@@ -440,32 +519,144 @@ class MatchResult:
     arxiv_query: Optional[str]
 
 
+def _cache_key_payload(title: str, authors: list[str]) -> bytes:
+    # NUL-separated normalized title and authors; neither normalizer emits NUL.
+    parts = [normalize_title(title)]
+    parts.extend(n for n in map(normalize_author, authors or []) if n)
+    return "\x00".join(parts).encode("utf-8")
+
+
 def _cache_key(title: str, authors: list[str]) -> str:
+    # BLAKE2b-128 with a versioned personalization; 32 hex chars, so it cannot
+    # collide with legacy 64-char SHA-256 keys.
+    return hashlib.blake2b(
+        _cache_key_payload(title, authors), digest_size=16, person=b"arxitex-cache-2"
+    ).hexdigest()
+
+
+def _legacy_cache_key(title: str, authors: list[str]) -> str:
+    """SHA-256 of the JSON payload used by older cache rows (read-only fallback)."""
+
     payload = {
         "title": normalize_title(title),
-        "authors": [
-            normalize_author(a) for a in (authors or []) if normalize_author(a)
-        ],
+        "authors": [n for n in map(normalize_author, authors or []) if n],
     }
-    b = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(b).hexdigest()
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
 
 
-def _load_cache(conn, *, cache_key: str) -> Optional[dict]:
-    row = conn.execute(
-        """
-        SELECT matched_arxiv_id, matched_title, matched_authors_json,
-               title_score, author_overlap, arxiv_query, last_fetched_at_utc
-        FROM external_reference_arxiv_search_cache
-        WHERE cache_key = ?
-        """,
-        (cache_key,),
-    ).fetchone()
-    return dict(row) if row else None
+# Whether each cache DB still holds fresh legacy 64-char keys, checked once per
+# path. Current keys are 32 chars, so a DB without such rows never gains any.
+_LEGACY_ROWS_BY_PATH: dict[str, bool] = {}
+
+
+def _has_legacy_rows(conn, db_path: str, *, cutoff_iso: str) -> bool:
+    found = _LEGACY_ROWS_BY_PATH.get(db_path)
+    if found is None:
+        found = (
+            conn.execute(
+                "SELECT 1 FROM external_reference_arxiv_search_cache"
+                " WHERE length(cache_key) = 64 AND last_fetched_at_utc >= ? LIMIT 1",
+                (cutoff_iso,),
+            ).fetchone()
+            is not None
+        )
+        _LEGACY_ROWS_BY_PATH[db_path] = found
+    return found
+
+
+def _open_cache_conn(db_path: str) -> sqlite3.Connection:
+    """Open a tuned connection to the search cache DB, ensuring its schema.
+
+    `_match_references` opens one per call and closes it when done.
+    """
+
+    ensure_schema(db_path)
+    conn = connect(db_path)
+    tune_for_bulk(conn)
+    return conn
+
+
+# Keys per IN (...) lookup; stays well below SQLite's bound-parameter limit.
+_CACHE_LOOKUP_CHUNK = 500
+
+
+def _load_cache_many(conn, *, cache_keys: list[str]) -> dict[str, dict]:
+    """Load cache rows for several keys with one query per 500 keys."""
+
+    keys = list(dict.fromkeys(k for k in cache_keys if k))
+    out: dict[str, dict] = {}
+    for i in range(0, len(keys), _CACHE_LOOKUP_CHUNK):
+        chunk = keys[i : i + _CACHE_LOOKUP_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(
+            f"""
+            SELECT cache_key, matched_arxiv_id, matched_title, matched_authors_json,
+                   title_score, author_overlap, arxiv_query, last_fetched_at_utc
+            FROM external_reference_arxiv_search_cache
+            WHERE cache_key IN ({placeholders})
+            """,
+            chunk,
+        ).fetchall()
+        out.update((r["cache_key"], dict(r)) for r in rows)
+    return out
+
+
+def _prefetch_cache(
+    conn,
+    *,
+    candidate_sets: list[tuple[list[TitleCandidate], list[str]]],
+    cache_keys: list[list[str]],
+    probe_legacy: bool,
+) -> dict[str, dict]:
+    """Load cache rows for every candidate of every reference.
+
+    Legacy keys are computed and probed only when `probe_legacy` is set.
+    """
+
+    cached_by_key = _load_cache_many(
+        conn, cache_keys=[k for keys in cache_keys for k in keys]
+    )
+    if not probe_legacy:
+        return cached_by_key
+    # Fall back to legacy keys for candidates not cached yet; current keys win.
+    legacy: dict[str, str] = {}
+    for (cands, authors), keys in zip(candidate_sets, cache_keys):
+        for c, k in zip(cands, keys):
+            if k not in cached_by_key:
+                legacy.setdefault(_legacy_cache_key(c.title, authors), k)
+    if legacy:
+        rows = _load_cache_many(conn, cache_keys=list(legacy))
+        for legacy_key, key in legacy.items():
+            row = rows.get(legacy_key)
+            if row is not None:
+                cached_by_key.setdefault(key, row)
+    return cached_by_key
+
+
+def _is_fresh(fetched_at: object, *, cutoff: datetime, cutoff_iso: str) -> bool:
+    """True if a cached `last_fetched_at_utc` value is not older than `cutoff`.
+
+    Timestamps written by `_utc_now_iso` are UTC ISO-8601 strings, which order
+    lexicographically; anything else falls back to a full datetime parse.
+    """
+
+    fetched = str(fetched_at or "")
+    if not fetched:
+        return False
+    if fetched.endswith("+00:00"):
+        return fetched >= cutoff_iso
+    try:
+        dt = datetime.fromisoformat(fetched.replace("Z", "+00:00"))
+    except Exception:
+        return False
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt >= cutoff
 
 
-def _upsert_cache(conn, *, cache_key: str, data: dict) -> None:
-    conn.execute(
+def _upsert_cache_many(conn, rows: dict[str, dict]) -> None:
+    conn.executemany(
         """
         INSERT INTO external_reference_arxiv_search_cache (
             cache_key, matched_arxiv_id, matched_title, matched_authors_json,
@@ -480,16 +671,42 @@ def _upsert_cache(conn, *, cache_key: str, data: dict) -> None:
             arxiv_query=excluded.arxiv_query,
             last_fetched_at_utc=excluded.last_fetched_at_utc
         """,
-        (
-            cache_key,
-            data.get("matched_arxiv_id"),
-            data.get("matched_title"),
-            data.get("matched_authors_json"),
-            data.get("title_score"),
-            data.get("author_overlap"),
-            data.get("arxiv_query"),
-            data.get("last_fetched_at_utc") or _utc_now_iso(),
+        [
+            (
+                cache_key,
+                data.get("matched_arxiv_id"),
+                data.get("matched_title"),
+                data.get("matched_authors_json"),
+                data.get("title_score"),
+                data.get("author_overlap"),
+                data.get("arxiv_query"),
+                data.get("last_fetched_at_utc") or _utc_now_iso(),
+            )
+            for cache_key, data in rows.items()
+        ],
+    )
+
+
+def _cache_row(res: MatchResult, query: str) -> dict:
+    return {
+        "matched_arxiv_id": res.matched_arxiv_id,
+        "matched_title": res.matched_title,
+        "matched_authors_json": json.dumps(
+            res.matched_authors or [], ensure_ascii=False
         ),
+        "title_score": res.title_score,
+        "author_overlap": res.author_overlap,
+        "arxiv_query": query,
+        "last_fetched_at_utc": _utc_now_iso(),
+    }
+
+
+def _is_confident_match(res: Optional[MatchResult]) -> bool:
+    return bool(
+        res is not None
+        and res.matched_arxiv_id
+        and (res.title_score or 0.0) >= CONFIDENT_TITLE_SCORE
+        and (res.author_overlap or 0.0) >= CONFIDENT_AUTHOR_OVERLAP
     )
 
 
@@ -501,166 +718,159 @@ def _candidate_query(title: str, authors: list[str]) -> str:
     return q
 
 
-def match_external_reference_to_arxiv(
+def _none_result(
     *,
-    api: ArxivAPI,
-    full_reference: str,
     extracted_title: Optional[str] = None,
     extracted_authors: Optional[list[str]] = None,
-    title_threshold_with_authors: float = 0.92,
-    title_threshold_no_authors: float = 0.96,
-    refresh_cache: bool = False,
-    db_path_for_cache: Optional[str] = None,
-    refresh_days: int = 30,
-    max_candidates: int = 4,
+    arxiv_query: Optional[str] = None,
 ) -> MatchResult:
-    """Try up to `max_candidates` candidate titles and keep the best arXiv match."""
+    return MatchResult(
+        matched_arxiv_id=None,
+        match_method="none",
+        extracted_title=extracted_title,
+        extracted_authors=extracted_authors or [],
+        matched_title=None,
+        matched_authors=[],
+        title_score=None,
+        author_overlap=None,
+        arxiv_query=arxiv_query,
+    )
 
-    # Fast path: explicit arXiv id in the reference text.
-    direct = try_extract_arxiv_id_from_text(full_reference)
-    if direct:
-        return MatchResult(
-            matched_arxiv_id=normalize_arxiv_id(direct),
-            match_method="direct_regex",
-            extracted_title=None,
-            extracted_authors=[],
-            matched_title=None,
-            matched_authors=[],
-            title_score=None,
-            author_overlap=None,
-            arxiv_query=None,
-        )
 
-    # Candidate title extraction: either explicit override or parse from the reference.
-    if extracted_title:
-        candidates = [
-            TitleCandidate(title=extracted_title, method="provided", score=0.0)
-        ]
-        authors = extracted_authors or []
-    else:
-        candidates, authors = generate_title_candidates(
-            full_reference, limit=max_candidates
-        )
-        authors = extracted_authors or authors
+def _match_candidates(
+    *,
+    api: ArxivAPI,
+    candidates: list[TitleCandidate],
+    authors: list[str],
+    cache_keys: list[Optional[str]],
+    cached_by_key: dict[str, dict],
+    cache_writes: dict[str, dict],
+    title_threshold_with_authors: float,
+    title_threshold_no_authors: float,
+    refresh_cache: bool,
+    cutoff: datetime,
+    cutoff_iso: str,
+) -> MatchResult:
+    """Evaluate the candidate titles of one reference and keep the best match.
 
-    if not candidates:
-        return MatchResult(
-            matched_arxiv_id=None,
-            match_method="none",
-            extracted_title=None,
-            extracted_authors=[],
-            matched_title=None,
-            matched_authors=[],
-            title_score=None,
-            author_overlap=None,
-            arxiv_query=None,
-        )
+    Cache rows are read from `cached_by_key`; new rows are added to both
+    `cache_writes` (flushed by the caller) and `cached_by_key`.
+    """
+
+    def record(cache_key: Optional[str], res: MatchResult, query: str) -> None:
+        if cache_key:
+            row = _cache_row(res, query)
+            cache_writes[cache_key] = row
+            cached_by_key[cache_key] = row
 
-    # Evaluate each candidate, using the existing cache.
     best: Optional[MatchResult] = None
     best_score = -1.0
+    wanted_last = author_last_names(authors)
 
-    for cand in candidates[:max_candidates]:
+    for cand, cache_key in zip(candidates, cache_keys):
         title = cand.title
         query = _candidate_query(title, authors)
 
-        # Cache lookup per candidate.
-        cache_key = None
-        cached = None
-        if db_path_for_cache:
-            ensure_schema(db_path_for_cache)
-            cache_key = _cache_key(title, authors)
-            conn = connect(db_path_for_cache)
+        cached = cached_by_key.get(cache_key) if cache_key else None
+        if (
+            cached
+            and not refresh_cache
+            and _is_fresh(
+                cached.get("last_fetched_at_utc"), cutoff=cutoff, cutoff_iso=cutoff_iso
+            )
+        ):
+            ma = cached.get("matched_arxiv_id")
+            mt = cached.get("matched_title")
             try:
-                cached = _load_cache(conn, cache_key=cache_key)
-            finally:
-                conn.close()
-
-            if cached and not refresh_cache:
-                try:
-                    dt = datetime.fromisoformat(
-                        str(cached.get("last_fetched_at_utc") or "").replace(
-                            "Z", "+00:00"
-                        )
+                mas = json.loads(cached.get("matched_authors_json") or "[]")
+            except Exception:
+                mas = []
+            ts = (
+                float(cached["title_score"])
+                if cached.get("title_score") is not None
+                else None
+            )
+            ao = (
+                float(cached["author_overlap"])
+                if cached.get("author_overlap") is not None
+                else None
+            )
+
+            if ma and ts is not None:
+                ma = normalize_arxiv_id(ma)
+                score = ts + 0.1 * (ao or 0.0)
+                if score > best_score:
+                    best_score = score
+                    best = MatchResult(
+                        matched_arxiv_id=ma,
+                        match_method="search",
+                        extracted_title=title,
+                        extracted_authors=authors,
+                        matched_title=mt,
+                        matched_authors=mas,
+                        title_score=ts,
+                        author_overlap=ao,
+                        arxiv_query=str(cached.get("arxiv_query") or query),
                     )
-                except Exception:
-                    dt = None
-                if dt is not None:
-                    cutoff = datetime.now(timezone.utc) - timedelta(days=refresh_days)
-                    if dt >= cutoff:
-                        ma = cached.get("matched_arxiv_id")
-                        mt = cached.get("matched_title")
-                        try:
-                            mas = json.loads(cached.get("matched_authors_json") or "[]")
-                        except Exception:
-                            mas = []
-                        ts = (
-                            float(cached["title_score"])
-                            if cached.get("title_score") is not None
-                            else None
-                        )
-                        ao = (
-                            float(cached["author_overlap"])
-                            if cached.get("author_overlap") is not None
-                            else None
-                        )
-
-                        if ma and ts is not None:
-                            ma = normalize_arxiv_id(ma)
-                            score = ts + 0.1 * (ao or 0.0)
-                            if score > best_score:
-                                best_score = score
-                                best = MatchResult(
-                                    matched_arxiv_id=ma,
-                                    match_method="search",
-                                    extracted_title=title,
-                                    extracted_authors=authors,
-                                    matched_title=mt,
-                                    matched_authors=mas,
-                                    title_score=ts,
-                                    author_overlap=ao,
-                                    arxiv_query=str(cached.get("arxiv_query") or query),
-                                )
-                        continue
+            if _is_confident_match(best):
+                break
+            continue
 
         xml = api.fetch_papers(query, start=0, batch_size=10)
         cnt, _total, entries = api.parse_response(xml)
         if cnt == 0 or not entries:
             # cache miss decision
-            if db_path_for_cache and cache_key:
-                _write_cache_record(
-                    db_path_for_cache,
-                    cache_key,
-                    MatchResult(
-                        matched_arxiv_id=None,
-                        match_method="none",
-                        extracted_title=title,
-                        extracted_authors=authors,
-                        matched_title=None,
-                        matched_authors=[],
-                        title_score=None,
-                        author_overlap=None,
-                        arxiv_query=query,
-                    ),
-                    query,
-                )
+            record(
+                cache_key,
+                _none_result(
+                    extracted_title=title, extracted_authors=authors, arxiv_query=query
+                ),
+                query,
+            )
             continue
 
         # Pick the best arXiv entry for this candidate title.
         local_best: Optional[MatchResult] = None
         local_best_score = -1.0
+        wanted_norm = normalize_title(title)
+        wanted_tokens = frozenset(wanted_norm.split())
+        saw_paper = False
 
-        for e in entries:
-            paper = api.entry_to_paper(e)
+        ranked = []
+        for idx, e in enumerate(entries):
+            paper = api.entry_to_title_authors(e)
             if not paper:
                 continue
+            saw_paper = True
             pt = paper.get("title") or ""
+            pt_norm = normalize_title(pt)
+            overlap = token_jaccard(wanted_tokens, frozenset(pt_norm.split()))
+            if overlap < MIN_TITLE_TOKEN_JACCARD:
+                continue
+            ranked.append((overlap, idx, paper, pt, pt_norm))
+
+        # Score entries sharing the most title tokens first so the cutoff below
+        # prunes more; equal scores still go to the earlier arXiv entry.
+        ranked.sort(key=lambda r: (-r[0], r[1]))
+        local_best_idx = -1
+
+        for _overlap, idx, paper, pt, pt_norm in ranked:
+            # Author overlap adds at most 0.1, so titles scoring below
+            # `local_best_score - 0.1` cannot win and need no exact score.
+            ts_cutoff = local_best_score - 0.1
+            ts = normalized_title_similarity(
+                wanted_norm, pt_norm, score_cutoff=ts_cutoff
+            )
+            if ts_cutoff > 0.0 and ts < ts_cutoff:
+                continue
             pa = paper.get("authors") or []
-            ts = title_similarity(title, pt)
-            ao = author_overlap(authors, pa, use_last_name=True)
+            ao = last_name_overlap(wanted_last, pa)
             score = ts + 0.1 * ao
-            if score > local_best_score:
+            if score > local_best_score or (
+                score == local_best_score and idx < local_best_idx
+            ):
                 local_best_score = score
+                local_best_idx = idx
                 local_best = MatchResult(
                     matched_arxiv_id=normalize_arxiv_id(
                         str(paper.get("arxiv_id") or "")
@@ -676,7 +886,12 @@ def match_external_reference_to_arxiv(
                 )
 
         if local_best is None:
-            continue
+            if not saw_paper:
+                continue
+            # Every entry was prefiltered out: cache the rejection.
+            local_best = _none_result(
+                extracted_title=title, extracted_authors=authors, arxiv_query=query
+            )
 
         # Thresholding: require high title similarity, and some author overlap if authors exist.
         if local_best.title_score is not None:
@@ -702,8 +917,7 @@ def match_external_reference_to_arxiv(
                 )
 
         # Write cache for this candidate.
-        if db_path_for_cache and cache_key:
-            _write_cache_record(db_path_for_cache, cache_key, local_best, query)
+        record(cache_key, local_best, query)
 
         if local_best.matched_arxiv_id and local_best.title_score is not None:
             score = local_best.title_score + 0.1 * (local_best.author_overlap or 0.0)
@@ -711,47 +925,191 @@ def match_external_reference_to_arxiv(
                 best_score = score
                 best = local_best
 
+        # Remaining candidates are lower-ranked; stop once a match is unambiguous.
+        if _is_confident_match(best):
+            break
+
     if best is None:
         # If nothing matched, return a "none" result but keep the best candidate
         # title for observability.
         top = candidates[0]
-        return MatchResult(
-            matched_arxiv_id=None,
-            match_method="none",
+        return _none_result(
             extracted_title=top.title,
             extracted_authors=authors,
-            matched_title=None,
-            matched_authors=[],
-            title_score=None,
-            author_overlap=None,
             arxiv_query=_candidate_query(top.title, authors),
         )
     return best
 
 
-def _write_cache_record(
-    db_path: str, cache_key: str, res: MatchResult, query: str
-) -> None:
+def _match_references(
+    *,
+    api: ArxivAPI,
+    items: list[tuple[str, Optional[str], Optional[list[str]]]],
+    title_threshold_with_authors: float,
+    title_threshold_no_authors: float,
+    refresh_cache: bool,
+    db_path_for_cache: Optional[str],
+    refresh_days: int,
+    max_candidates: int,
+) -> list[MatchResult]:
+    """Match `(full_reference, extracted_title, extracted_authors)` items.
+
+    The search cache is read with one connection and bulk lookups up front,
+    and new cache rows are written back in a single transaction at the end.
+    """
+
+    results: list[Optional[MatchResult]] = [None] * len(items)
+    pending: list[tuple[int, list[TitleCandidate], list[str]]] = []
+
+    # Fast path: explicit arXiv ids, found in one pass over all references.
+    direct_ids = try_extract_arxiv_ids([ref for ref, _t, _a in items])
+
+    for i, ((full_reference, extracted_title, extracted_authors), direct) in enumerate(
+        zip(items, direct_ids)
+    ):
+        if direct:
+            results[i] = MatchResult(
+                matched_arxiv_id=normalize_arxiv_id(direct),
+                match_method="direct_regex",
+                extracted_title=None,
+                extracted_authors=[],
+                matched_title=None,
+                matched_authors=[],
+                title_score=None,
+                author_overlap=None,
+                arxiv_query=None,
+            )
+            continue
+
+        # Candidate title extraction: either explicit override or parse from the reference.
+        if extracted_title:
+            candidates = [
+                TitleCandidate(title=extracted_title, method="provided", score=0.0)
+            ]
+            authors = extracted_authors or []
+        else:
+            candidates, authors = generate_title_candidates(
+                full_reference, limit=max_candidates
+            )
+            authors = extracted_authors or authors
+
+        if not candidates:
+            results[i] = _none_result()
+            continue
+        pending.append((i, candidates[:max_candidates], authors))
+
+    # Loop-invariant freshness cutoff, also as ISO text for cheap comparisons.
+    cutoff = datetime.now(timezone.utc) - timedelta(days=refresh_days)
+    cutoff_iso = cutoff.isoformat()
+
+    # One cache connection for both the prefetch and the final write.
+    conn = (
+        _open_cache_conn(db_path_for_cache) if db_path_for_cache and pending else None
+    )
     try:
-        conn = connect(db_path)
+        # Prefetch cache rows for all candidates of all references.
+        cached_by_key: dict[str, dict] = {}
+        if conn is not None:
+            cache_keys = [
+                [_cache_key(c.title, authors) for c in cands]
+                for _i, cands, authors in pending
+            ]
+            cached_by_key = _prefetch_cache(
+                conn,
+                candidate_sets=[(cands, authors) for _i, cands, authors in pending],
+                cache_keys=cache_keys,
+                probe_legacy=_has_legacy_rows(
+                    conn, db_path_for_cache, cutoff_iso=cutoff_iso
+                ),
+            )
+        else:
+            cache_keys = [[None] * len(cands) for _i, cands, _authors in pending]
+
+        cache_writes: dict[str, dict] = {}
         try:
-            with conn:
-                _upsert_cache(
-                    conn,
-                    cache_key=cache_key,
-                    data={
-                        "matched_arxiv_id": res.matched_arxiv_id,
-                        "matched_title": res.matched_title,
-                        "matched_authors_json": json.dumps(
-                            res.matched_authors or [], ensure_ascii=False
-                        ),
-                        "title_score": res.title_score,
-                        "author_overlap": res.author_overlap,
-                        "arxiv_query": query,
-                        "last_fetched_at_utc": _utc_now_iso(),
-                    },
+            for (i, candidates, authors), keys in zip(pending, cache_keys):
+                results[i] = _match_candidates(
+                    api=api,
+                    candidates=candidates,
+                    authors=authors,
+                    cache_keys=keys,
+                    cached_by_key=cached_by_key,
+                    cache_writes=cache_writes,
+                    title_threshold_with_authors=title_threshold_with_authors,
+                    title_threshold_no_authors=title_threshold_no_authors,
+                    refresh_cache=refresh_cache,
+                    cutoff=cutoff,
+                    cutoff_iso=cutoff_iso,
                 )
         finally:
+            # Persist whatever was fetched, even if a later API call failed.
+            if conn is not None and cache_writes:
+                _write_cache_records(conn, cache_writes)
+    finally:
+        if conn is not None:
             conn.close()
+
+    return [r for r in results if r is not None]
+
+
+def match_external_references_bulk(
+    *,
+    api: ArxivAPI,
+    references: list[str],
+    title_threshold_with_authors: float = 0.92,
+    title_threshold_no_authors: float = 0.96,
+    refresh_cache: bool = False,
+    db_path_for_cache: Optional[str] = None,
+    refresh_days: int = 30,
+    max_candidates: int = 4,
+) -> list[MatchResult]:
+    """Match many references, sharing one cache prefetch and one cache write.
+
+    Returns one `MatchResult` per reference, in order.
+    """
+
+    return _match_references(
+        api=api,
+        items=[(ref, None, None) for ref in references],
+        title_threshold_with_authors=title_threshold_with_authors,
+        title_threshold_no_authors=title_threshold_no_authors,
+        refresh_cache=refresh_cache,
+        db_path_for_cache=db_path_for_cache,
+        refresh_days=refresh_days,
+        max_candidates=max_candidates,
+    )
+
+
+def match_external_reference_to_arxiv(
+    *,
+    api: ArxivAPI,
+    full_reference: str,
+    extracted_title: Optional[str] = None,
+    extracted_authors: Optional[list[str]] = None,
+    title_threshold_with_authors: float = 0.92,
+    title_threshold_no_authors: float = 0.96,
+    refresh_cache: bool = False,
+    db_path_for_cache: Optional[str] = None,
+    refresh_days: int = 30,
+    max_candidates: int = 4,
+) -> MatchResult:
+    """Try up to `max_candidates` candidate titles and keep the best arXiv match."""
+
+    return _match_references(
+        api=api,
+        items=[(full_reference, extracted_title, extracted_authors)],
+        title_threshold_with_authors=title_threshold_with_authors,
+        title_threshold_no_authors=title_threshold_no_authors,
+        refresh_cache=refresh_cache,
+        db_path_for_cache=db_path_for_cache,
+        refresh_days=refresh_days,
+        max_candidates=max_candidates,
+    )[0]
+
+
+def _write_cache_records(conn: sqlite3.Connection, rows: dict[str, dict]) -> None:
+    try:
+        with conn:
+            _upsert_cache_many(conn, rows)
     except Exception as e:  # pragma: no cover
         logger.debug(f"Failed to write arXiv cache: {e}")
@@ -4,52 +4,134 @@ from __future__ import annotations
 
 import re
 import unicodedata
-from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Iterable, Optional
 
+from rapidfuzz import fuzz
+
+_TEX_FONT_CMD_RE = re.compile(r"\\(emph|textit|textbf|itshape|bfseries)\b")
+_BRACES_TO_SPACE = str.maketrans("{}", "  ")
+_INLINE_MATH_RE = re.compile(r"\$[^$]*\$")
+# ASCII \s is enough: any other whitespace is not [a-z0-9] and becomes " " too.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]", re.ASCII)
+
 
 def _norm_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return " ".join((s or "").split())
+
+
+def strip_accents(s: str) -> str:
+    """NFKD-decompose `s` and drop combining marks.
+
+    ASCII strings are already in normal form, so they are returned unchanged.
+    """
+
+    if s.isascii():
+        return s
+    t = unicodedata.normalize("NFKD", s).translate(_bmp_combining_table())
+    if t.isascii() or max(t) <= "\uffff":
+        return t
+    # Rare astral-plane text: drop the remaining combining marks one by one.
+    return "".join(ch for ch in t if not unicodedata.combining(ch))
+
+
+@lru_cache(maxsize=None)
+def _bmp_combining_table() -> dict[int, None]:
+    """str.translate table deleting every combining mark in the BMP."""
 
+    return {cp: None for cp in range(0x10000) if unicodedata.combining(chr(cp))}
 
+
+@lru_cache(maxsize=20000)
 def normalize_title(s: str) -> str:
     """Normalize titles for fuzzy matching."""
 
-    t = unicodedata.normalize("NFKD", s or "")
-    t = "".join(ch for ch in t if not unicodedata.combining(ch))
-    t = t.lower()
-    t = re.sub(r"\\(emph|textit|textbf|itshape|bfseries)\b", " ", t)
-    t = re.sub(r"[{}]", " ", t)
-    t = re.sub(r"\$[^$]*\$", " ", t)
-    t = re.sub(r"[^a-z0-9\s]", " ", t)
+    t = strip_accents(s or "").lower()
+    t = _TEX_FONT_CMD_RE.sub(" ", t)
+    t = t.translate(_BRACES_TO_SPACE)
+    t = _INLINE_MATH_RE.sub(" ", t)
+    t = _NON_ALNUM_RE.sub(" ", t)
     return _norm_ws(t)
 
 
+@lru_cache(maxsize=20000)
 def normalize_author(s: str) -> str:
     """Normalize an author string."""
 
-    t = (s or "").strip()
-    t = unicodedata.normalize("NFKD", t)
-    t = "".join(ch for ch in t if not unicodedata.combining(ch))
-    t = t.lower()
+    t = strip_accents((s or "").strip()).lower()
     if not t:
         return ""
     if "," in t:
         parts = [p.strip() for p in t.split(",") if p.strip()]
         if len(parts) >= 2:
             t = " ".join(parts[1:] + [parts[0]])
-    t = re.sub(r"[^a-z0-9\s]", " ", t)
+    t = _NON_ALNUM_RE.sub(" ", t)
     return _norm_ws(t)
 
 
 def title_similarity(a: str, b: str) -> float:
     """Return a normalized title similarity score in [0, 1]."""
 
-    na = normalize_title(a)
-    nb = normalize_title(b)
+    return normalized_title_similarity(normalize_title(a), normalize_title(b))
+
+
+def normalized_title_similarity(
+    na: str, nb: str, *, score_cutoff: float = 0.0
+) -> float:
+    """`title_similarity` for titles already passed through `normalize_title`.
+
+    This is rapidfuzz's LCS-based Indel similarity. It is never lower than
+    difflib's Ratcliff/Obershelp `SequenceMatcher.ratio()` and can exceed it
+    on reordered words, so borderline pairs may now clear the 0.92/0.96
+    acceptance thresholds (pinned in tests/test_citation_scoring.py).
+
+    Scores below `score_cutoff` are reported as 0.0, which lets rapidfuzz
+    abandon the alignment early.
+    """
+
     if not na or not nb:
         return 0.0
-    return SequenceMatcher(a=na, b=nb).ratio()
+    if na == nb:
+        return 1.0
+    # The length ratio bounds the score: 2*min(len)/(len(a)+len(b)).
+    la, lb = len(na), len(nb)
+    if 2.0 * min(la, lb) / (la + lb) < score_cutoff:
+        return 0.0
+    # 2*LCS/(len(a)+len(b)), computed in C++.
+    return fuzz.ratio(na, nb, score_cutoff=max(0.0, score_cutoff) * 100.0) / 100.0
+
+
+def token_jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two token sets (0.0 when either is empty)."""
+
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@lru_cache(maxsize=20000)
+def author_last_name(a: str) -> str:
+    """Return the normalized last-name token of an author string."""
+
+    toks = normalize_author(a).split()
+    return toks[-1] if toks else ""
+
+
+def author_last_names(authors: Iterable[str]) -> frozenset[str]:
+    """Return the set of normalized author last names (empty names dropped)."""
+
+    return frozenset(n for n in map(author_last_name, authors) if n)
+
+
+def last_name_overlap(wanted_last: frozenset[str], candidate: Iterable[str]) -> float:
+    """Author overlap against a precomputed `author_last_names(wanted)` set."""
+
+    if not wanted_last:
+        return 0.0
+    cand_last = author_last_names(candidate)
+    if not cand_last:
+        return 0.0
+    return len(wanted_last & cand_last) / len(wanted_last)
 
 
 def author_overlap(
@@ -64,18 +146,11 @@ def author_overlap(
     When False, compare full normalized author strings.
     """
 
-    def last_name(a: str) -> str:
-        na = normalize_author(a)
-        toks = [t for t in na.split(" ") if t]
-        return toks[-1] if toks else ""
-
     if use_last_name:
-        wanted_norm = {last_name(a) for a in wanted if last_name(a)}
-        cand_norm = {last_name(a) for a in candidate if last_name(a)}
-    else:
-        wanted_norm = {normalize_author(a) for a in wanted if normalize_author(a)}
-        cand_norm = {normalize_author(a) for a in candidate if normalize_author(a)}
+        return last_name_overlap(author_last_names(wanted), candidate)
 
+    wanted_norm = {n for n in map(normalize_author, wanted) if n}
+    cand_norm = {n for n in map(normalize_author, candidate) if n}
     if not wanted_norm or not cand_norm:
         return 0.0
     return len(wanted_norm.intersection(cand_norm)) / max(1, len(wanted_norm))
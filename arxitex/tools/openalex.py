@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import re
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
@@ -14,6 +15,9 @@ from arxitex.arxiv_utils import normalize_arxiv_id
 from arxitex.db.connection import connect
 from arxitex.db.schema import ensure_schema
 
+# Citation upserts per transaction during a backfill.
+_UPSERT_BATCH_SIZE = 500
+
 
 @dataclass
 class CitationRecord:
@@ -28,34 +32,45 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def upsert_paper_citation(db_path: str, rec: CitationRecord) -> None:
-    ensure_schema(db_path)
-    conn = connect(db_path)
-    try:
-        with conn:
-            # Ensure FK target exists
-            conn.execute(
-                "INSERT OR IGNORE INTO papers (paper_id) VALUES (?)", (rec.paper_id,)
-            )
-            conn.execute(
-                """
-                INSERT INTO paper_citations (
-                    paper_id, source, source_work_id, citation_count, last_fetched_at_utc
-                ) VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(paper_id) DO UPDATE SET
-                    source=excluded.source,
-                    source_work_id=excluded.source_work_id,
-                    citation_count=excluded.citation_count,
-                    last_fetched_at_utc=excluded.last_fetched_at_utc
-                """,
+def _upsert_paper_citations(
+    conn: sqlite3.Connection, recs: list[CitationRecord]
+) -> None:
+    """Upsert citation records in a single transaction."""
+    with conn:
+        # Ensure FK target exists
+        conn.executemany(
+            "INSERT OR IGNORE INTO papers (paper_id) VALUES (?)",
+            [(rec.paper_id,) for rec in recs],
+        )
+        conn.executemany(
+            """
+            INSERT INTO paper_citations (
+                paper_id, source, source_work_id, citation_count, last_fetched_at_utc
+            ) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(paper_id) DO UPDATE SET
+                source=excluded.source,
+                source_work_id=excluded.source_work_id,
+                citation_count=excluded.citation_count,
+                last_fetched_at_utc=excluded.last_fetched_at_utc
+            """,
+            [
                 (
                     rec.paper_id,
                     rec.source,
                     rec.source_work_id,
                     rec.citation_count,
                     rec.last_fetched_at_utc,
-                ),
-            )
+                )
+                for rec in recs
+            ],
+        )
+
+
+def upsert_paper_citation(db_path: str, rec: CitationRecord) -> None:
+    ensure_schema(db_path)
+    conn = connect(db_path)
+    try:
+        _upsert_paper_citations(conn, [rec])
     finally:
         conn.close()
 
@@ -332,7 +347,23 @@ async def backfill_citations_openalex(
     for bid in to_fetch:
         queue.put_nowait(bid)
 
-    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0, connect=5.0)) as client:
+    # One keep-alive connection per worker, and one SQLite connection shared
+    # by all workers (they run on this event loop) instead of a schema check
+    # plus connect/close for every upsert. Fetched records are written in
+    # batches so a long run commits once per _UPSERT_BATCH_SIZE papers rather
+    # than once per paper.
+    conn = connect(db_path)
+    pending: list[CitationRecord] = []
+
+    def flush_pending() -> None:
+        if pending:
+            _upsert_paper_citations(conn, pending)
+            pending.clear()
+
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=workers, max_keepalive_connections=workers),
+    ) as client:
 
         # Global throttling across all workers.
         throttle_lock = asyncio.Lock()
@@ -382,7 +413,9 @@ async def backfill_citations_openalex(
                         )
 
                         prev = existing_counts.get(bid)
-                        upsert_paper_citation(db_path, rec)
+                        pending.append(rec)
+                        if len(pending) >= _UPSERT_BATCH_SIZE:
+                            flush_pending()
                         if rec.citation_count is None:
                             stats["missing"] += 1
                         else:
@@ -469,7 +502,13 @@ async def backfill_citations_openalex(
                             f"Upgrades 0->>0 so far: {upgrades_0_to_pos} (examples: {ex})"
                         )
 
-        await asyncio.gather(*[worker_loop() for _ in range(workers)])
+        try:
+            await asyncio.gather(*[worker_loop() for _ in range(workers)])
+        finally:
+            try:
+                flush_pending()
+            finally:
+                conn.close()
 
     return {
         "unique": len(uniq),
@@ -21,11 +21,13 @@ Notes
 from __future__ import annotations
 
 import argparse
-import json
 import sqlite3
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Iterable
+from typing import Iterator
+
+from arxitex.db.connection import connect, tune_for_bulk
 
 
 @dataclass(frozen=True)
@@ -57,9 +59,10 @@ def _get_columns(conn: sqlite3.Connection, table: str) -> list[str]:
     return [r[1] for r in cur.fetchall()]
 
 
-def _select_affected(conn: sqlite3.Connection, cutoff_iso: str) -> list[sqlite3.Row]:
-    conn.row_factory = sqlite3.Row
+_AFFECTED_WHERE = "processed_timestamp_utc > ?"
 
+
+def _check_processed_columns(conn: sqlite3.Connection) -> None:
     cols = _get_columns(conn, "processed_papers")
     if "processed_timestamp_utc" not in cols:
         raise RuntimeError(
@@ -67,44 +70,72 @@ def _select_affected(conn: sqlite3.Connection, cutoff_iso: str) -> list[sqlite3.
             f"Columns are: {cols}"
         )
 
+
+def _count_affected(conn: sqlite3.Connection, cutoff_iso: str) -> int:
     return conn.execute(
-        """
+        f"SELECT COUNT(*) FROM processed_papers WHERE {_AFFECTED_WHERE}",
+        (cutoff_iso,),
+    ).fetchone()[0]
+
+
+def _select_affected(
+    conn: sqlite3.Connection, cutoff_iso: str
+) -> Iterator[sqlite3.Row]:
+    """Yield affected rows in timestamp order without materializing them."""
+    conn.row_factory = sqlite3.Row
+    yield from conn.execute(
+        f"""
         SELECT arxiv_id, status, processed_timestamp_utc
         FROM processed_papers
-        WHERE processed_timestamp_utc > ?
+        WHERE {_AFFECTED_WHERE}
         ORDER BY processed_timestamp_utc ASC
         """,
         (cutoff_iso,),
-    ).fetchall()
+    )
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
 
 
-def _metadata_for_requeue(conn: sqlite3.Connection, arxiv_id: str) -> str:
-    """Try to reconstruct discovery-queue-style metadata JSON.
+def _metadata_sql(conn: sqlite3.Connection) -> tuple[str, str]:
+    """SQL to reconstruct discovery-queue-style metadata JSON per queued id.
+
+    Returns `(expression, join)` for a SELECT over an `ids(value)` subquery.
 
     Preference order:
-    1) normalized `papers` table (if it exists)
+    1) normalized `papers` row (if the table exists), as a JSON object of all
+       its columns plus an arxiv_id key
     2) minimal stub with just arxiv_id
     """
-    if _table_exists(conn, "papers"):
-        cols = _get_columns(conn, "papers")
-        # Expect at least paper_id; may also include title/authors/categories.
-        if "paper_id" in cols:
-            row = conn.execute(
-                "SELECT * FROM papers WHERE paper_id = ?", (arxiv_id,)
-            ).fetchone()
-            if row:
-                # Keep it conservative: include whatever is there but ensure arxiv_id key.
-                d = dict(row)
-                d.setdefault("arxiv_id", arxiv_id)
-                return json.dumps(d)
-
-    return json.dumps({"arxiv_id": arxiv_id})
-
-
-def _ensure_discovered_papers_row(conn: sqlite3.Connection, arxiv_id: str) -> bool:
-    """Insert into discovered_papers if absent.
-
-    Returns True if inserted, False if already present.
+    stub = "json_object('arxiv_id', ids.value)"
+    if not _table_exists(conn, "papers"):
+        return stub, ""
+    cols = _get_columns(conn, "papers")
+    # Expect at least paper_id; may also include title/authors/categories.
+    if "paper_id" not in cols:
+        return stub, ""
+
+    # Keep it conservative: include whatever is there but ensure arxiv_id key.
+    args = [f"{_quote_literal(c)}, p.{_quote_ident(c)}" for c in cols]
+    if "arxiv_id" not in cols:
+        args.append("'arxiv_id', ids.value")
+    expr = (
+        f"CASE WHEN p.paper_id IS NULL THEN {stub} "
+        f"ELSE json_object({', '.join(args)}) END"
+    )
+    return expr, "LEFT JOIN papers AS p ON p.paper_id = ids.value"
+
+
+def _requeue_discovered_papers(conn: sqlite3.Connection, cutoff_iso: str) -> int:
+    """Insert affected arxiv_ids missing from discovered_papers.
+
+    A single INSERT ... SELECT builds each row's metadata inside SQLite.
+    Returns the number of rows inserted (ids already queued are left as is).
     """
     cols = _get_columns(conn, "discovered_papers")
     if "arxiv_id" not in cols:
@@ -116,46 +147,54 @@ def _ensure_discovered_papers_row(conn: sqlite3.Connection, arxiv_id: str) -> bo
             "discovered_papers.metadata column not found. " f"Columns are: {cols}"
         )
 
-    exists = conn.execute(
-        "SELECT 1 FROM discovered_papers WHERE arxiv_id = ?", (arxiv_id,)
-    ).fetchone()
-    if exists:
-        return False
-
-    meta = _metadata_for_requeue(conn, arxiv_id)
-    conn.execute(
-        "INSERT INTO discovered_papers (arxiv_id, metadata) VALUES (?, ?)",
-        (arxiv_id, meta),
+    expr, join = _metadata_sql(conn)
+    cur = conn.execute(
+        f"""
+        INSERT OR IGNORE INTO discovered_papers (arxiv_id, metadata)
+        SELECT ids.value, {expr}
+        FROM (
+            SELECT arxiv_id AS value FROM processed_papers WHERE {_AFFECTED_WHERE}
+        ) AS ids {join}
+        """,
+        (cutoff_iso,),
     )
-    return True
+    return cur.rowcount
 
 
-def _delete_processed(conn: sqlite3.Connection, arxiv_ids: Iterable[str]) -> int:
-    arxiv_ids = list(arxiv_ids)
-    if not arxiv_ids:
-        return 0
-    conn.executemany(
-        "DELETE FROM processed_papers WHERE arxiv_id = ?",
-        [(aid,) for aid in arxiv_ids],
+def _delete_processed(conn: sqlite3.Connection, cutoff_iso: str) -> int:
+    cur = conn.execute(
+        f"DELETE FROM processed_papers WHERE {_AFFECTED_WHERE}", (cutoff_iso,)
     )
-    return len(arxiv_ids)
+    return cur.rowcount
 
 
 def run(plan: Plan) -> int:
     if not plan.db_path.exists():
         raise SystemExit(f"DB not found: {plan.db_path}")
 
-    conn = sqlite3.connect(str(plan.db_path))
+    # WAL + synchronous=NORMAL + busy_timeout, plus a larger page cache,
+    # in-memory temp store and a memory-mapped DB for the bulk delete/requeue.
+    conn = connect(plan.db_path)
+    tune_for_bulk(conn, mmap_size_mib=256)
+    # Autocommit mode: the script owns transaction boundaries (BEGIN IMMEDIATE
+    # below), with no implicit BEGINs inserted by the sqlite3 module.
+    conn.isolation_level = None
     try:
-        affected = _select_affected(conn, plan.cutoff_iso)
-        arxiv_ids = [r["arxiv_id"] for r in affected]
+        _check_processed_columns(conn)
+        if plan.apply:
+            # Take the write lock up front rather than upgrading mid-transaction;
+            # this also pins the affected set between the preview and the apply.
+            conn.execute("BEGIN IMMEDIATE")
 
         print(f"DB: {plan.db_path}")
         print(f"Cutoff: {plan.cutoff_iso}")
-        print(f"Affected processed_papers rows: {len(arxiv_ids)}")
-        if affected[:10]:
+        print(
+            f"Affected processed_papers rows: {_count_affected(conn, plan.cutoff_iso)}"
+        )
+        sample = list(islice(_select_affected(conn, plan.cutoff_iso), 10))
+        if sample:
             print("Sample (first 10):")
-            for r in affected[:10]:
+            for r in sample:
                 print(
                     f"  {r['processed_timestamp_utc']}  {r['arxiv_id']}  {r['status']}"
                 )
@@ -168,19 +207,15 @@ def run(plan: Plan) -> int:
         inserted = 0
         deleted = 0
         try:
-            conn.execute("BEGIN")
-
             if plan.requeue:
                 # Ensure discovered_papers exists
                 if not _table_exists(conn, "discovered_papers"):
                     raise RuntimeError(
                         "discovered_papers table not found; cannot requeue."
                     )
-                for aid in arxiv_ids:
-                    if _ensure_discovered_papers_row(conn, aid):
-                        inserted += 1
+                inserted = _requeue_discovered_papers(conn, plan.cutoff_iso)
 
-            deleted = _delete_processed(conn, arxiv_ids)
+            deleted = _delete_processed(conn, plan.cutoff_iso)
 
             conn.commit()
         except Exception:
@@ -26,11 +26,13 @@ from __future__ import annotations
 import argparse
 import json
 import sqlite3
-from collections import Counter, defaultdict, deque
+from array import array
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
+import numpy as np
 from loguru import logger
 
 from arxitex.arxiv_utils import normalize_arxiv_id
@@ -114,31 +116,62 @@ def _load_edges(
         conn.close()
 
 
-def _connected_components(
-    nodes: Iterable[str], undirected_adj: dict[str, set[str]]
-) -> list[list[str]]:
-    """Return components as lists of node ids (unsorted)."""
+def _component_labels_union_find(
+    num_nodes: int, pairs: list[tuple[int, int]]
+) -> list[int]:
+    """Label undirected connected components with an array-backed union-find."""
 
-    seen: set[str] = set()
-    comps: list[list[str]] = []
+    parent = array("i", range(num_nodes))
+    rank = bytearray(num_nodes)
 
-    for n in nodes:
-        if n in seen:
+    def find(x: int) -> int:
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:  # path compression
+            parent[x], x = root, parent[x]
+        return root
+
+    for a, b in pairs:
+        ra, rb = find(a), find(b)
+        if ra == rb:
             continue
-        seen.add(n)
-        q: deque[str] = deque([n])
-        comp: list[str] = [n]
-        while q:
-            cur = q.popleft()
-            for nb in undirected_adj.get(cur, set()):
-                if nb in seen:
-                    continue
-                seen.add(nb)
-                q.append(nb)
-                comp.append(nb)
-        comps.append(comp)
-
-    return comps
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+
+    labels = [0] * num_nodes
+    label_of_root: dict[int, int] = {}
+    for i in range(num_nodes):
+        labels[i] = label_of_root.setdefault(find(i), len(label_of_root))
+    return labels
+
+
+def _component_labels(num_nodes: int, pairs: list[tuple[int, int]]) -> list[int]:
+    """Return a component label per node id (0..num_nodes-1).
+
+    Labels are numbered in order of each component's smallest node id. Uses
+    scipy's compiled connected_components over a CSR matrix when scipy is
+    installed, else a pure-Python union-find.
+    """
+
+    if num_nodes == 0:
+        return []
+    try:
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import connected_components
+    except ImportError:
+        return _component_labels_union_find(num_nodes, pairs)
+
+    src = np.fromiter((a for a, _ in pairs), dtype=np.int32, count=len(pairs))
+    dst = np.fromiter((b for _, b in pairs), dtype=np.int32, count=len(pairs))
+    graph = csr_matrix(
+        (np.ones(len(pairs), dtype=np.int8), (src, dst)), shape=(num_nodes, num_nodes)
+    )
+    _n, labels = connected_components(graph, directed=False, return_labels=True)
+    return labels.tolist()
 
 
 def extract_top_k_reference_components(
@@ -162,27 +195,35 @@ def extract_top_k_reference_components(
         normalize_arxiv_ids=normalize_arxiv_ids,
     )
 
-    undirected_adj: dict[str, set[str]] = defaultdict(set)
-    all_nodes: set[str] = set()
+    # Dense integer ids in first-seen order for the component labelling.
+    id_of: dict[str, int] = {}
     for e in edges:
-        all_nodes.add(e.source)
-        all_nodes.add(e.target)
-        undirected_adj[e.source].add(e.target)
-        undirected_adj[e.target].add(e.source)
-
-    comps = _connected_components(sorted(all_nodes), undirected_adj)
-    comps = [c for c in comps if len(c) >= int(min_size)]
-    comps.sort(key=len, reverse=True)
+        id_of.setdefault(e.source, len(id_of))
+        id_of.setdefault(e.target, len(id_of))
+    node_of = list(id_of)
+    pairs = [(id_of[e.source], id_of[e.target]) for e in edges]
+    labels = _component_labels(len(node_of), pairs)
+
+    comps: list[list[str]] = [[] for _ in range(max(labels, default=-1) + 1)]
+    for node, label in zip(node_of, labels):
+        comps[label].append(node)
+    ranked = [lbl for lbl, c in enumerate(comps) if len(c) >= int(min_size)]
+    # Largest first; equal sizes are ordered by their smallest node id, so the
+    # ranking does not depend on edge order (and needs no global node sort).
+    ranked.sort(key=lambda lbl: (-len(comps[lbl]), min(comps[lbl])))
 
     out: list[ComponentResult] = []
     k = max(0, int(top_k))
 
-    # Pre-group directed edges by component membership for efficiency.
-    for idx, comp_nodes in enumerate(comps[:k], start=1):
-        comp_set = set(comp_nodes)
-        directed_edges = [
-            e for e in edges if e.source in comp_set and e.target in comp_set
-        ]
+    # Group directed edges by component label in a single pass. Both endpoints
+    # of an edge always share a label, so the source label is enough.
+    comp_to_edges: dict[int, list[DirectedEdge]] = defaultdict(list)
+    for e, (a, _b) in zip(edges, pairs):
+        comp_to_edges[labels[a]].append(e)
+
+    for idx, label in enumerate(ranked[:k], start=1):
+        comp_nodes = comps[label]
+        directed_edges = comp_to_edges.get(label, [])
         out_deg = Counter(e.source for e in directed_edges)
         top_out = out_deg.most_common(20)
         out.append(
@@ -199,12 +240,21 @@ def extract_top_k_reference_components(
     return out
 
 
+def _dumps_indented(obj: dict) -> bytes:
+    """Serialize `obj` as 2-space indented UTF-8 JSON (orjson when installed)."""
+
+    try:
+        import orjson  # type: ignore[import]
+    except ImportError:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
 def _write_components(out_dir: Path, comps: list[ComponentResult]) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
     for comp in comps:
         path = out_dir / f"component_{comp.rank:03d}.json"
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(comp.to_json_dict(), f, ensure_ascii=False, indent=2)
+        path.write_bytes(_dumps_indented(comp.to_json_dict()))
 
 
 def _chunked(seq: list[str], n: int) -> Iterable[list[str]]:
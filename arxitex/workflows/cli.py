@@ -2,42 +2,76 @@ import argparse
 import asyncio
 import os
 import sqlite3
+import sys
 from pathlib import Path
 
 from loguru import logger
 
+from arxitex.arxiv_utils import is_arxiv_id
 from arxitex.db.error_utils import classify_processing_error
-from arxitex.extractor.pipeline import agenerate_artifact_graph
-from arxitex.llms.usage_context import llm_usage_context
-from arxitex.tools.backfill.backfill import run_backfill as run_citations_backfill
-from arxitex.tools.discovery_queue_dedup import dedup_discovery_queue
-from arxitex.workflows.discover import DiscoveryWorkflow
-from arxitex.workflows.processor import ProcessingWorkflow
+from arxitex.indices.discover import DiscoveryIndex
 from arxitex.workflows.runner import ArxivPipelineComponents
-from arxitex.workflows.utils import save_graph_data
+from arxitex.workflows.utils import run_async, save_graph_data
 
 os.environ["RICH_QUIET"] = "True"
 os.environ["TQDM_DISABLE"] = "1"
 
 
-async def process_single_paper(arxiv_id: str, args):
+# Processing is dominated by network and subprocess I/O (arXiv downloads,
+# LaTeX extraction, LLM calls), so the default concurrency is sized well above
+# the core count. Source downloads are capped separately by the downloader.
+def _default_workers() -> int:
+    """ARXITEX_MAX_WORKERS if it is a positive integer, else min(32, 5 * cores)."""
+    fallback = min(32, (os.cpu_count() or 1) * 5)
+    raw = os.getenv("ARXITEX_MAX_WORKERS")
+    if raw is None:
+        return fallback
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(
+            "Ignoring ARXITEX_MAX_WORKERS={!r}: expected a positive integer.", raw
+        )
+        return fallback
+    return value
+
+
+async def process_single_paper(
+    arxiv_id: str, args, components: ArxivPipelineComponents | None = None
+):
     """
     Handles a single paper by running the temporary download and processing logic.
+
+    ``components`` may be passed in to share one set of services across a batch.
     """
-    logger.info(f"Starting end-to-end processing for single paper: {arxiv_id}")
+    # Reject malformed IDs before any DB or network work.
+    if not is_arxiv_id(arxiv_id):
+        logger.error("Invalid arXiv ID: {!r}", arxiv_id)
+        return {"status": "failure", "arxiv_id": arxiv_id, "reason": "invalid_arxiv_id"}
 
-    components = ArxivPipelineComponents(output_dir=args.output_dir)
+    # Heavy imports (extractor pipeline, LLM stack) are deferred to the
+    # commands that need them so admin commands start quickly.
+    from arxitex.extractor.pipeline import agenerate_artifact_graph
+    from arxitex.llms.usage_context import llm_usage_context
+
+    logger.info("Starting end-to-end processing for single paper: {}", arxiv_id)
+
+    if components is None:
+        components = ArxivPipelineComponents(output_dir=args.output_dir)
 
     if not args.force and components.processing_index.is_successfully_processed(
         arxiv_id
     ):
         logger.warning(
-            f"Paper {arxiv_id} already successfully processed. Use --force to override."
+            "Paper {} already successfully processed. Use --force to override.",
+            arxiv_id,
         )
         return {"status": "skipped"}
 
     try:
-        temp_base_dir = Path(components.output_dir) / "temp_processing"
+        temp_base_dir = components.get_temp_dir()
 
         effective_enrich = args.enrich_content or args.semantic_tags
         # Single-paper runs should also be attributed for LLM usage tracking.
@@ -81,9 +115,8 @@ async def process_single_paper(arxiv_id: str, args):
             await tagger.tag_nodes(graph.nodes)
 
         graph_data = graph.to_dict(arxiv_id=arxiv_id)
-        graphs_output_dir = os.path.join(components.output_dir, "graphs")
-        os.makedirs(graphs_output_dir, exist_ok=True)
-        graph_filepath = save_graph_data(arxiv_id, graphs_output_dir, graph_data)
+        os.makedirs(components.graphs_dir, exist_ok=True)
+        graph_filepath = save_graph_data(arxiv_id, components.graphs_dir, graph_data)
 
         components.processing_index.update_processed_papers_status(
             arxiv_id,
@@ -92,12 +125,13 @@ async def process_single_paper(arxiv_id: str, args):
             stats=graph_data.get("stats", {}),
         )
         logger.info(
-            f"SUCCESS: Processed {arxiv_id} and saved graph to {graph_filepath}"
+            "SUCCESS: Processed {} and saved graph to {}", arxiv_id, graph_filepath
         )
         return {"status": "success"}
 
     except Exception as e:
         err = classify_processing_error(e)
+        details = err.to_details_dict()
         logger.error(
             f"End-to-end processing failed for {arxiv_id} "
             f"[{err.code} @ {err.stage}]: {err.message}",
@@ -106,83 +140,58 @@ async def process_single_paper(arxiv_id: str, args):
         components.processing_index.update_processed_papers_status(
             arxiv_id,
             status="failure",
-            **err.to_details_dict(),
+            **details,
         )
         return {
             "status": "failure",
             "arxiv_id": arxiv_id,
-            **err.to_details_dict(),
+            **details,
         }
 
 
-async def main():
-    """Parses command-line arguments and runs the selected workflow."""
-    script_path = Path(__file__).resolve()
-    project_root = script_path.parents[2]
-    default_output_dir = project_root / "pipeline_output"
-
-    parser = argparse.ArgumentParser(
-        description="ArxiTex: A pipeline for discovering and processing ArXiv papers.",
-        formatter_class=argparse.RawTextHelpFormatter,
-    )
+def _add_single_options(parser: argparse.ArgumentParser) -> None:
+    """Add the options shared by 'single' and 'single-batch'."""
     parser.add_argument(
-        "-o",
-        "--output-dir",
-        type=str,
-        default=str(default_output_dir),
-        help=f"Directory for all outputs (default: {default_output_dir})",
-    )
-    subparsers = parser.add_subparsers(
-        dest="command", required=True, help="Available commands"
-    )
-    # --- 'single' command ---
-    parser_single = subparsers.add_parser(
-        "single", help="Temporarily download and process a single paper by its ID."
-    )
-    parser_single.add_argument(
-        "arxiv_id", help="The arXiv ID to process (e.g., '2305.15334')."
-    )
-    parser_single.add_argument(
         "--enrich-content",
         action="store_true",
         help="Use LLM to find and synthesize term definitions.",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--infer-dependencies",
         action="store_true",
         help="Use LLM to infer dependencies between artifacts.",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--semantic-tags",
         action="store_true",
         help="Generate semantic tags for artifacts (requires content enrichment).",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--semantic-tag-model",
         type=str,
         default="gpt-5-mini-2025-08-07",
         help="LLM model for semantic tags.",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--semantic-tag-concurrency",
         type=int,
         default=4,
         help="Max concurrent LLM calls for semantic tags.",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--dependency-mode",
         type=str,
         choices=["pairwise", "global", "hybrid", "auto"],
         default="auto",
         help="Dependency inference mode when --infer-dependencies is enabled.",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--dependency-auto-max-tokens",
         type=int,
         default=12000,
         help="Auto-mode: max estimated tokens to allow global/hybrid.",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--dependency-max-pairs",
         type=int,
         default=100,
@@ -191,19 +200,53 @@ async def main():
             "per paper (applies to both hybrid and pairwise modes)."
         ),
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--dependency-global-proof-char-budget",
         type=int,
         default=1200,
         help="Global/Hybrid proposer: truncate each proof to this many chars.",
     )
-    parser_single.add_argument(
+    parser.add_argument(
         "--force",
         action="store_true",
         help="Force re-processing even if it's in the index.",
     )
 
-    # --- 'discover' command ---
+
+def _add_single_parser(subparsers) -> None:
+    """Register the 'single' subcommand."""
+    parser_single = subparsers.add_parser(
+        "single", help="Temporarily download and process a single paper by its ID."
+    )
+    parser_single.add_argument(
+        "arxiv_id", help="The arXiv ID to process (e.g., '2305.15334')."
+    )
+    _add_single_options(parser_single)
+    parser_single.set_defaults(func=_run_single)
+
+
+def _add_single_batch_parser(subparsers) -> None:
+    """Register the 'single-batch' subcommand."""
+    parser_batch = subparsers.add_parser(
+        "single-batch",
+        help=(
+            "Like 'single', for many papers: reads arXiv IDs from stdin (one per "
+            "line) and processes them concurrently in one run."
+        ),
+    )
+    parser_batch.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of papers processed concurrently.",
+    )
+    _add_single_options(parser_batch)
+    parser_batch.set_defaults(func=_run_single_batch)
+
+
+def _add_discover_parser(subparsers) -> None:
+    """Register the 'discover' subcommand."""
     parser_discover = subparsers.add_parser(
         "discover",
         help="Find new paper IDs from ArXiv and add them to the processing queue.",
@@ -229,73 +272,68 @@ async def main():
         default=100,
         help="Number of papers to fetch from the API in each batch.",
     )
+    parser_discover.set_defaults(func=_run_discover)
 
-    # --- 'process' command ---
-    parser_process = subparsers.add_parser(
-        "process",
-        help="Process papers from the queue (downloads temporarily to generate graphs).",
-    )
-    parser_process.add_argument(
-        "-n",
-        "--max-papers",
-        type=int,
-        default=50,
-        help="Maximum number of papers from the queue to process in this run.",
-    )
-    parser_process.add_argument(
+
+def _add_processing_options(parser: argparse.ArgumentParser) -> None:
+    """Add the processing options shared by 'process' and 'pipeline'."""
+    parser.add_argument(
         "-w",
         "--workers",
         type=int,
-        default=4,
-        help="Number of concurrent processing tasks (match to CPU cores).",
+        default=None,
+        help=(
+            "Number of papers in flight concurrently "
+            "(default: env ARXITEX_MAX_WORKERS, else min(32, 5 x CPU cores))."
+        ),
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--enrich-content",
         action="store_true",
         help="Use LLM to find and synthesize term definitions for papers in the batch.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--infer-dependencies",
         action="store_true",
         help="Use LLM to infer dependencies between artifacts for papers in the batch.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--semantic-tags",
         action="store_true",
         help="Generate semantic tags for artifacts (requires content enrichment).",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--semantic-tag-model",
         type=str,
         default="gpt-5-mini-2025-08-07",
         help="LLM model for semantic tags.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--semantic-tag-concurrency",
         type=int,
         default=4,
         help="Max concurrent LLM calls for semantic tags.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--dependency-mode",
         type=str,
         choices=["pairwise", "global", "hybrid", "auto"],
         default="auto",
         help="Dependency inference mode when infer-dependencies/full mode is enabled.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--dependency-auto-max-nodes",
         type=int,
         default=30,
         help="Auto-mode: max artifacts to allow global/hybrid.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--dependency-auto-max-tokens",
         type=int,
         default=12000,
         help="Auto-mode: max estimated tokens to allow global/hybrid.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--dependency-max-pairs",
         type=int,
         default=100,
@@ -304,33 +342,23 @@ async def main():
             "per paper (applies to both hybrid and pairwise modes)."
         ),
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--dependency-global-proof-char-budget",
         type=int,
         default=1200,
         help="Global/Hybrid proposer: truncate each proof to this many chars.",
     )
-    parser_process.add_argument(
-        "--min-citations",
-        type=int,
-        default=None,
-        help=(
-            "If set, restrict processing to papers with citation_count >= this value "
-            "(from paper_citations via OpenAlex). Papers are processed in descending "
-            "citation_count order with stable tiebreaks."
-        ),
-    )
-    parser_process.add_argument(
+    parser.add_argument(
         "--format-for-search",
         action="store_true",
         help="Additionally, transform and append artifacts to a .jsonl file.",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--persist-db",
         action="store_true",
         help="Persist normalized artifacts/edges/definitions into SQLite (arxitex_indices.db).",
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--save-graph",
         action="store_true",
         help=(
@@ -338,7 +366,7 @@ async def main():
             "By default, graphs are NOT saved when --persist-db is enabled."
         ),
     )
-    parser_process.add_argument(
+    parser.add_argument(
         "--mode",
         type=str,
         choices=["raw", "defs", "full"],
@@ -350,7 +378,70 @@ async def main():
         ),
     )
 
-    # --- 'reprocess-paper' command ---
+
+def _add_process_parser(subparsers) -> None:
+    """Register the 'process' subcommand."""
+    parser_process = subparsers.add_parser(
+        "process",
+        help="Process papers from the queue (downloads temporarily to generate graphs).",
+    )
+    parser_process.add_argument(
+        "-n",
+        "--max-papers",
+        type=int,
+        default=50,
+        help="Maximum number of papers from the queue to process in this run.",
+    )
+    _add_processing_options(parser_process)
+    parser_process.add_argument(
+        "--min-citations",
+        type=int,
+        default=None,
+        help=(
+            "If set, restrict processing to papers with citation_count >= this value "
+            "(from paper_citations via OpenAlex). Papers are processed in descending "
+            "citation_count order with stable tiebreaks."
+        ),
+    )
+    parser_process.set_defaults(func=_run_process)
+
+
+def _add_pipeline_parser(subparsers) -> None:
+    """Register the 'pipeline' subcommand."""
+    parser_pipeline = subparsers.add_parser(
+        "pipeline",
+        help=(
+            "Discover papers from ArXiv and process them as they are queued, "
+            "overlapping discovery with processing."
+        ),
+    )
+    parser_pipeline.add_argument(
+        "-q",
+        "--query",
+        type=str,
+        required=True,
+        help="ArXiv API search query (e.g., 'cat:math.GR').",
+    )
+    parser_pipeline.add_argument(
+        "-n",
+        "--max-papers",
+        type=int,
+        default=50,
+        help="Target number of new papers to discover and process in this run.",
+    )
+    parser_pipeline.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Number of papers to fetch from the API in each batch.",
+    )
+    _add_processing_options(parser_pipeline)
+    parser_pipeline.set_defaults(func=_run_pipeline)
+
+
+def _add_reprocess_paper_parser(subparsers) -> None:
+    """Register the 'reprocess-paper' subcommand."""
     parser_reprocess = subparsers.add_parser(
         "reprocess-paper",
         help=(
@@ -473,14 +564,26 @@ async def main():
     parser_reprocess.add_argument(
         "--reset-modes",
         nargs="*",
+        choices=["raw", "defs", "full"],
         default=None,
         help=(
             "Optional list of ingestion modes to reset in paper_ingestion_state "
             "(e.g. raw defs full). Default: reset all modes for that paper."
         ),
     )
+    parser_reprocess.add_argument(
+        "--refetch-metadata",
+        action="store_true",
+        help=(
+            "Fetch fresh arXiv metadata even if the paper is already in the "
+            "discovery queue, replacing the queued copy."
+        ),
+    )
+    parser_reprocess.set_defaults(func=_run_reprocess_paper)
+
 
-    # --- 'dedup-discovery-queue' command ---
+def _add_dedup_discovery_queue_parser(subparsers) -> None:
+    """Register the 'dedup-discovery-queue' subcommand."""
     parser_dedup = subparsers.add_parser(
         "dedup-discovery-queue",
         help=(
@@ -505,8 +608,11 @@ async def main():
         action="store_true",
         help="Print the specific arXiv IDs that were/would be deleted.",
     )
+    parser_dedup.set_defaults(func=_run_dedup_discovery_queue)
 
-    # --- 'backfill-citations' command ---
+
+def _add_backfill_citations_parser(subparsers) -> None:
+    """Register the 'backfill-citations' subcommand."""
     parser_citations = subparsers.add_parser(
         "backfill-citations",
         help=(
@@ -569,98 +675,252 @@ async def main():
             "Can be provided multiple times. Example: --paper-id 2207.12929"
         ),
     )
+    parser_citations.set_defaults(func=_run_backfill_citations)
 
-    args = parser.parse_args()
 
-    exit_code = 0
-    if args.command == "single":
-        result = await process_single_paper(args.arxiv_id, args)
-        if result.get("status") == "failure":
-            exit_code = 1
+_SUBCOMMANDS = {
+    "single": _add_single_parser,
+    "single-batch": _add_single_batch_parser,
+    "discover": _add_discover_parser,
+    "process": _add_process_parser,
+    "pipeline": _add_pipeline_parser,
+    "reprocess-paper": _add_reprocess_paper_parser,
+    "dedup-discovery-queue": _add_dedup_discovery_queue_parser,
+    "backfill-citations": _add_backfill_citations_parser,
+}
 
-    elif args.command == "discover":
-        components = ArxivPipelineComponents(output_dir=args.output_dir)
-        workflow = DiscoveryWorkflow(components)
-        await workflow.run(
-            search_query=args.query,
-            max_papers=args.max_papers,
-            batch_size=args.batch_size,
-        )
 
-    elif args.command == "process":
-        components = ArxivPipelineComponents(output_dir=args.output_dir)
+def _requested_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if it needs the full parser.
 
-        # Backwards compatibility: if the user still uses the old flags,
-        # auto-select an equivalent mode.
-        mode = args.mode
-        if args.infer_dependencies:
-            mode = "full"
-        elif (args.enrich_content or args.semantic_tags) and args.mode == "raw":
-            mode = "defs"
-
-        workflow = ProcessingWorkflow(
-            components=components,
-            enrich_content=args.enrich_content,
-            infer_dependencies=args.infer_dependencies,
-            max_concurrent_tasks=args.workers,
-            format_for_search=args.format_for_search,
-            save_graph=(False if args.persist_db else True) or bool(args.save_graph),
-            persist_db=args.persist_db,
-            mode=mode,
-            dependency_mode=args.dependency_mode,
-            dependency_config={
-                "auto_max_nodes_global": args.dependency_auto_max_nodes,
-                "auto_max_tokens_global": args.dependency_auto_max_tokens,
-                "max_total_pairs": args.dependency_max_pairs,
-                "global_include_proofs": True,
-                "global_proof_char_budget": args.dependency_global_proof_char_budget,
-            },
-            min_citations=args.min_citations,
-            semantic_tags=args.semantic_tags,
-            semantic_tag_model=args.semantic_tag_model,
-            semantic_tag_concurrency=args.semantic_tag_concurrency,
-        )
-        await workflow.run(max_papers=args.max_papers)
+    Only the root -o/--output-dir option can precede the command; root-level
+    help (or no recognisable command) falls back to building every subparser
+    so usage and error messages stay complete.
+    """
+    it = iter(argv)
+    for tok in it:
+        if tok in ("-o", "--output-dir"):
+            next(it, None)
+        elif tok in _SUBCOMMANDS:
+            return tok
+        elif not tok.startswith("-") or tok in ("-h", "--help"):
+            return None
+    return None
 
-    elif args.command == "reprocess-paper":
-        components = ArxivPipelineComponents(output_dir=args.output_dir)
-        db_path = components.db_path
 
-        logger.info(f"Resetting processed state for {args.arxiv_id} in {db_path}...")
-        conn = sqlite3.connect(db_path)
-        try:
-            cur = conn.cursor()
+def _build_parser(argv: list[str]) -> argparse.ArgumentParser:
+    """Build the CLI parser, registering only the subcommand argv asks for.
+
+    Each subcommand carries dozens of options, so constructing all of them on
+    every invocation is wasted work once the command is known.
+    """
+    script_path = Path(__file__).resolve()
+    project_root = script_path.parents[2]
+    default_output_dir = project_root / "pipeline_output"
+
+    parser = argparse.ArgumentParser(
+        description="ArxiTex: A pipeline for discovering and processing ArXiv papers.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=str,
+        default=str(default_output_dir),
+        help=f"Directory for all outputs (default: {default_output_dir})",
+    )
+    subparsers = parser.add_subparsers(
+        dest="command", required=True, help="Available commands"
+    )
+    command = _requested_command(argv)
+    for name, add_parser in _SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_parser(subparsers)
+    return parser
+
 
-            # Clear processed_papers status
+def _reset_paper_state(
+    conn: sqlite3.Connection,
+    arxiv_id: str,
+    reset_modes: list[str] | None,
+    discovery_index: DiscoveryIndex | None = None,
+    paper: dict | None = None,
+    replace_metadata: bool = False,
+) -> int:
+    """Clear a paper's processed status and ingestion state in one transaction.
+
+    ``conn`` is expected in autocommit mode (see
+    ``ArxivPipelineComponents.get_connection``); the reset takes the write lock
+    up front with BEGIN IMMEDIATE and commits once. If ``paper`` is given it is
+    queued in ``discovery_index`` within the same transaction, replacing any
+    queued metadata when ``replace_metadata`` is set.
+
+    Returns the number of papers newly added to the discovery queue.
+    """
+    try:
+        cur = conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+
+        # Clear processed_papers status
+        cur.execute(
+            "DELETE FROM processed_papers WHERE arxiv_id = ?",
+            (arxiv_id,),
+        )
+
+        # Clear ingestion state for this paper (optionally per-mode)
+        if reset_modes:
+            # One fixed statement, prepared once and re-bound per mode.
+            cur.executemany(
+                "DELETE FROM paper_ingestion_state WHERE paper_id = ? AND mode = ?",
+                [(arxiv_id, mode) for mode in sorted(set(reset_modes))],
+            )
+        else:
             cur.execute(
-                "DELETE FROM processed_papers WHERE arxiv_id = ?",
-                (args.arxiv_id,),
+                "DELETE FROM paper_ingestion_state WHERE paper_id = ?",
+                (arxiv_id,),
             )
 
-            # Clear ingestion state for this paper (optionally per-mode)
-            if args.reset_modes:
-                placeholders = ",".join("?" * len(args.reset_modes))
-                sql = (
-                    "DELETE FROM paper_ingestion_state "
-                    "WHERE paper_id = ? AND mode IN (" + placeholders + ")"
-                )
-                cur.execute(sql, (args.arxiv_id, *args.reset_modes))
-            else:
-                cur.execute(
-                    "DELETE FROM paper_ingestion_state WHERE paper_id = ?",
-                    (args.arxiv_id,),
-                )
-
-            conn.commit()
+        added_count = 0
+        if paper is not None and discovery_index is not None:
+            added_count = discovery_index.add_papers(
+                [paper], conn=conn, replace=replace_metadata
+            )
+
+        conn.commit()
+        return added_count
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _build_processing_workflow(components: ArxivPipelineComponents, args):
+    """Build the ProcessingWorkflow shared by 'process' and 'reprocess-paper'."""
+    from arxitex.workflows.processor import ProcessingWorkflow
+
+    # Backwards compatibility: if the user still uses the old flags,
+    # auto-select an equivalent mode.
+    mode = args.mode
+    if args.infer_dependencies:
+        mode = "full"
+    elif (args.enrich_content or args.semantic_tags) and args.mode == "raw":
+        mode = "defs"
+
+    # Resolved here rather than at import time, so a bad ARXITEX_MAX_WORKERS is
+    # logged through the configured sink and only by commands that use it.
+    workers = args.workers if args.workers is not None else _default_workers()
+
+    return ProcessingWorkflow(
+        components=components,
+        enrich_content=args.enrich_content,
+        infer_dependencies=args.infer_dependencies,
+        max_concurrent_tasks=workers,
+        format_for_search=args.format_for_search,
+        # Graphs are saved by default, but not when persisting to the DB
+        # unless explicitly requested.
+        save_graph=bool(args.save_graph) or not args.persist_db,
+        persist_db=args.persist_db,
+        mode=mode,
+        dependency_mode=args.dependency_mode,
+        dependency_config={
+            "auto_max_nodes_global": args.dependency_auto_max_nodes,
+            "auto_max_tokens_global": args.dependency_auto_max_tokens,
+            "max_total_pairs": args.dependency_max_pairs,
+            "global_include_proofs": True,
+            "global_proof_char_budget": args.dependency_global_proof_char_budget,
+        },
+        # Only the 'process' command exposes --min-citations.
+        min_citations=getattr(args, "min_citations", None),
+        semantic_tags=args.semantic_tags,
+        semantic_tag_model=args.semantic_tag_model,
+        semantic_tag_concurrency=args.semantic_tag_concurrency,
+    )
+
+
+async def _run_single(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'single' subcommand."""
+    result = await process_single_paper(args.arxiv_id, args, components)
+    return 1 if result.get("status") == "failure" else 0
+
+
+async def _run_single_batch(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'single-batch' subcommand."""
+    # Blank lines and duplicate IDs are ignored.
+    arxiv_ids = list(dict.fromkeys(line.strip() for line in sys.stdin))
+    arxiv_ids = [aid for aid in arxiv_ids if aid]
+    semaphore = asyncio.Semaphore(max(1, args.workers))
+
+    async def process_one(arxiv_id: str) -> dict:
+        async with semaphore:
+            return await process_single_paper(arxiv_id, args, components)
+
+    results = await asyncio.gather(*(process_one(aid) for aid in arxiv_ids))
+    return 1 if any(r.get("status") == "failure" for r in results) else 0
+
+
+async def _run_discover(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'discover' subcommand."""
+    from arxitex.workflows.discover import DiscoveryWorkflow
+
+    workflow = DiscoveryWorkflow(components)
+    await workflow.run(
+        search_query=args.query,
+        max_papers=args.max_papers,
+        batch_size=args.batch_size,
+    )
+    return 0
+
+
+async def _run_process(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'process' subcommand."""
+    workflow = _build_processing_workflow(components, args)
+    await workflow.run(max_papers=args.max_papers)
+    return 0
+
+
+async def _run_pipeline(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'pipeline' subcommand."""
+    from arxitex.workflows.discover import DiscoveryWorkflow
+
+    # Bounded so discovery cannot run arbitrarily far ahead of processing.
+    paper_queue: asyncio.Queue = asyncio.Queue(maxsize=args.batch_size * 2)
+    discovery = DiscoveryWorkflow(components, paper_queue=paper_queue)
+    workflow = _build_processing_workflow(components, args)
+
+    async def discover_then_close():
+        try:
+            await discovery.run(
+                search_query=args.query,
+                max_papers=args.max_papers,
+                batch_size=args.batch_size,
+            )
         finally:
-            conn.close()
+            await paper_queue.put(None)
 
-        # Re-discover this paper by ID and add it to the discovery queue
+    await asyncio.gather(discover_then_close(), workflow.run_from_queue(paper_queue))
+    return 0
+
+
+async def _run_reprocess_paper(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'reprocess-paper' subcommand."""
+    if not is_arxiv_id(args.arxiv_id):
+        logger.error("Invalid arXiv ID: {!r}", args.arxiv_id)
+        return 1
+
+    # Re-discover this paper by ID so it can be queued together with the
+    # reset. If it is already queued under this exact ID, skip the arXiv
+    # round-trip and reuse the queued metadata unless asked to refresh it.
+    paper = None
+    if not args.refetch_metadata and args.arxiv_id in components.discovery_index:
+        logger.info(
+            f"Paper {args.arxiv_id} is already in the discovery queue; proceeding to process."
+        )
+    else:
         search_query = f"id:{args.arxiv_id}"
         logger.info(f"Fetching metadata from ArXiv for {args.arxiv_id}...")
 
-        response_text = components.arxiv_api.fetch_papers(
-            search_query, start=0, batch_size=1
+        # Blocking HTTP (with retry sleeps); keep it off the event loop.
+        response_text = await asyncio.to_thread(
+            components.arxiv_api.fetch_papers, search_query, 0, 1
         )
         if not response_text:
             logger.error(f"No response from ArXiv for {search_query}.")
@@ -678,80 +938,107 @@ async def main():
             logger.error(f"Failed to parse ArXiv entry for {args.arxiv_id}.")
             return 1
 
-        added_count = components.discovery_index.add_papers([paper])
-        if added_count == 0:
+    logger.info(
+        f"Resetting processed state for {args.arxiv_id} in {components.db_path}..."
+    )
+    added_count = _reset_paper_state(
+        components.get_connection(),
+        args.arxiv_id,
+        args.reset_modes,
+        discovery_index=components.discovery_index,
+        paper=paper,
+        replace_metadata=args.refetch_metadata,
+    )
+    if paper is not None:
+        if added_count:
+            logger.info(f"Added {args.arxiv_id} to discovery queue.")
+        elif args.refetch_metadata:
             logger.info(
-                f"Paper {args.arxiv_id} was already in the discovery queue; proceeding to process."
+                f"Refreshed queued metadata for {args.arxiv_id}; proceeding to process."
             )
         else:
-            logger.info(f"Added {args.arxiv_id} to discovery queue.")
+            logger.info(
+                f"Paper {args.arxiv_id} was already in the discovery queue; proceeding to process."
+            )
 
-        # Derive effective mode with backwards-compat flags like the 'process' command
-        mode = args.mode
-        if args.infer_dependencies:
-            mode = "full"
-        elif (args.enrich_content or args.semantic_tags) and args.mode == "raw":
-            mode = "defs"
-
-        workflow = ProcessingWorkflow(
-            components=components,
-            enrich_content=args.enrich_content,
-            infer_dependencies=args.infer_dependencies,
-            max_concurrent_tasks=args.workers,
-            format_for_search=args.format_for_search,
-            save_graph=(False if args.persist_db else True) or bool(args.save_graph),
-            persist_db=args.persist_db,
-            mode=mode,
-            dependency_mode=args.dependency_mode,
-            dependency_config={
-                "auto_max_nodes_global": args.dependency_auto_max_nodes,
-                "auto_max_tokens_global": args.dependency_auto_max_tokens,
-                "max_total_pairs": args.dependency_max_pairs,
-                "global_include_proofs": True,
-                "global_proof_char_budget": args.dependency_global_proof_char_budget,
-            },
-            semantic_tags=args.semantic_tags,
-            semantic_tag_model=args.semantic_tag_model,
-            semantic_tag_concurrency=args.semantic_tag_concurrency,
-        )
-        # When reprocessing, restrict the workflow to the specific paper ID so
-        # we don't accidentally pick the first pending paper from the queue.
-        await workflow.run(max_papers=1, target_arxiv_id=args.arxiv_id)
+    workflow = _build_processing_workflow(components, args)
+    # When reprocessing, restrict the workflow to the specific paper ID so
+    # we don't accidentally pick the first pending paper from the queue.
+    await workflow.run(max_papers=1, target_arxiv_id=args.arxiv_id)
+    return 0
 
-    elif args.command == "dedup-discovery-queue":
-        components = ArxivPipelineComponents(output_dir=args.output_dir)
-        report = dedup_discovery_queue(
-            components.db_path,
-            dry_run=bool(args.dry_run),
-            make_backup=not bool(args.no_backup),
-        )
 
-        logger.info(
-            "Discovery queue dedup report: "
-            f"rows_before={report.rows_before}, "
-            f"base_dupes_before={report.base_ids_duplicated_before}, "
-            f"rows_to_delete={report.rows_to_delete}, "
-            f"rows_deleted={report.rows_deleted}, "
-            f"base_dupes_after={report.base_ids_duplicated_after}, "
-            f"backup={report.backup_path}"
-        )
-        if args.show_ids:
-            for aid in report.deleted_arxiv_ids:
-                logger.info(f"delete: {aid}")
+async def _run_dedup_discovery_queue(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'dedup-discovery-queue' subcommand."""
+    from arxitex.tools.discovery_queue_dedup import dedup_discovery_queue
 
-    elif args.command == "backfill-citations":
-        # Reuse the pipeline output dir DB.
-        # The implementation reads IDs from discovered_papers / processed_papers / papers.
-        args.db_path = str(Path(args.output_dir) / "arxitex_indices.db")
-        exit_code = await run_citations_backfill(args)
+    report = dedup_discovery_queue(
+        components.db_path,
+        dry_run=bool(args.dry_run),
+        make_backup=not bool(args.no_backup),
+    )
+
+    logger.info(
+        "Discovery queue dedup report: "
+        f"rows_before={report.rows_before}, "
+        f"base_dupes_before={report.base_ids_duplicated_before}, "
+        f"rows_to_delete={report.rows_to_delete}, "
+        f"rows_deleted={report.rows_deleted}, "
+        f"base_dupes_after={report.base_ids_duplicated_after}, "
+        f"backup={report.backup_path}"
+    )
+    if args.show_ids:
+        for aid in report.deleted_arxiv_ids:
+            logger.info(f"delete: {aid}")
+    return 0
+
+
+async def _run_backfill_citations(args, components: ArxivPipelineComponents) -> int:
+    """Run the 'backfill-citations' subcommand."""
+    from arxitex.tools.backfill.backfill import run_backfill as run_citations_backfill
+
+    # Reuse the pipeline output dir DB.
+    # The implementation reads IDs from discovered_papers / processed_papers / papers.
+    args.db_path = components.db_path
+    return await run_citations_backfill(args)
+
+
+async def main():
+    """Parses command-line arguments and runs the selected workflow."""
+    argv = sys.argv[1:]
+    args = _build_parser(argv).parse_args(argv)
+
+    # One set of shared services (indices, API client, DB connection) per run.
+    components = ArxivPipelineComponents(output_dir=args.output_dir)
+
+    exit_code = await args.func(args, components)
 
     logger.info(f"Command '{args.command}' has completed.")
     return exit_code
 
 
+def _configure_logging() -> None:
+    """Log to stderr at ARXITEX_LOG_LEVEL (default INFO).
+
+    enqueue=True hands formatting and writes to a background thread, so per-paper
+    log lines do not block the event loop. Drained by `cli_main`.
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=os.environ.get("ARXITEX_LOG_LEVEL", "INFO").upper(),
+        enqueue=True,
+    )
+
+
 def cli_main():
     """Synchronous wrapper for setuptools console_scripts entry point."""
-    return asyncio.run(main())
+    _configure_logging()
+    try:
+        return run_async(main())
+    finally:
+        # Flush queued log messages before the process exits.
+        logger.complete()
 
 
 if __name__ == "__main__":
@@ -11,26 +11,51 @@ class DiscoveryWorkflow(AsyncArxivWorkflowRunner):
     DiscoveryIndex queue for later processing.
     """
 
+    def __init__(self, components, **kwargs):
+        super().__init__(components, **kwargs)
+        # Optional asyncio.Queue that newly queued papers are also pushed to,
+        # so a concurrent consumer can process them as they are discovered.
+        self.paper_queue = kwargs.get("paper_queue")
+
     async def _process_single_item(self, item: dict) -> dict:
-        arxiv_id = item.get("arxiv_id")
-        if not arxiv_id:
-            return {"status": "failure", "reason": "item_missing_arxiv_id"}
+        return (await self._queue_papers([item]))[0]
+
+    async def _process_batch(self, papers, semaphore):
+        # Queue the whole fetched batch in one transaction instead of one per paper.
+        return await self._queue_papers(papers)
 
-        newly_added_count = await asyncio.to_thread(
-            self.components.discovery_index.add_papers, [item]
+    async def _queue_papers(self, items: list) -> list:
+        newly_added = set(
+            await asyncio.to_thread(
+                self.components.discovery_index.add_new_papers, items
+            )
         )
 
-        if newly_added_count > 0:
-            logger.debug(f"Added new ID to discovery queue: {arxiv_id}")
-            return {
-                "status": "success",
-                "arxiv_id": arxiv_id,
-                "action": "added_to_queue",
-            }
-        else:
-            logger.debug(f"{arxiv_id} was already in the discovery queue.")
-            return {
-                "status": "skipped",
-                "arxiv_id": arxiv_id,
-                "reason": "already_in_queue",
-            }
+        results = []
+        for item in items:
+            arxiv_id = item.get("arxiv_id")
+            if not arxiv_id:
+                results.append({"status": "failure", "reason": "item_missing_arxiv_id"})
+            elif arxiv_id in newly_added:
+                # Only the first occurrence of a repeated ID counts as added.
+                newly_added.discard(arxiv_id)
+                logger.debug("Added new ID to discovery queue: {}", arxiv_id)
+                if self.paper_queue is not None:
+                    await self.paper_queue.put(item)
+                results.append(
+                    {
+                        "status": "success",
+                        "arxiv_id": arxiv_id,
+                        "action": "added_to_queue",
+                    }
+                )
+            else:
+                logger.debug("{} was already in the discovery queue.", arxiv_id)
+                results.append(
+                    {
+                        "status": "skipped",
+                        "arxiv_id": arxiv_id,
+                        "reason": "already_in_queue",
+                    }
+                )
+        return results
@@ -5,6 +5,9 @@ from loguru import logger
 from arxitex.downloaders.async_downloader import AsyncSourceDownloader
 from arxitex.workflows.runner import ArxivPipelineComponents, AsyncArxivWorkflowRunner
 
+# Downloader errors can embed long HTTP bodies; keep the stored reason bounded.
+_MAX_REASON_CHARS = 2048
+
 
 class DownloaderWorkflow(AsyncArxivWorkflowRunner):
     """
@@ -18,25 +21,34 @@ class DownloaderWorkflow(AsyncArxivWorkflowRunner):
         max_concurrent_tasks: int = 20,
         force: bool = False,
     ):
-        super().__init__(components, max_concurrent_tasks, force)
+        super().__init__(
+            components, max_concurrent_tasks=max_concurrent_tasks, force=force
+        )
         self.source_cache_dir = os.path.join(self.components.output_dir, "source_files")
         os.makedirs(self.source_cache_dir, exist_ok=True)
+        # One downloader (and HTTP client) shared by every paper in a run, so
+        # connections to arXiv are kept alive and pooled.
+        self._downloader = AsyncSourceDownloader(cache_dir=self.source_cache_dir)
+
+    async def run(self, *args, **kwargs):
+        """Runs the workflow with the shared source downloader opened once."""
+        async with self._downloader:
+            await super().run(*args, **kwargs)
 
     async def _process_single_item(self, item: dict) -> dict:
         arxiv_id = item["arxiv_id"]
 
         try:
-            async with AsyncSourceDownloader(
-                cache_dir=self.persistent_source_dir
-            ) as downloader:
-                extracted_path = await downloader.download_and_extract_source(arxiv_id)
+            extracted_path = await self._downloader.download_and_extract_source(
+                arxiv_id
+            )
 
             self.components.processing_index.update_processed_papers_status(
                 arxiv_id, status="downloaded", source_path=str(extracted_path)
             )
 
             logger.info(
-                f"SUCCESS: Downloaded source for {arxiv_id} to {extracted_path}"
+                "SUCCESS: Downloaded source for {} to {}", arxiv_id, extracted_path
             )
 
             return {
@@ -45,10 +57,13 @@ class DownloaderWorkflow(AsyncArxivWorkflowRunner):
                 "source_path": str(extracted_path),
             }
         except Exception as e:
+            # Record the failure once here and report it as a result; re-raising
+            # would make the runner overwrite it with a generic failure row.
+            reason = str(e)[:_MAX_REASON_CHARS]
             self.components.processing_index.update_processed_papers_status(
-                arxiv_id, status="download_failed", reason=str(e)
+                arxiv_id, status="download_failed", reason=reason
             )
-            raise e
+            return {"status": "failure", "arxiv_id": arxiv_id, "reason": reason}
 
 
 # python run_downloader.py --query "cat:cs.AI AND all:conjecture" --max-papers 100
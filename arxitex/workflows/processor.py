@@ -1,9 +1,7 @@
 import asyncio
 import json
 import os
-import sqlite3
 from datetime import datetime, timezone
-from pathlib import Path
 
 from filelock import FileLock
 from loguru import logger
@@ -15,6 +13,21 @@ from arxitex.llms.usage_context import llm_usage_context
 from arxitex.workflows.runner import ArxivPipelineComponents, AsyncWorkflowRunnerBase
 from arxitex.workflows.utils import save_graph_data, transform_graph_to_search_format
 
+# Bounds the documents waiting on a category's writer; producers block (and so
+# slow down) rather than buffer without limit if the disk falls behind.
+_SEARCH_QUEUE_MAXSIZE = 64
+
+
+def _append_locked(f, lock: FileLock, lines: str) -> None:
+    """Append ``lines`` to ``f`` under ``lock``, flushing before releasing it.
+
+    The FileLock guards against other processes sharing the output dir; the
+    flush makes each call land as one complete append.
+    """
+    with lock:
+        f.write(lines)
+        f.flush()
+
 
 class ProcessingWorkflow(AsyncWorkflowRunnerBase):
     """
@@ -57,7 +70,7 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
         self.semantic_tag_model = semantic_tag_model
         self.semantic_tag_concurrency = semantic_tag_concurrency
 
-        self.graphs_base_dir = os.path.join(self.components.output_dir, "graphs")
+        self.graphs_base_dir = self.components.graphs_dir
         self.search_indices_base_dir = os.path.join(
             self.components.output_dir, "search_indices"
         )
@@ -68,6 +81,10 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
         if self.format_for_search:
             os.makedirs(self.search_indices_base_dir, exist_ok=True)
 
+        # Per-category search-index writers, started on first use in a run.
+        self._search_queues: dict[str, asyncio.Queue] = {}
+        self._search_writers: dict[str, asyncio.Task] = {}
+
     async def run(self, max_papers: int, target_arxiv_id: str | None = None):
         """Find and process papers from the discovery queue.
 
@@ -144,7 +161,8 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
 
             if self.components.processing_index.is_successfully_processed(arxiv_id):
                 logger.debug(
-                    f"Skipping {arxiv_id}: already successfully processed. Removing from discovery queue."
+                    "Skipping {}: already successfully processed. Removing from discovery queue.",
+                    arxiv_id,
                 )
                 self.components.discovery_index.remove_paper(arxiv_id)
                 continue
@@ -171,12 +189,169 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
             for paper in papers_to_process
         ]
 
-        batch_results = await asyncio.gather(*tasks)
+        try:
+            batch_results = await asyncio.gather(*tasks)
+        finally:
+            await self._close_search_writers()
         self.results.extend(filter(None, batch_results))
 
         self._write_summary_report()
         logger.info("Processing workflow finished.")
 
+    async def run_from_queue(self, paper_queue: asyncio.Queue) -> None:
+        """Process papers as a producer puts them on ``paper_queue``.
+
+        Used by the ``pipeline`` command so processing overlaps with discovery.
+        Runs ``max_concurrent_tasks`` consumers until the producer puts ``None``
+        on the queue; a bounded queue therefore also throttles the producer.
+        """
+        logger.info("Starting 'processing' workflow from the discovery stream...")
+        semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
+
+        async def consume():
+            while True:
+                paper = await paper_queue.get()
+                if paper is None:
+                    # Pass the sentinel on so sibling consumers stop too.
+                    await paper_queue.put(None)
+                    return
+
+                arxiv_id = paper["arxiv_id"]
+                if self.components.processing_index.is_successfully_processed(arxiv_id):
+                    logger.debug(
+                        "Skipping {}: already successfully processed.", arxiv_id
+                    )
+                    self.components.discovery_index.remove_paper(arxiv_id)
+                    continue
+
+                result = await self._process_and_handle_paper(paper, semaphore)
+                if result:
+                    self.results.append(result)
+
+        try:
+            # A TaskGroup cancels and awaits the sibling consumers if one fails,
+            # so none is still enqueueing search docs when the writers close.
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(self.max_concurrent_tasks):
+                    tg.create_task(consume())
+        finally:
+            await self._close_search_writers()
+
+        self._write_summary_report()
+        logger.info("Processing workflow finished.")
+
+    async def _enqueue_search_docs(self, category: str, docs: list[dict]) -> None:
+        """Append a paper's search documents via its category's writer task.
+
+        Returns once the documents are flushed to ``{category}.jsonl``; a failed
+        write is raised here so the paper is recorded as a failure rather than
+        a success whose documents never reached disk.
+        """
+        queue = self._search_queues.get(category)
+        if queue is None:
+            queue = self._search_queues[category] = asyncio.Queue(
+                maxsize=_SEARCH_QUEUE_MAXSIZE
+            )
+            self._search_writers[category] = asyncio.create_task(
+                self._search_writer(category, queue)
+            )
+        writer = self._search_writers[category]
+        if writer.done():
+            raise RuntimeError(f"Search index writer for {category} is not running.")
+
+        written = asyncio.get_running_loop().create_future()
+        await queue.put(("".join(json.dumps(doc) + "\n" for doc in docs), written))
+        # Also wake up if the writer stops before reaching this item.
+        await asyncio.wait({written, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if not written.done():
+            raise RuntimeError(f"Search index writer for {category} stopped.")
+        written.result()
+
+    async def _search_writer(self, category: str, queue: asyncio.Queue) -> None:
+        """Append queued lines to ``{category}.jsonl``, one locked write per drain.
+
+        Each queued item carries a future that is resolved once its lines are
+        flushed, or failed with the write error. Runs until
+        ``_close_search_writers`` puts ``None`` on the queue.
+        """
+        search_index_path = os.path.join(
+            self.search_indices_base_dir, f"{category}.jsonl"
+        )
+        lock = FileLock(
+            os.path.join(self.search_indices_base_dir, f"{category}.jsonl.lock")
+        )
+
+        # Opened once for the whole run; append mode keeps every write at the
+        # end of the file even if another process appended in between.
+        f = None
+        batch = []
+        try:
+            done = False
+            while not done:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                done = None in batch
+                batch = [item for item in batch if item is not None]
+                if not batch:
+                    continue
+
+                try:
+                    if f is None:
+                        f = open(
+                            search_index_path, "a", encoding="utf-8", buffering=1 << 20
+                        )
+                    # Waiting on another process's lock (and the disk write)
+                    # happens in a worker thread so other papers keep running.
+                    await asyncio.to_thread(
+                        _append_locked, f, lock, "".join(lines for lines, _ in batch)
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to append to search index for category {category}: {e}"
+                    )
+                    # Reopen on the next drain rather than reuse a handle whose
+                    # buffer may hold a partial write.
+                    if f is not None:
+                        f.close()
+                        f = None
+                    for _, written in batch:
+                        if not written.done():
+                            written.set_exception(e)
+                else:
+                    for _, written in batch:
+                        if not written.done():
+                            written.set_result(None)
+                batch = []
+        finally:
+            # Never leave a paper waiting on a writer that has stopped.
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is not None:
+                    batch.append(item)
+            for _, written in batch:
+                if not written.done():
+                    written.set_exception(
+                        RuntimeError(f"Search index writer for {category} stopped.")
+                    )
+            if f is not None:
+                f.close()
+
+    async def _close_search_writers(self) -> None:
+        """Stop this run's search-index writers once their queues are drained."""
+        for queue in self._search_queues.values():
+            await queue.put(None)
+        results = await asyncio.gather(
+            *self._search_writers.values(), return_exceptions=True
+        )
+        for category, result in zip(self._search_writers, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Search index writer for category {category} failed: {result}"
+                )
+        self._search_queues.clear()
+        self._search_writers.clear()
+
     def _write_summary_report(self):
         """Categorize results and write a summary report for this processing run.
 
@@ -229,69 +404,64 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
         if self.min_citations is None:
             return self.components.discovery_index.get_pending_papers()
 
-        db_path = self.components.db_path
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self.components.get_connection()
 
-        try:
-            # 1) Map base_id -> best metadata from the discovery queue.
-            cur = conn.execute("SELECT arxiv_id, metadata FROM discovered_papers")
-            best_meta_by_base: dict[str, dict] = {}
-            for row in cur:
-                arxiv_id = row["arxiv_id"]
-                base_id = normalize_arxiv_id(arxiv_id)
-
-                try:
-                    meta = json.loads(row["metadata"])
-                except Exception:
-                    continue
+        # 1) Map base_id -> best metadata from the discovery queue.
+        cur = conn.execute("SELECT arxiv_id, metadata FROM discovered_papers")
+        best_meta_by_base: dict[str, dict] = {}
+        for row in cur:
+            arxiv_id = row["arxiv_id"]
+            base_id = normalize_arxiv_id(arxiv_id)
 
-                prev = best_meta_by_base.get(base_id)
-                # Prefer the highest arxiv_id string for that base_id
-                if prev is None or arxiv_id > prev.get("arxiv_id", ""):
-                    best_meta_by_base[base_id] = meta
+            try:
+                meta = json.loads(row["metadata"])
+            except Exception:
+                continue
 
-            # 2) Collect successfully processed arxiv_ids to skip on resume.
-            processed_ok: set[str] = set()
-            cur = conn.execute(
-                "SELECT arxiv_id, status FROM processed_papers WHERE status LIKE 'success%'"
-            )
-            for row in cur:
-                processed_ok.add(row["arxiv_id"])
+            prev = best_meta_by_base.get(base_id)
+            # Prefer the highest arxiv_id string for that base_id
+            if prev is None or arxiv_id > prev.get("arxiv_id", ""):
+                best_meta_by_base[base_id] = meta
 
-            # 3) Walk citation records in global order, filtering by min_citations.
-            cur = conn.execute(
-                """
-                SELECT paper_id AS base_id, citation_count
-                FROM paper_citations
-                WHERE citation_count >= ?
-                ORDER BY citation_count DESC, paper_id ASC
-                """,
-                (self.min_citations,),
-            )
+        # 2) Collect successfully processed arxiv_ids to skip on resume.
+        processed_ok: set[str] = set()
+        cur = conn.execute(
+            "SELECT arxiv_id, status FROM processed_papers WHERE status LIKE 'success%'"
+        )
+        for row in cur:
+            processed_ok.add(row["arxiv_id"])
+
+        # 3) Walk citation records in global order, filtering by min_citations.
+        cur = conn.execute(
+            """
+            SELECT paper_id AS base_id, citation_count
+            FROM paper_citations
+            WHERE citation_count >= ?
+            ORDER BY citation_count DESC, paper_id ASC
+            """,
+            (self.min_citations,),
+        )
 
-            ordered: list[dict] = []
-            for row in cur:
-                base_id = row["base_id"]
-                meta = best_meta_by_base.get(base_id)
-                if not meta:
-                    # Paper has citations but is not currently in the discovery queue.
-                    continue
+        ordered: list[dict] = []
+        for row in cur:
+            base_id = row["base_id"]
+            meta = best_meta_by_base.get(base_id)
+            if not meta:
+                # Paper has citations but is not currently in the discovery queue.
+                continue
 
-                arxiv_id = meta.get("arxiv_id")
-                if arxiv_id in processed_ok:
-                    # Already successfully processed in a prior run.
-                    continue
+            arxiv_id = meta.get("arxiv_id")
+            if arxiv_id in processed_ok:
+                # Already successfully processed in a prior run.
+                continue
 
-                ordered.append(meta)
+            ordered.append(meta)
 
-            logger.info(
-                f"Citation-filtered pending papers: {len(ordered)} with citation_count >= {self.min_citations}"
-            )
+        logger.info(
+            f"Citation-filtered pending papers: {len(ordered)} with citation_count >= {self.min_citations}"
+        )
 
-            return ordered
-        finally:
-            conn.close()
+        return ordered
 
     def _get_retry_priority_arxiv_ids(self, reason_code: str) -> set[str]:
         """Return arxiv_ids that should be prioritized for retry.
@@ -306,9 +476,7 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
         if not reason_code:
             return set()
 
-        db_path = self.components.db_path
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self.components.get_connection()
         try:
             # "details" is stored as a JSON string. We match either the raw
             # code or a JSON-ish fragment; this is deliberately tolerant.
@@ -326,8 +494,6 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
         except Exception:
             # Best-effort: if schema missing or DB unavailable, don't block.
             return set()
-        finally:
-            conn.close()
 
     async def _process_single_item(self, item: dict) -> dict:
         """
@@ -349,8 +515,7 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
         )
 
         try:
-            temp_base_dir = Path(self.components.output_dir) / "temp_processing"
-            os.makedirs(temp_base_dir, exist_ok=True)
+            temp_base_dir = self.components.get_temp_dir()
 
             # Mode drives whether we use LLM features.
             if self.mode == "raw":
@@ -422,17 +587,7 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
                 )
 
                 if searchable_artifacts:
-                    search_index_path = os.path.join(
-                        self.search_indices_base_dir, f"{category}.jsonl"
-                    )
-                    lock_path = os.path.join(
-                        self.search_indices_base_dir, f"{category}.jsonl.lock"
-                    )
-
-                    with FileLock(lock_path):
-                        with open(search_index_path, "a", encoding="utf-8") as f:
-                            for artifact_doc in searchable_artifacts:
-                                f.write(json.dumps(artifact_doc) + "\n")
+                    await self._enqueue_search_docs(category, searchable_artifacts)
                     logger.success(
                         f"Appended {len(searchable_artifacts)} artifacts from {arxiv_id} to search index."
                     )
@@ -470,13 +625,14 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
 
         except Exception as e:
             err = classify_processing_error(e)
+            details = err.to_details_dict()
             # Special-case: empty/invalid graphs are considered non-retryable.
             if err.code == "graph_empty":
                 # Record as a skipped outcome in processed_papers for auditing.
                 self.components.processing_index.update_processed_papers_status(
                     arxiv_id,
                     status="skipped_graph_empty",
-                    **err.to_details_dict(),
+                    **details,
                 )
 
                 # Remove from discovery queue and add to skipped index so we
@@ -507,14 +663,14 @@ class ProcessingWorkflow(AsyncWorkflowRunnerBase):
                 return {
                     "status": "skipped",
                     "arxiv_id": arxiv_id,
-                    **err.to_details_dict(),
+                    **details,
                 }
 
             # Default: treat as retryable failure and leave in discovery queue.
             self.components.processing_index.update_processed_papers_status(
                 arxiv_id,
                 status="failure",
-                **err.to_details_dict(),
+                **details,
             )
             logger.error(
                 f"FAILURE processing {arxiv_id} [{err.code} @ {err.stage}]: {err.message}. "
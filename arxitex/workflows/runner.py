@@ -1,15 +1,19 @@
 import abc
 import asyncio
+import atexit
 import calendar
 import json
 import os
 import re
+import sqlite3
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from arxitex.arxiv_api import ArxivAPI
+from arxitex.db.connection import connect, tune_for_bulk
 from arxitex.db.error_utils import classify_processing_error
 from arxitex.indices.discover import DiscoveryIndex
 from arxitex.indices.processed import ProcessedIndex
@@ -26,6 +30,9 @@ class ArxivPipelineComponents:
         self.output_dir = os.path.abspath(output_dir)
         os.makedirs(self.output_dir, exist_ok=True)
         self.db_path = os.path.join(self.output_dir, "arxitex_indices.db")
+        # Created on first use by whichever command actually saves graphs.
+        self.graphs_dir = os.path.join(self.output_dir, "graphs")
+        self._temp_dir: Optional[Path] = None
 
         # Register a global LLM usage sink (token accounting) for this run.
         # This is best-effort and will no-op if token usage isn't provided by the provider.
@@ -37,6 +44,43 @@ class ArxivPipelineComponents:
         self.processing_index = ProcessedIndex(self.db_path)
         self.skipped_index = SkippedIndex(self.db_path)
 
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Return a lazily opened connection shared across this run.
+
+        Used by the event-loop side of the CLI and workflows (admin resets,
+        queue ordering queries) so they stop re-opening the DB and its -wal/-shm
+        files on every call. The connection is in autocommit mode; callers that
+        write open their own BEGIN IMMEDIATE transaction. It is not meant for
+        worker threads, which keep using per-call connections via the indices.
+        """
+        if self._conn is None:
+            conn = connect(self.db_path)
+            tune_for_bulk(conn, mmap_size_mib=256)
+            conn.isolation_level = None
+            self._conn = conn
+            atexit.register(self.close)
+        return self._conn
+
+    def get_temp_dir(self) -> Path:
+        """Return the base directory for per-paper temporary source folders.
+
+        The directory is created on first use and cached, so per-paper
+        processing does not re-stat it for every paper.
+        """
+        if self._temp_dir is None:
+            temp_dir = Path(self.output_dir) / "temp_processing"
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            self._temp_dir = temp_dir
+        return self._temp_dir
+
+    def close(self) -> None:
+        """Close the shared connection, if one was opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
 
 class AsyncWorkflowRunnerBase(abc.ABC):
     """
@@ -191,7 +235,7 @@ class AsyncArxivWorkflowRunner(AsyncWorkflowRunnerBase):
             paper_id = paper["arxiv_id"]
 
             if paper_id in self.components.skipped_index and not self.force:
-                logger.debug(f"Skipping {paper_id}: already in skipped index.")
+                logger.debug("Skipping {}: already in skipped index.", paper_id)
                 continue
 
             disqualifying_keyword = self._is_title_disqualified(paper["title"])
@@ -211,7 +255,7 @@ class AsyncArxivWorkflowRunner(AsyncWorkflowRunnerBase):
                     papers_to_process.append(paper)
                 else:
                     logger.debug(
-                        f"Skipping {paper_id}: already successfully processed."
+                        "Skipping {}: already successfully processed.", paper_id
                     )
             else:
                 papers_to_process.append(paper)
@@ -269,11 +313,9 @@ class AsyncArxivWorkflowRunner(AsyncWorkflowRunnerBase):
 
                 papers_to_process, _ = result_tuple
                 if papers_to_process:
-                    tasks = [
-                        self._process_and_handle_paper(paper, semaphore)
-                        for paper in papers_to_process
-                    ]
-                    batch_results = await asyncio.gather(*tasks)
+                    batch_results = await self._process_batch(
+                        papers_to_process, semaphore
+                    )
                     self.results.extend(filter(None, batch_results))
                     session_success_count += sum(
                         1 for r in batch_results if r and r.get("status") == "success"
@@ -298,6 +340,17 @@ class AsyncArxivWorkflowRunner(AsyncWorkflowRunnerBase):
         )
         self._write_summary_report()
 
+    async def _process_batch(
+        self, papers: List[Dict], semaphore: asyncio.Semaphore
+    ) -> List[Optional[dict]]:
+        """Processes one fetched batch of papers concurrently.
+
+        Subclasses whose per-paper work is a single DB write can override this
+        to handle the whole batch at once.
+        """
+        tasks = [self._process_and_handle_paper(paper, semaphore) for paper in papers]
+        return await asyncio.gather(*tasks)
+
     async def _process_and_handle_paper(
         self, paper: dict, semaphore: asyncio.Semaphore
     ):
@@ -308,6 +361,7 @@ class AsyncArxivWorkflowRunner(AsyncWorkflowRunnerBase):
                 return await self._process_single_item(paper)
             except Exception as e:
                 err = classify_processing_error(e)
+                details = err.to_details_dict()
                 logger.error(
                     f"UNHANDLED_FAILURE for {paper_id} [{err.code} @ {err.stage}]: {err.message}",
                     exc_info=True,
@@ -315,12 +369,12 @@ class AsyncArxivWorkflowRunner(AsyncWorkflowRunnerBase):
                 self.components.processing_index.update_processed_papers_status(
                     paper_id,
                     status="failure",
-                    **err.to_details_dict(),
+                    **details,
                 )
                 return {
                     "status": "failure",
                     "arxiv_id": paper_id,
-                    **err.to_details_dict(),
+                    **details,
                 }
 
     def _write_summary_report(self):
@@ -1,21 +1,50 @@
+import asyncio
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Coroutine, Dict, List
 
 from arxitex.extractor.models import ArtifactNode
 
 
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run `coro` on a uvloop event loop when uvloop is installed."""
+
+    try:
+        import uvloop  # type: ignore[import]
+    except ImportError:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 def save_graph_data(arxiv_id: str, graphs_output_dir: str, graph_data: dict) -> Path:
     """Saves the generated graph data to a persistent JSON file."""
     safe_paper_id = arxiv_id.replace("/", "_")
     graph_filename = f"{safe_paper_id}.json"
     graph_filepath = Path(graphs_output_dir) / graph_filename
 
-    with open(graph_filepath, "w", encoding="utf-8") as f:
-        json.dump(graph_data, f, indent=2)
+    graph_filepath.write_bytes(_dumps_graph(graph_data))
     return graph_filepath
 
 
+def _dumps_graph(graph_data: dict) -> bytes:
+    """Serialize graph data as 2-space indented JSON (orjson when installed)."""
+
+    try:
+        import orjson  # type: ignore[import]
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                graph_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles these.
+            pass
+    return json.dumps(graph_data, indent=2).encode("utf-8")
+
+
 def transform_graph_to_search_format(
     graph_nodes: List[ArtifactNode],
     artifact_to_terms_map: Dict[str, List[str]] = None,
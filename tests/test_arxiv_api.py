@@ -42,6 +42,36 @@ def test_parse_response_and_entry_to_paper():
     assert paper["comment"] == "Short comment"
 
 
+def test_fetch_papers_returns_bytes_that_parse_like_text(monkeypatch):
+    api = ArxivAPI()
+    feed = make_sample_feed().replace("Alice", "Alicé")
+
+    class Resp:
+        status_code = 200
+        content = feed.encode("utf-8")
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(api.session, "get", lambda *a, **k: Resp())
+    raw = api.fetch_papers("id:1234.5678")
+    assert isinstance(raw, bytes)
+
+    _cnt, _total, entries = api.parse_response(raw)
+    assert api.entry_to_paper(entries[0]) == api.entry_to_paper(
+        api.parse_response(feed)[2][0]
+    )
+    assert "Alicé" in api.entry_to_paper(entries[0])["authors"]
+
+
+def test_entry_to_title_authors_matches_entry_to_paper():
+    api = ArxivAPI()
+    _cnt, _total, entries = api.parse_response(make_sample_feed())
+    paper = api.entry_to_paper(entries[0])
+    light = api.entry_to_title_authors(entries[0])
+    assert light == {k: paper[k] for k in ("arxiv_id", "title", "authors")}
+
+
 def test_extract_arxiv_id_variants():
     api = ArxivAPI()
     assert api.extract_arxiv_id("http://arxiv.org/abs/1234.5678v1") == "1234.5678v1"
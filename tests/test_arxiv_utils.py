@@ -1,4 +1,8 @@
-from arxitex.arxiv_utils import extract_arxiv_id_from_urls, parse_arxiv_id
+from arxitex.arxiv_utils import (
+    extract_arxiv_id_from_urls,
+    is_arxiv_id,
+    parse_arxiv_id,
+)
 
 
 def test_parse_arxiv_id_variants():
@@ -14,3 +18,12 @@ def test_extract_arxiv_id_from_urls():
         "https://arxiv.org/pdf/1901.01234.pdf",
     ]
     assert extract_arxiv_id_from_urls(urls) == "1901.01234"
+
+
+def test_is_arxiv_id():
+    assert is_arxiv_id("2305.15334")
+    assert is_arxiv_id("2305.15334v2")
+    assert is_arxiv_id("math.AG/0601001")
+    assert not is_arxiv_id("https://arxiv.org/abs/2305.15334")
+    assert not is_arxiv_id("2305.153")
+    assert not is_arxiv_id("")
@@ -52,3 +52,66 @@ def test_insert_and_get_serialization(tmp_path):
     conn.close()
     assert '"a": 1' in raw
     assert '"b": "text"' in raw
+
+
+def test_discovery_index_contains(tmp_path):
+    from arxitex.indices.discover import DiscoveryIndex
+
+    idx = DiscoveryIndex(str(tmp_path / "test.db"))
+    idx.add_papers([{"arxiv_id": "2305.15334", "title": "T"}])
+    assert "2305.15334" in idx
+    assert "2305.15334v2" not in idx
+
+
+def test_discovery_index_add_new_papers_reports_new_ids(tmp_path):
+    from arxitex.indices.discover import DiscoveryIndex
+
+    idx = DiscoveryIndex(str(tmp_path / "test.db"))
+    idx.add_papers([{"arxiv_id": "2301.00001"}])
+    added = idx.add_new_papers(
+        [
+            {"arxiv_id": "2301.00001"},
+            {"arxiv_id": "2301.00002"},
+            {"title": "no id"},
+            {"arxiv_id": "2301.00002"},
+        ]
+    )
+    assert added == ["2301.00002"]
+    assert len(idx.get_pending_papers()) == 2
+
+
+def test_discovery_index_replace_counts_only_new_papers(tmp_path):
+    from arxitex.indices.discover import DiscoveryIndex
+
+    idx = DiscoveryIndex(str(tmp_path / "test.db"))
+    idx.add_papers([{"arxiv_id": "2301.00001", "title": "Old"}])
+    added = idx.add_papers(
+        [
+            {"arxiv_id": "2301.00001", "title": "New"},
+            {"arxiv_id": "2301.00002", "title": "Other"},
+        ],
+        replace=True,
+    )
+    assert added == 1
+    assert [p["title"] for p in idx.get_pending_papers()] == ["New", "Other"]
+
+
+def test_read_connection_is_cached_per_thread_and_sees_new_writes(tmp_path):
+    import threading
+
+    from arxitex.indices.processed import ProcessedIndex
+
+    idx = ProcessedIndex(str(tmp_path / "test.db"))
+    assert not idx.is_successfully_processed("2305.15334")
+    conn = idx._get_read_connection()
+    assert idx._get_read_connection() is conn
+    assert not conn.in_transaction
+
+    idx.update_processed_papers_status("2305.15334", status="success")
+    assert idx.is_successfully_processed("2305.15334")
+
+    other = []
+    t = threading.Thread(target=lambda: other.append(idx._get_read_connection()))
+    t.start()
+    t.join()
+    assert other[0] is not conn
@@ -1,8 +1,12 @@
 from arxitex.tools.matching.scoring import (
+    author_last_names,
     author_overlap,
     best_match_index,
+    last_name_overlap,
     normalize_author,
     normalize_title,
+    normalized_title_similarity,
+    strip_accents,
     title_similarity,
 )
 
@@ -12,16 +16,67 @@ def test_normalize_title_and_author():
     assert normalize_author("Doe, John") == "john doe"
 
 
+def test_strip_accents():
+    assert strip_accents("plain ascii") == "plain ascii"
+    assert strip_accents("Erdős, naïve café") == "Erdos, naive cafe"
+    # Combining marks outside the BMP (musical symbol combining stem).
+    assert strip_accents("x\U0001f600\U0001d167y") == "x\U0001f600y"
+
+
 def test_author_overlap_last_name():
     wanted = ["John Doe", "Alice Smith"]
     cand = ["Doe, J.", "Smith, Alice"]
     assert author_overlap(wanted, cand, use_last_name=True) == 1.0
 
 
+def test_last_name_overlap_with_precomputed_set():
+    wanted_last = author_last_names(["John Doe", "Alice Smith", ""])
+    assert wanted_last == {"doe", "smith"}
+    assert last_name_overlap(wanted_last, ["Doe, J."]) == 0.5
+    assert last_name_overlap(frozenset(), ["Doe, J."]) == 0.0
+
+
 def test_title_similarity_exact():
     assert title_similarity("My Title", "My Title") == 1.0
 
 
+def test_normalized_title_similarity_cutoff():
+    full = normalized_title_similarity("abc def", "abc xyz")
+    assert 0.5 < full < 0.6
+    assert normalized_title_similarity("abc def", "abc xyz", score_cutoff=0.5) == full
+    assert normalized_title_similarity("abc def", "abc xyz", score_cutoff=0.9) == 0.0
+    assert normalized_title_similarity("abc def", "abc xyz", score_cutoff=-0.5) == full
+    assert normalized_title_similarity("abc", "abc", score_cutoff=1.0) == 1.0
+    # Length ratio alone rules out the cutoff.
+    assert normalized_title_similarity("abc", "abc" * 5, score_cutoff=0.6) == 0.0
+
+
+def test_title_similarity_near_match_thresholds():
+    # Pins which side of the 0.92 / 0.96 thresholds borderline titles fall on.
+    proof = "A proof of the Riemann hypothesis for function fields"
+    cases = [
+        # difflib's SequenceMatcher scored this reordering 0.917.
+        (proof, "A on of proof the Riemann hypothesis for function fields", 0.9358),
+        ("A note on elliptic curves", "A note on the elliptic curve", 0.9057),
+        (
+            "On the cohomology of moduli spaces of curves",
+            "On the homology of moduli spaces of curve",
+            0.9647,
+        ),
+        (
+            "Stable homotopy groups of spheres",
+            "The stable homotopy groups of spheres",
+            0.9429,
+        ),
+    ]
+    for a, b, expected in cases:
+        assert abs(title_similarity(a, b) - expected) < 1e-4, (a, b)
+    assert title_similarity(*cases[0][:2]) >= 0.92
+    assert title_similarity(*cases[1][:2]) < 0.92
+    assert title_similarity(*cases[2][:2]) >= 0.96
+    assert title_similarity(*cases[3][:2]) < 0.96
+
+
 def test_best_match_index():
     candidates = [
         {
@@ -1,6 +1,7 @@
 import asyncio
 
 import httpx
+import pytest
 
 from arxitex.tools.openalex import fetch_openalex_citation
 
@@ -73,3 +74,44 @@ def test_fetch_openalex_citation_picks_max_cited_by_count_for_same_title():
     assert rec.citation_count == 8
     assert rec.source_work_id == "https://openalex.org/W_JOURNAL"
     # We no longer store raw OpenAlex JSON in the DB to save space.
+
+
+@pytest.mark.parametrize("batch_size", [1, 500])
+def test_backfill_citations_openalex_upserts_in_batches(
+    tmp_path, monkeypatch, batch_size
+):
+    import arxitex.tools.openalex as openalex
+    from arxitex.db.connection import connect
+
+    async def fake_fetch(client, *, base_arxiv_id, title, authors, mailto):
+        return openalex.CitationRecord(
+            paper_id=base_arxiv_id,
+            source="openalex",
+            source_work_id=f"W{base_arxiv_id}",
+            citation_count=3,
+            last_fetched_at_utc=openalex._utc_now_iso(),
+        )
+
+    monkeypatch.setattr(openalex, "fetch_openalex_citation", fake_fetch)
+    monkeypatch.setattr(openalex, "_UPSERT_BATCH_SIZE", batch_size)
+    db_path = str(tmp_path / "arxitex_indices.db")
+
+    stats = asyncio.run(
+        openalex.backfill_citations_openalex(
+            db_path=db_path,
+            arxiv_ids=["2207.12929v2", "2207.12929", "2301.00001"],
+            workers=2,
+            qps=1000,
+        )
+    )
+
+    assert stats["to_fetch"] == 2
+    assert stats["success"] == 2
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT paper_id, citation_count FROM paper_citations ORDER BY paper_id"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert [tuple(r) for r in rows] == [("2207.12929", 3), ("2301.00001", 3)]
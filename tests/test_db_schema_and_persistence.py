@@ -2,7 +2,7 @@ import sqlite3
 
 import pytest
 
-from arxitex.db.connection import connect
+from arxitex.db.connection import connect, tune_for_bulk
 from arxitex.db.schema import ensure_schema
 
 
@@ -77,3 +77,15 @@ def test_schema_creates_tables_and_foreign_keys(tmp_path):
 
     finally:
         conn.close()
+
+
+def test_tune_for_bulk_sets_cache_pragmas(tmp_path):
+    conn = connect(tmp_path / "t.db")
+    try:
+        tune_for_bulk(conn, cache_size_kib=2048, mmap_size_mib=8)
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2048
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 8 * 1024 * 1024
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
@@ -0,0 +1,121 @@
+import asyncio
+import itertools
+
+from arxitex.workflows.downloader import DownloaderWorkflow
+from arxitex.workflows.runner import ArxivPipelineComponents, AsyncArxivWorkflowRunner
+
+
+def test_papers_share_one_http_client(tmp_path, monkeypatch):
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    workflow = DownloaderWorkflow(components, max_concurrent_tasks=2)
+    clients = []
+
+    async def fake_download(arxiv_id):
+        clients.append(workflow._downloader.http_client)
+        return tmp_path / arxiv_id
+
+    async def fake_run(self, **kwargs):
+        for arxiv_id in ("2305.15334", "2305.15335"):
+            await self._process_single_item({"arxiv_id": arxiv_id})
+
+    monkeypatch.setattr(
+        workflow._downloader, "download_and_extract_source", fake_download
+    )
+    monkeypatch.setattr(AsyncArxivWorkflowRunner, "run", fake_run)
+
+    asyncio.run(workflow.run(search_query="cat:math.GR", max_papers=2))
+
+    assert len(clients) == 2
+    assert clients[0] is not None and clients[0] is clients[1]
+    assert components.processing_index.get_paper_status("2305.15335")["status"] == (
+        "downloaded"
+    )
+
+
+def test_download_failure_is_recorded_once(tmp_path, monkeypatch):
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    workflow = DownloaderWorkflow(components)
+    writes = []
+    update = components.processing_index.update_processed_papers_status
+
+    def record(arxiv_id, **kwargs):
+        writes.append(kwargs["status"])
+        update(arxiv_id, **kwargs)
+
+    async def failing_download(arxiv_id):
+        raise RuntimeError("x" * 5000)
+
+    monkeypatch.setattr(
+        components.processing_index, "update_processed_papers_status", record
+    )
+    monkeypatch.setattr(
+        workflow._downloader, "download_and_extract_source", failing_download
+    )
+
+    result = asyncio.run(
+        workflow._process_and_handle_paper(
+            {"arxiv_id": "2305.15334"}, asyncio.Semaphore(1)
+        )
+    )
+
+    assert result["status"] == "failure"
+    assert len(result["reason"]) == 2048
+    assert writes == ["download_failed"]
+
+
+def test_source_downloads_are_capped_per_loop(tmp_path, monkeypatch):
+    from arxitex.downloaders.async_downloader import AsyncSourceDownloader
+
+    active = []
+    peak = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        async def aiter_bytes(self, chunk_size):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+            yield b"\\documentclass{article}"
+
+    class FakeStream:
+        async def __aenter__(self):
+            return FakeResponse()
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakeClient:
+        def stream(self, method, url):
+            return FakeStream()
+
+    def downloader(limit):
+        d = AsyncSourceDownloader(
+            cache_dir=tmp_path, config={"max_concurrent_downloads": limit}
+        )
+        d.http_client = FakeClient()
+        return d
+
+    dirs = (tmp_path / str(n) for n in itertools.count())
+
+    async def download_all(*downloaders):
+        await asyncio.gather(
+            *[
+                d._async_download_source(f"2305.1533{i}", next(dirs))
+                for d in downloaders
+                for i in range(3)
+            ]
+        )
+        high = max(peak)
+        peak.clear()
+        return high
+
+    async def scenario():
+        # Downloaders with the same limit share one cap ...
+        assert await download_all(downloader(2), downloader(2)) == 2
+        # ... while a different limit in the same loop is honoured.
+        assert await download_all(downloader(3), downloader(3)) == 3
+
+    asyncio.run(scenario())
@@ -0,0 +1,18 @@
+import httpx
+
+from arxitex.db.error_utils import classify_processing_error
+from arxitex.downloaders.async_downloader import ArxivExtractorError
+
+
+def test_classifies_loaded_httpx_and_downloader_errors():
+    assert classify_processing_error(httpx.ReadTimeout("slow")).code == "llm_timeout"
+    assert (
+        classify_processing_error(httpx.ConnectError("down")).code
+        == "llm_connection_error"
+    )
+    err = classify_processing_error(ArxivExtractorError("paper is PDF-only"))
+    assert err.code == "no_latex_source"
+
+
+def test_unknown_error_falls_back():
+    assert classify_processing_error(RuntimeError("x")).code == "unexpected_error"
@@ -5,6 +5,9 @@ from arxitex.tools.matching.arxiv_matcher import (
     extract_title_and_authors,
     generate_title_candidates,
     match_external_reference_to_arxiv,
+    match_external_references_bulk,
+    try_extract_arxiv_id_from_text,
+    try_extract_arxiv_ids,
 )
 
 
@@ -101,6 +104,22 @@ def test_matcher_direct_regex_fast_path():
     assert res.matched_arxiv_id == "1234.5678"
 
 
+def test_bulk_arxiv_id_extraction_matches_single():
+    texts = [
+        "J. Doe, Some paper, arXiv:1234.5678v2",
+        "",
+        "No identifier here, 2021.",
+        "See https://arxiv.org/abs/math.GR/0601001 and arXiv:2101.00001",
+        "arxiv",
+        None,
+        "Mirror copy: https://example.org/abs/1901.01234",
+    ]
+    assert try_extract_arxiv_ids(texts) == [
+        try_extract_arxiv_id_from_text(t) for t in texts
+    ]
+    assert try_extract_arxiv_ids([]) == []
+
+
 def test_matcher_search_picks_best(monkeypatch, tmp_path):
     api = ArxivAPI()
     # Two entries: one exact title, one far.
@@ -147,3 +166,222 @@ def test_matcher_cache_avoids_requery(monkeypatch, tmp_path):
     )
     assert r1.matched_arxiv_id == r2.matched_arxiv_id
     assert calls["n"] == 1
+
+
+def test_matcher_survives_cache_db_replaced_between_calls(monkeypatch, tmp_path):
+    api = ArxivAPI()
+    feed = make_feed("1111.2222v1", "A Great Paper", ["John Doe"])
+    calls = {"n": 0}
+
+    def fake_fetch(search_query, start=0, batch_size=100):
+        calls["n"] += 1
+        return feed
+
+    monkeypatch.setattr(api, "fetch_papers", fake_fetch)
+    db_path = tmp_path / "t.sqlite"
+
+    ref = 'J. Doe, "A Great Paper", 2021.'
+    for _ in range(2):
+        for p in tmp_path.glob("t.sqlite*"):
+            p.unlink()
+        res = match_external_reference_to_arxiv(
+            api=api, full_reference=ref, db_path_for_cache=str(db_path)
+        )
+        assert res.matched_arxiv_id == "1111.2222"
+        assert db_path.exists()
+    assert calls["n"] == 2
+
+
+def test_matcher_stale_cache_requeries(monkeypatch, tmp_path):
+    api = ArxivAPI()
+    feed = make_feed("1111.2222v1", "A Great Paper", ["John Doe"])
+    calls = {"n": 0}
+
+    def fake_fetch(search_query, start=0, batch_size=100):
+        calls["n"] += 1
+        return feed
+
+    monkeypatch.setattr(api, "fetch_papers", fake_fetch)
+    db_path = tmp_path / "t.sqlite"
+
+    ref = 'J. Doe, "A Great Paper", 2021.'
+    for _ in range(2):
+        match_external_reference_to_arxiv(
+            api=api, full_reference=ref, db_path_for_cache=str(db_path), refresh_days=0
+        )
+    assert calls["n"] == 2
+
+
+def test_matcher_reads_legacy_cache_rows(monkeypatch, tmp_path):
+    from arxitex.db.connection import connect
+    from arxitex.db.schema import ensure_schema
+    from arxitex.tools.matching.arxiv_matcher import _legacy_cache_key, _utc_now_iso
+
+    api = ArxivAPI()
+
+    def fake_fetch(search_query, start=0, batch_size=100):
+        raise AssertionError("legacy cache row should avoid a query")
+
+    monkeypatch.setattr(api, "fetch_papers", fake_fetch)
+    db_path = tmp_path / "t.sqlite"
+    ensure_schema(db_path)
+
+    ref = 'J. Doe, "A Great Paper", 2021.'
+    cands, authors = generate_title_candidates(ref)
+    conn = connect(db_path)
+    with conn:
+        for c in cands:
+            conn.execute(
+                """
+                INSERT INTO external_reference_arxiv_search_cache (
+                    cache_key, matched_arxiv_id, matched_title, matched_authors_json,
+                    title_score, author_overlap, arxiv_query, last_fetched_at_utc
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    _legacy_cache_key(c.title, authors),
+                    "1111.2222",
+                    c.title,
+                    "[]",
+                    1.0,
+                    1.0,
+                    "q",
+                    _utc_now_iso(),
+                ),
+            )
+    conn.close()
+
+    res = match_external_reference_to_arxiv(
+        api=api, full_reference=ref, db_path_for_cache=str(db_path)
+    )
+    assert res.matched_arxiv_id == "1111.2222"
+
+
+def test_matcher_skips_legacy_keys_without_legacy_rows(monkeypatch, tmp_path):
+    from arxitex.tools.matching import arxiv_matcher
+
+    api = ArxivAPI()
+    feed = make_feed("1111.2222v1", "A Great Paper", ["John Doe"])
+    monkeypatch.setattr(api, "fetch_papers", lambda *a, **k: feed)
+
+    def no_legacy(title, authors):
+        raise AssertionError("legacy keys should not be computed")
+
+    monkeypatch.setattr(arxiv_matcher, "_legacy_cache_key", no_legacy)
+    db_path = tmp_path / "t.sqlite"
+    ref = 'J. Doe, "A Great Paper", 2021.'
+    for _ in range(2):
+        res = match_external_reference_to_arxiv(
+            api=api, full_reference=ref, db_path_for_cache=str(db_path)
+        )
+        assert res.matched_arxiv_id == "1111.2222"
+
+
+def test_matcher_caches_rejection_when_all_entries_prefiltered(monkeypatch, tmp_path):
+    api = ArxivAPI()
+    feed = make_feed("1111.2222v1", "Completely Unrelated Topic", ["John Doe"])
+    calls = {"n": 0}
+
+    def fake_fetch(search_query, start=0, batch_size=100):
+        calls["n"] += 1
+        return feed
+
+    monkeypatch.setattr(api, "fetch_papers", fake_fetch)
+    db_path = tmp_path / "t.sqlite"
+
+    ref = 'J. Doe, "A Great Paper", 2021.'
+    r1 = match_external_reference_to_arxiv(
+        api=api, full_reference=ref, db_path_for_cache=str(db_path)
+    )
+    n_first = calls["n"]
+    r2 = match_external_reference_to_arxiv(
+        api=api, full_reference=ref, db_path_for_cache=str(db_path)
+    )
+    assert r1.matched_arxiv_id is None and r2.matched_arxiv_id is None
+    assert n_first >= 1
+    assert calls["n"] == n_first
+
+
+def test_matcher_stops_after_confident_candidate(monkeypatch):
+    api = ArxivAPI()
+    feed = make_feed("1111.2222v1", "A Great Paper on Groups", ["John Doe"])
+    queries = []
+
+    def fake_fetch(search_query, start=0, batch_size=100):
+        queries.append(search_query)
+        return feed
+
+    monkeypatch.setattr(api, "fetch_papers", fake_fetch)
+
+    ref = 'J. Doe, "A Great Paper on Groups", Annals of Groups and Rings, 2021.'
+    cands, _authors = generate_title_candidates(ref)
+    assert len(cands) > 1
+
+    res = match_external_reference_to_arxiv(api=api, full_reference=ref)
+    assert res.matched_arxiv_id == "1111.2222"
+    assert len(queries) == 1
+
+
+def test_bulk_matcher_shares_cache_within_batch(monkeypatch, tmp_path):
+    api = ArxivAPI()
+    feed = make_feed("1111.2222v1", "A Great Paper", ["John Doe"])
+    calls = {"n": 0}
+
+    def fake_fetch(search_query, start=0, batch_size=100):
+        calls["n"] += 1
+        return feed
+
+    monkeypatch.setattr(api, "fetch_papers", fake_fetch)
+    db_path = tmp_path / "t.sqlite"
+
+    refs = [
+        'J. Doe, "A Great Paper", 2021.',
+        "J. Doe, Some paper, arXiv:1234.5678v2",
+        "",
+        'J. Doe, "A Great Paper", 2021.',
+    ]
+    results = match_external_references_bulk(
+        api=api, references=refs, db_path_for_cache=str(db_path)
+    )
+    assert [r.match_method for r in results] == [
+        "search",
+        "direct_regex",
+        "none",
+        "search",
+    ]
+    assert results[0].matched_arxiv_id == results[3].matched_arxiv_id == "1111.2222"
+    assert calls["n"] == 1
+
+    # Rows were persisted for later runs.
+    match_external_reference_to_arxiv(
+        api=api, full_reference=refs[0], db_path_for_cache=str(db_path)
+    )
+    assert calls["n"] == 1
+
+
+def make_multi_feed(entries: list[tuple[str, str, list[str]]]) -> str:
+    bodies = []
+    for arxiv_id, title, authors in entries:
+        feed = make_feed(arxiv_id, title, authors)
+        bodies.append(feed[feed.index("<entry>") : feed.index("</feed>")])
+    head = make_feed("", "", [])
+    return head[: head.index("<entry>")] + "".join(bodies) + "</feed>"
+
+
+def test_matcher_prefers_best_entry_then_earliest(monkeypatch):
+    api = ArxivAPI()
+    feed = make_multi_feed(
+        [
+            ("1111.1111v1", "A Great Paper on Rings", ["John Doe"]),
+            ("2222.2222v1", "A Great Paper", ["John Doe"]),
+            ("3333.3333v1", "A Great Paper", ["John Doe"]),
+        ]
+    )
+    monkeypatch.setattr(api, "fetch_papers", lambda *a, **k: feed)
+
+    res = match_external_reference_to_arxiv(
+        api=api, full_reference="", extracted_title="A Great Paper"
+    )
+    # The exact title beats the earlier near-miss; of two exact titles the
+    # first one returned by arXiv is kept.
+    assert res.matched_arxiv_id == "2222.2222"
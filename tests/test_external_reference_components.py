@@ -106,6 +106,26 @@ def test_extract_top_k_reference_components(tmp_path: Path):
     assert {(e.source, e.target) for e in comps[1].edges} == {("b1", "b2")}
 
 
+def test_equal_size_components_rank_by_smallest_node(tmp_path: Path):
+    db_path = tmp_path / "t.db"
+    ensure_schema(db_path)
+
+    conn = connect(db_path)
+    try:
+        with conn:
+            _insert_match(
+                conn, paper_id="b1", external_artifact_id="r1", matched_arxiv_id="b2"
+            )
+            _insert_match(
+                conn, paper_id="a2", external_artifact_id="r2", matched_arxiv_id="a1"
+            )
+    finally:
+        conn.close()
+
+    comps = extract_top_k_reference_components(db_path=db_path, top_k=2)
+    assert [c.nodes for c in comps] == [["a1", "a2"], ["b1", "b2"]]
+
+
 def test_component_json_shape(tmp_path: Path):
     db_path = tmp_path / "t.db"
     ensure_schema(db_path)
@@ -125,8 +145,10 @@ def test_component_json_shape(tmp_path: Path):
     assert d["nodes"] == ["p1", "p2"]
     assert d["edges"] == [{"source": "p1", "target": "p2"}]
 
-    # Ensure serializable
-    json.dumps(d)
+    # Ensure serializable, with identical bytes from the orjson fast path.
+    from arxitex.tools.visualization.citation_components import _dumps_indented
+
+    assert _dumps_indented(d) == json.dumps(d, ensure_ascii=False, indent=2).encode()
 
 
 def test_normalizes_arxiv_versions_by_default(tmp_path: Path):
@@ -152,3 +174,14 @@ def test_normalizes_arxiv_versions_by_default(tmp_path: Path):
     assert {(e.source, e.target) for e in comps[0].edges} == {
         ("1202.1159", "0706.4403")
     }
+
+
+def test_component_labels_match_union_find_fallback():
+    from arxitex.tools.visualization.citation_components import (
+        _component_labels,
+        _component_labels_union_find,
+    )
+
+    pairs = [(0, 1), (1, 2), (4, 3), (5, 5), (7, 6)]
+    assert _component_labels(8, pairs) == _component_labels_union_find(8, pairs)
+    assert _component_labels_union_find(8, pairs) == [0, 0, 0, 1, 1, 2, 3, 3]
@@ -0,0 +1,181 @@
+import io
+import json
+
+import pytest
+
+from arxitex.extractor.models import (
+    ArtifactNode,
+    ArtifactType,
+    DocumentGraph,
+    Edge,
+    Position,
+)
+from arxitex.tools import graph_json_cli
+from arxitex.tools.graph_json_cli import _write_payload
+
+
+def _graph(n: int) -> DocumentGraph:
+    graph = DocumentGraph()
+    for i in range(n):
+        graph.add_node(
+            ArtifactNode(
+                id=f"n{i}",
+                type=ArtifactType.THEOREM,
+                content=f"Théorème {i}",
+                position=Position(line_start=i),
+            )
+        )
+        if i:
+            graph.add_edge(Edge(source_id=f"n{i}", target_id=f"n{i - 1}"))
+    return graph
+
+
+def _payload(graph: DocumentGraph, graph_value) -> dict:
+    return {
+        "graph": graph_value,
+        "definition_bank": None,
+        "artifact_to_terms_map": {"n0": ["group", "ring"], "n1": []},
+        "latex_macros": {},
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_streamed_payload_matches_json_dump(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(graph_json_cli, "orjson", None)
+    monkeypatch.setattr(graph_json_cli, "_FLUSH_EVERY", 2)
+    graph = _graph(5)
+
+    out = io.BytesIO()
+    _write_payload(out, _payload(graph, graph.iter_dict_parts("1234.5678", "x")))
+
+    expected = _payload(graph, graph.to_dict("1234.5678", "x"))
+    assert out.getvalue().decode("utf-8") == json.dumps(
+        expected, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def test_dumps_falls_back_for_values_orjson_rejects():
+    value = {"big": 2**70, "n": [1, "é"]}
+    assert json.loads(graph_json_cli._dumps(value)) == value
+
+
+def test_streamed_payload_empty_graph():
+    graph = _graph(0)
+    out = io.BytesIO()
+    _write_payload(out, _payload(graph, graph.iter_dict_parts("1234.5678")))
+    assert json.loads(out.getvalue())["graph"]["nodes"] == []
+
+
+def test_server_answers_framed_requests(monkeypatch):
+    import asyncio
+    import struct
+
+    async def fake_run_pipeline(args):
+        if args.arxiv_id == "bad":
+            raise ValueError("no such paper")
+        graph = _graph(2)
+        return _payload(graph, graph.iter_dict_parts(args.arxiv_id))
+
+    monkeypatch.setattr(graph_json_cli, "_run_pipeline", fake_run_pipeline)
+
+    def frame(obj) -> bytes:
+        body = json.dumps(obj).encode()
+        return struct.pack(">I", len(body)) + body
+
+    stdin = io.BytesIO(
+        frame({"argv": ["1234.5678"]})
+        + frame({"argv": ["bad"]})
+        + frame({"argv": ["--no-such-flag"]})
+        + frame({"argv": ["-h"]})
+        + frame({"argv": ["1234.5678", "-v"]})
+        + frame({"argv": ["1234.5678", "--ndjson"]})
+    )
+    stdout = io.BytesIO()
+    asyncio.run(graph_json_cli._serve(stdin, stdout))
+
+    stdout.seek(0)
+    replies = []
+    while (body := graph_json_cli._read_frame(stdout)) is not None:
+        replies.append(json.loads(body))
+
+    assert [r["ok"] for r in replies] == [True, False, False, False, False, False]
+    assert replies[0]["result"]["graph"]["arxiv_id"] == "1234.5678"
+    assert len(replies[0]["result"]["graph"]["nodes"]) == 2
+    assert replies[1]["error"] == "no such paper"
+    assert "--no-such-flag" in replies[2]["error"]
+    assert "--help" in replies[3]["error"]
+    assert "--verbose" in replies[4]["error"]
+    assert "--ndjson" in replies[5]["error"]
+
+
+def test_run_pipeline_handles_missing_graph(monkeypatch):
+    import asyncio
+
+    async def fake_generate(**kwargs):
+        return {"graph": None, "bank": None}
+
+    monkeypatch.setattr(
+        "arxitex.extractor.pipeline.agenerate_artifact_graph", fake_generate
+    )
+    args = graph_json_cli._build_parser().parse_args(["1234.5678"])
+    payload = asyncio.run(graph_json_cli._run_pipeline(args))
+
+    out = io.BytesIO()
+    _write_payload(out, payload)
+    graph = json.loads(out.getvalue())["graph"]
+    assert graph["arxiv_id"] == "1234.5678"
+    assert graph["stats"] == {"node_count": 0, "edge_count": 0}
+    assert graph["nodes"] == [] and graph["edges"] == []
+
+
+def test_ndjson_records():
+    graph = _graph(2)
+    out = io.BytesIO()
+    graph_json_cli._write_ndjson(
+        out, _payload(graph, graph.iter_dict_parts("1234.5678", "x"))
+    )
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+
+    assert [r["type"] for r in records] == [
+        "graph",
+        "node",
+        "node",
+        "edge",
+        "definition_bank",
+        "artifact_terms",
+        "artifact_terms",
+        "latex_macros",
+        "done",
+    ]
+    assert records[0]["data"] == {
+        "arxiv_id": "1234.5678",
+        "extractor_mode": "x",
+        "stats": {"node_count": 2, "edge_count": 1},
+    }
+    assert records[1]["data"] == graph.nodes[0].to_dict()
+    assert records[5]["data"] == {"artifact_id": "n0", "terms": ["group", "ring"]}
+
+
+def test_run_pipeline_emits_heartbeats(monkeypatch, capfd):
+    import asyncio
+
+    async def slow_generate(**kwargs):
+        await asyncio.sleep(0.2)
+        return {"graph": None, "bank": None}
+
+    monkeypatch.setattr(
+        "arxitex.extractor.pipeline.agenerate_artifact_graph", slow_generate
+    )
+    monkeypatch.setattr(graph_json_cli, "_HEARTBEAT_INTERVAL_S", 0.05)
+    args = graph_json_cli._build_parser().parse_args(["1234.5678"])
+    asyncio.run(graph_json_cli._run_pipeline(args))
+
+    beats = [
+        json.loads(line)
+        for line in capfd.readouterr().err.splitlines()
+        if line.startswith('{"status"')
+    ]
+    assert beats and all(b["status"] == "working" for b in beats)
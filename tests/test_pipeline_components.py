@@ -0,0 +1,28 @@
+from arxitex.workflows.runner import ArxivPipelineComponents
+
+
+def test_shared_connection_is_cached_and_closed(tmp_path):
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+
+    conn = components.get_connection()
+    assert components.get_connection() is conn
+    assert conn.isolation_level is None
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 256 * 1024 * 1024
+
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute("DELETE FROM processed_papers WHERE arxiv_id = ?", ("x",))
+    conn.commit()
+
+    components.close()
+    assert components.get_connection() is not conn
+    components.close()
+
+
+def test_temp_dir_is_created_lazily_and_cached(tmp_path):
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    assert not (tmp_path / "temp_processing").exists()
+
+    temp_dir = components.get_temp_dir()
+    assert temp_dir == tmp_path / "temp_processing"
+    assert temp_dir.is_dir()
+    assert components.get_temp_dir() is temp_dir
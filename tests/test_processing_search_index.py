@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+from arxitex.workflows.processor import ProcessingWorkflow
+from arxitex.workflows.runner import ArxivPipelineComponents
+
+
+def _workflow(tmp_path):
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    return ProcessingWorkflow(
+        components,
+        infer_dependencies=False,
+        enrich_content=False,
+        max_concurrent_tasks=4,
+        format_for_search=True,
+    )
+
+
+def test_search_docs_are_appended_per_category(tmp_path):
+    workflow = _workflow(tmp_path)
+
+    async def scenario():
+        await asyncio.gather(
+            *[
+                workflow._enqueue_search_docs(cat, [{"id": f"{cat}-{i}"}, {"n": i}])
+                for i in range(5)
+                for cat in ("math_GR", "cs_LG")
+            ]
+        )
+        await workflow._close_search_writers()
+
+    asyncio.run(scenario())
+
+    index_dir = tmp_path / "search_indices"
+    for cat in ("math_GR", "cs_LG"):
+        rows = [json.loads(line) for line in (index_dir / f"{cat}.jsonl").open()]
+        assert len(rows) == 10
+        assert {r["id"] for r in rows if "id" in r} == {f"{cat}-{i}" for i in range(5)}
+    assert workflow._search_queues == {}
+
+
+def test_close_without_writers_is_a_noop(tmp_path):
+    workflow = _workflow(tmp_path)
+    asyncio.run(workflow._close_search_writers())
+    assert not list((tmp_path / "search_indices").iterdir())
+
+
+def test_writer_opens_each_category_file_once(tmp_path, monkeypatch):
+    from arxitex.workflows import processor
+
+    workflow = _workflow(tmp_path)
+    opened = []
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(processor, "open", counting_open, raising=False)
+
+    async def scenario():
+        for i in range(3):
+            await workflow._enqueue_search_docs("math_GR", [{"n": i}])
+            # Let the writer drain between papers.
+            await asyncio.sleep(0)
+        await workflow._close_search_writers()
+
+    asyncio.run(scenario())
+
+    assert len(opened) == 1
+    path = tmp_path / "search_indices" / "math_GR.jsonl"
+    assert [json.loads(line)["n"] for line in path.open()] == [0, 1, 2]
+
+
+def test_failed_append_fails_the_paper_and_writer_recovers(tmp_path, monkeypatch):
+    import pytest
+
+    from arxitex.workflows import processor
+
+    workflow = _workflow(tmp_path)
+    append = processor._append_locked
+    calls = []
+
+    def flaky_append(f, lock, lines):
+        calls.append(lines)
+        if len(calls) == 1:
+            raise OSError("disk full")
+        append(f, lock, lines)
+
+    monkeypatch.setattr(processor, "_append_locked", flaky_append)
+
+    async def scenario():
+        with pytest.raises(OSError, match="disk full"):
+            await workflow._enqueue_search_docs("math_GR", [{"n": 0}])
+        await workflow._enqueue_search_docs("math_GR", [{"n": 1}])
+        assert workflow._search_queues["math_GR"].maxsize > 0
+        await workflow._close_search_writers()
+
+    asyncio.run(scenario())
+
+    path = tmp_path / "search_indices" / "math_GR.jsonl"
+    assert [json.loads(line)["n"] for line in path.open()] == [1]
+
+
+def test_failing_consumer_stops_siblings_before_writers_close(tmp_path, monkeypatch):
+    import pytest
+
+    workflow = _workflow(tmp_path)
+    closed_with_running = []
+
+    async def fake_process(self, paper, semaphore):
+        if paper["arxiv_id"] == "bad":
+            raise RuntimeError("boom")
+        await asyncio.sleep(10)
+
+    close = ProcessingWorkflow._close_search_writers
+
+    async def checking_close(self):
+        closed_with_running.append(
+            [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        )
+        await close(self)
+
+    monkeypatch.setattr(ProcessingWorkflow, "_process_and_handle_paper", fake_process)
+    monkeypatch.setattr(ProcessingWorkflow, "_close_search_writers", checking_close)
+
+    async def scenario():
+        queue = asyncio.Queue()
+        for aid in ("2301.00001", "2301.00002", "bad"):
+            await queue.put({"arxiv_id": aid})
+        with pytest.raises(ExceptionGroup):
+            await workflow.run_from_queue(queue)
+
+    asyncio.run(scenario())
+
+    assert closed_with_running == [[]]
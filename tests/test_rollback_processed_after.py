@@ -0,0 +1,111 @@
+import json
+import sqlite3
+
+from arxitex.tools.rollback_processed_after import Plan, run
+
+
+def _make_db(path):
+    conn = sqlite3.connect(str(path))
+    conn.executescript("""
+        CREATE TABLE processed_papers (
+            arxiv_id TEXT PRIMARY KEY, status TEXT, processed_timestamp_utc TEXT
+        );
+        CREATE TABLE discovered_papers (
+            arxiv_id TEXT PRIMARY KEY, metadata TEXT NOT NULL
+        );
+        CREATE TABLE papers (paper_id TEXT PRIMARY KEY, title TEXT);
+        """)
+    conn.executemany(
+        "INSERT INTO processed_papers VALUES (?, ?, ?)",
+        [
+            ("old", "success", "2026-01-01T00:00:00+00:00"),
+            ("a", "success", "2026-02-01T00:00:00+00:00"),
+            ("b", "failure", "2026-02-02T00:00:00+00:00"),
+            ("c", "success", "2026-02-03T00:00:00+00:00"),
+        ],
+    )
+    conn.execute("INSERT INTO papers VALUES ('a', 'Paper A')")
+    conn.execute("INSERT INTO discovered_papers VALUES ('c', '{\"keep\": 1}')")
+    conn.commit()
+    conn.close()
+
+
+def test_rollback_requeues_and_deletes_in_bulk(tmp_path):
+    db_path = tmp_path / "t.db"
+    _make_db(db_path)
+
+    plan = Plan(
+        db_path=db_path,
+        cutoff_iso="2026-01-15T00:00:00+00:00",
+        apply=True,
+        requeue=True,
+    )
+    assert run(plan) == 0
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        processed = [
+            r[0] for r in conn.execute("SELECT arxiv_id FROM processed_papers")
+        ]
+        queued = dict(conn.execute("SELECT arxiv_id, metadata FROM discovered_papers"))
+    finally:
+        conn.close()
+
+    assert processed == ["old"]
+    assert set(queued) == {"a", "b", "c"}
+    assert json.loads(queued["a"]) == {
+        "paper_id": "a",
+        "title": "Paper A",
+        "arxiv_id": "a",
+    }
+    assert json.loads(queued["b"]) == {"arxiv_id": "b"}
+    # Already queued rows are left untouched.
+    assert json.loads(queued["c"]) == {"keep": 1}
+
+
+def test_rollback_requeues_stub_metadata_without_papers_table(tmp_path):
+    db_path = tmp_path / "t.db"
+    _make_db(db_path)
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("DROP TABLE papers")
+    conn.commit()
+    conn.close()
+
+    plan = Plan(
+        db_path=db_path,
+        cutoff_iso="2026-02-01T12:00:00+00:00",
+        apply=True,
+        requeue=True,
+    )
+    assert run(plan) == 0
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        queued = dict(conn.execute("SELECT arxiv_id, metadata FROM discovered_papers"))
+    finally:
+        conn.close()
+    assert json.loads(queued["b"]) == {"arxiv_id": "b"}
+    assert json.loads(queued["c"]) == {"keep": 1}
+
+
+def test_rollback_dry_run_reports_without_changes(tmp_path, capsys):
+    db_path = tmp_path / "t.db"
+    _make_db(db_path)
+
+    plan = Plan(
+        db_path=db_path,
+        cutoff_iso="2026-01-15T00:00:00+00:00",
+        apply=False,
+        requeue=True,
+    )
+    assert run(plan) == 0
+
+    out = capsys.readouterr().out
+    assert "Affected processed_papers rows: 3" in out
+    assert "2026-02-01T00:00:00+00:00  a  success" in out
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM processed_papers").fetchone()[0] == 4
+    finally:
+        conn.close()
@@ -0,0 +1,235 @@
+import pytest
+
+from arxitex.workflows import cli
+
+
+def test_requested_command_skips_output_dir_value():
+    assert cli._requested_command(["-o", "process", "single", "2305.15334"]) == (
+        "single"
+    )
+    assert cli._requested_command(["--output-dir=x", "discover", "-q", "a"]) == (
+        "discover"
+    )
+    assert cli._requested_command(["-h", "single"]) is None
+    assert cli._requested_command(["bogus"]) is None
+    assert cli._requested_command([]) is None
+
+
+def test_build_parser_registers_only_requested_subcommand():
+    argv = ["-o", "out", "reprocess-paper", "2305.15334", "--reset-modes", "raw"]
+    args = cli._build_parser(argv).parse_args(argv)
+    assert args.command == "reprocess-paper"
+    assert args.output_dir == "out"
+    assert args.reset_modes == ["raw"]
+    assert args.func is cli._run_reprocess_paper
+    assert args.refetch_metadata is False
+
+    with pytest.raises(SystemExit):
+        cli._build_parser(["reprocess-paper"]).parse_args(["single", "x"])
+
+
+@pytest.mark.parametrize(
+    "extra, save_graph, mode",
+    [
+        ([], True, "raw"),
+        (["--persist-db"], False, "raw"),
+        (["--persist-db", "--save-graph", "--enrich-content"], True, "defs"),
+        (["--infer-dependencies"], True, "full"),
+    ],
+)
+def test_build_processing_workflow(tmp_path, extra, save_graph, mode):
+    from arxitex.workflows.runner import ArxivPipelineComponents
+
+    for argv in (["process", *extra], ["reprocess-paper", "2305.15334", *extra]):
+        args = cli._build_parser(argv).parse_args(argv)
+        components = ArxivPipelineComponents(output_dir=str(tmp_path))
+        workflow = cli._build_processing_workflow(components, args)
+        assert workflow.save_graph is save_graph
+        assert workflow.mode == mode
+
+
+def test_pipeline_processes_papers_as_they_are_discovered(tmp_path, monkeypatch):
+    import asyncio
+
+    from arxitex.workflows.discover import DiscoveryWorkflow
+    from arxitex.workflows.processor import ProcessingWorkflow
+    from arxitex.workflows.runner import ArxivPipelineComponents
+
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    components.processing_index.update_processed_papers_status(
+        "2301.00002", status="success"
+    )
+    processed = []
+
+    async def fake_process(self, item):
+        processed.append(item["arxiv_id"])
+        return {"status": "success", "arxiv_id": item["arxiv_id"]}
+
+    monkeypatch.setattr(ProcessingWorkflow, "_process_single_item", fake_process)
+
+    async def scenario():
+        paper_queue = asyncio.Queue(maxsize=1)
+        discovery = DiscoveryWorkflow(components, paper_queue=paper_queue)
+        workflow = ProcessingWorkflow(
+            components,
+            infer_dependencies=False,
+            enrich_content=False,
+            max_concurrent_tasks=2,
+        )
+
+        async def produce():
+            for aid in ("2301.00001", "2301.00002", "2301.00001", "2301.00003"):
+                await discovery._process_single_item({"arxiv_id": aid})
+            await paper_queue.put(None)
+
+        await asyncio.gather(produce(), workflow.run_from_queue(paper_queue))
+        return workflow
+
+    workflow = asyncio.run(scenario())
+
+    assert sorted(processed) == ["2301.00001", "2301.00003"]
+    assert [r["status"] for r in workflow.results] == ["success", "success"]
+    assert "2301.00002" not in components.discovery_index
+
+
+def test_discovery_queues_a_fetched_batch_at_once(tmp_path):
+    import asyncio
+
+    from arxitex.workflows.discover import DiscoveryWorkflow
+    from arxitex.workflows.runner import ArxivPipelineComponents
+
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    components.discovery_index.add_papers([{"arxiv_id": "2301.00002"}])
+    discovery = DiscoveryWorkflow(components)
+
+    papers = [{"arxiv_id": aid} for aid in ("2301.00001", "2301.00002", "2301.00001")]
+    results = asyncio.run(discovery._process_batch(papers, asyncio.Semaphore(1)))
+
+    assert [r["status"] for r in results] == ["success", "skipped", "skipped"]
+
+
+def test_single_batch_reads_ids_from_stdin(tmp_path, monkeypatch):
+    import asyncio
+    import io
+
+    seen = []
+
+    async def fake_process(arxiv_id, args, components=None):
+        seen.append((arxiv_id, components))
+        return {"status": "failure" if arxiv_id == "bad" else "success"}
+
+    monkeypatch.setattr(cli, "process_single_paper", fake_process)
+    monkeypatch.setattr(
+        "sys.argv", ["arxitex", "-o", str(tmp_path), "single-batch", "-w", "2"]
+    )
+    monkeypatch.setattr("sys.stdin", io.StringIO("2305.15334\n\n2301.00001\n"))
+    assert asyncio.run(cli.main()) == 0
+    assert [aid for aid, _ in seen] == ["2305.15334", "2301.00001"]
+    # One shared set of components for the whole batch.
+    assert seen[0][1] is seen[1][1] is not None
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("2305.15334\nbad\n2305.15334\n"))
+    seen.clear()
+    assert asyncio.run(cli.main()) == 1
+    assert [aid for aid, _ in seen] == ["2305.15334", "bad"]
+
+
+def test_invalid_arxiv_id_is_rejected_before_any_io(monkeypatch):
+    import asyncio
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not build components")
+
+    monkeypatch.setattr(cli, "ArxivPipelineComponents", fail)
+    result = asyncio.run(cli.process_single_paper("not-an-id", object()))
+    assert result["status"] == "failure"
+    assert result["reason"] == "invalid_arxiv_id"
+
+
+@pytest.mark.parametrize("raw, expected", [("12", 12), ("abc", None), ("0", None)])
+def test_default_workers_env_is_parsed_leniently(monkeypatch, raw, expected):
+    monkeypatch.setenv("ARXITEX_MAX_WORKERS", raw)
+    fallback = min(32, (cli.os.cpu_count() or 1) * 5)
+    assert cli._default_workers() == (expected or fallback)
+
+
+def test_default_workers_resolved_when_building_workflow(tmp_path, monkeypatch):
+    from arxitex.workflows.runner import ArxivPipelineComponents
+
+    monkeypatch.setenv("ARXITEX_MAX_WORKERS", "7")
+    args = cli._build_parser(["process"]).parse_args(["process"])
+    assert args.workers is None
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    workflow = cli._build_processing_workflow(components, args)
+    assert workflow.max_concurrent_tasks == 7
+
+    args = cli._build_parser(["process"]).parse_args(["process", "-w", "3"])
+    workflow = cli._build_processing_workflow(components, args)
+    assert workflow.max_concurrent_tasks == 3
+
+
+def test_reset_paper_state_clears_selected_modes(tmp_path):
+    from arxitex.workflows.runner import ArxivPipelineComponents
+
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    components.processing_index.update_processed_papers_status(
+        "2305.15334", status="success"
+    )
+    conn = components.get_connection()
+    conn.execute("INSERT INTO papers (paper_id) VALUES ('2305.15334')")
+    for mode in ("raw", "defs", "full"):
+        conn.execute(
+            "INSERT INTO paper_ingestion_state (paper_id, mode, stage, updated_at_utc) "
+            "VALUES ('2305.15334', ?, 'done', 'now')",
+            (mode,),
+        )
+
+    cli._reset_paper_state(conn, "2305.15334", ["full", "raw", "full"])
+    assert not components.processing_index.is_successfully_processed("2305.15334")
+    modes = [r[0] for r in conn.execute("SELECT mode FROM paper_ingestion_state")]
+    assert modes == ["defs"]
+    assert not conn.in_transaction
+
+    cli._reset_paper_state(conn, "2305.15334", None)
+    assert conn.execute("SELECT COUNT(*) FROM paper_ingestion_state").fetchone()[0] == 0
+
+
+def test_reset_paper_state_queues_paper_in_same_transaction(tmp_path):
+    from arxitex.workflows.runner import ArxivPipelineComponents
+
+    components = ArxivPipelineComponents(output_dir=str(tmp_path))
+    conn = components.get_connection()
+    paper = {"arxiv_id": "2305.15334", "title": "T"}
+
+    added = cli._reset_paper_state(
+        conn,
+        "2305.15334",
+        None,
+        discovery_index=components.discovery_index,
+        paper=paper,
+    )
+    assert added == 1
+    assert not conn.in_transaction
+    assert "2305.15334" in components.discovery_index
+
+    added = cli._reset_paper_state(
+        conn,
+        "2305.15334",
+        None,
+        discovery_index=components.discovery_index,
+        paper=paper,
+    )
+    assert added == 0
+
+    added = cli._reset_paper_state(
+        conn,
+        "2305.15334",
+        None,
+        discovery_index=components.discovery_index,
+        paper={"arxiv_id": "2305.15334", "title": "Fresh"},
+        replace_metadata=True,
+    )
+    assert added == 0
+    assert [p["title"] for p in components.discovery_index.get_pending_papers()] == [
+        "Fresh"
+    ]
@@ -0,0 +1,24 @@
+import json
+import sys
+
+import pytest
+
+from arxitex.workflows import utils
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_graph_data_round_trips(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+    graph_data = {
+        "arxiv_id": "math/0601001",
+        "nodes": [{"id": "thm-1", "content": "Soit $x \\in \\mathbb{R}$ — ok"}],
+        "stats": {"node_count": 1, "big": 2**70},
+    }
+    path = utils.save_graph_data("math/0601001", str(tmp_path), graph_data)
+
+    assert path.name == "math_0601001.json"
+    assert json.loads(path.read_bytes()) == graph_data